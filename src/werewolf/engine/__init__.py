@@ -9,6 +9,7 @@ from .day_scheduler import DayScheduler
 from .werewolf_game import WerewolfGame
 from .validator import (
     GameValidator,
+    AsyncGameValidator,
     NoOpValidator,
     CollectingValidator,
     create_validator,
@@ -24,6 +25,7 @@ __all__ = [
     "DayScheduler",
     "WerewolfGame",
     "GameValidator",
+    "AsyncGameValidator",
     "NoOpValidator",
     "CollectingValidator",
     "create_validator",
@@ -1,6 +1,7 @@
 """DayScheduler - orchestrates the day phase of the Werewolf game."""
 
 import random
+from dataclasses import dataclass
 from typing import Protocol, Sequence, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
@@ -11,8 +12,29 @@ from werewolf.events import (
     Phase,
     DeathCause,
 )
+from werewolf.events.game_events import (
+    DeathEvent,
+    EventKind,
+    GameOver,
+    VictoryCondition,
+)
 from werewolf.models import Player
 from werewolf.engine import GameState, EventCollector
+from werewolf.engine.validator import NoOpValidator, bind_hooks, is_async_validator
+
+# Import handlers
+from werewolf.handlers.base import HandlerResult
+from werewolf.handlers.nomination_handler import NominationHandler
+from werewolf.handlers.campaign_handler import CampaignHandler
+from werewolf.handlers.opt_out_handler import OptOutHandler
+from werewolf.handlers.sheriff_election_handler import SheriffElectionHandler
+from werewolf.handlers.death_resolution_handler import DeathResolutionHandler
+from werewolf.handlers.discussion_handler import DiscussionHandler
+from werewolf.handlers.voting_handler import VotingHandler
+from werewolf.handlers.banishment_resolution_handler import (
+    BanishmentResolutionHandler,
+    BanishmentInput,
+)
 
 # Import validator for type hints (avoid circular import)
 if TYPE_CHECKING:
@@ -44,11 +66,33 @@ class DayScheduler:
 
         Args:
             validator: Optional validator for runtime rule checking.
-                       Pass None or NoOpValidator for production (zero overhead).
+                       Pass None for production (zero overhead). A plain
+                       NoOpValidator is treated the same as None.
             rng: Optional RNG for reproducible games.
         """
-        self._validator = validator
-        self._rng = rng
+        self._nomination_handler = NominationHandler()
+        self._campaign_handler = CampaignHandler()
+        self._opt_out_handler = OptOutHandler()
+        self._sheriff_election_handler = SheriffElectionHandler()
+        self._death_handler = DeathResolutionHandler(rng=rng)
+        self._discussion_handler = DiscussionHandler()
+        self._voting_handler = VotingHandler()
+        self._banishment_handler = BanishmentResolutionHandler(rng=rng)
+        self._validator = None if type(validator) is NoOpValidator else validator
+
+        # Decided once: hook sites await the result only for async validators
+        self._validator_is_async = is_async_validator(self._validator)
+        # Bind the hooks the validator uses; the rest stay None and are skipped
+        hooks = bind_hooks(self._validator)
+        self._on_phase_start = hooks["on_phase_start"]
+        self._on_phase_end = hooks["on_phase_end"]
+        self._on_subphase_start = hooks["on_subphase_start"]
+        self._on_subphase_end = hooks["on_subphase_end"]
+        self._on_death_chain_complete = hooks["on_death_chain_complete"]
+        self._on_victory_check = hooks["on_victory_check"]
+        # Last built DayPhaseContext and the (state, epoch, day, sheriff) it was built from
+        self._ctx: Optional["DayPhaseContext"] = None
+        self._ctx_key: Optional[tuple] = None
 
     async def run_day(
         self,
@@ -78,8 +122,12 @@ class DayScheduler:
         Returns:
             Tuple of (updated state, updated collector)
         """
+        # Bind once: hooks the validator does not use are None and skipped
+        on_subphase_start = self._on_subphase_start
+        on_subphase_end = self._on_subphase_end
+
         # Create a copy to avoid mutating the input state
-        state = state.model_copy(deep=True)
+        state = state.copy_for_day()
 
         # Default to empty dict if no deaths
         if night_deaths is None:
@@ -88,124 +136,31 @@ class DayScheduler:
         collector.day = state.day
 
         # Hook: day start
-        if self._validator:
-            await self._validator.on_phase_start(Phase.DAY, state.day, state)
+        if self._on_phase_start is not None:
+            pending = self._on_phase_start(Phase.DAY, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         collector.create_phase_log(Phase.DAY)
 
-        # Build participants sequence from dict for handlers
-        all_participants = list(participants.items())
+        # Build participants sequence from dict for handlers (read-only,
+        # so an immutable tuple is shared by every handler this day)
+        all_participants = tuple(participants.items())
 
         # Run Day 1 special phases
         if state.day == 1:
-            # Nomination - all players decide if they want to run for Sheriff
-
-            # Hook: subphase start - Nomination
-            if self._validator:
-                await self._validator.on_subphase_start(SubPhase.NOMINATION, state.day, state)
-
-            nomination_result = await self._run_nomination(
-                state=state,
-                participants=all_participants,
-            )
-            collector.add_subphase_log(nomination_result.subphase_log)
-            state.apply_events(nomination_result.subphase_log.events)
-
-            # Hook: subphase end - Nomination
-            if self._validator:
-                await self._validator.on_subphase_end(
-                    SubPhase.NOMINATION, state.day, Phase.DAY, state, collector
-                )
-
-            # Get candidates who nominated to run
-            sheriff_candidates = self._get_nominated_seats(nomination_result.subphase_log.events)
-
-            # If no one nominated, skip remaining sheriff phases
-            if not sheriff_candidates:
-                # No sheriff election occurs
-                pass
-            else:
-                # Campaign - nominated candidates give speeches
-
-                # Hook: subphase start - Campaign
-                if self._validator:
-                    await self._validator.on_subphase_start(SubPhase.CAMPAIGN, state.day, state)
-
-                campaign_result = await self._run_campaign(
-                    state=state,
-                    participants=all_participants,
-                    sheriff_candidates=sheriff_candidates,
-                )
-                collector.add_subphase_log(campaign_result.subphase_log)
-                state.apply_events(campaign_result.subphase_log.events)
-
-                # Hook: subphase end - Campaign
-                if self._validator:
-                    await self._validator.on_subphase_end(
-                        SubPhase.CAMPAIGN, state.day, Phase.DAY, state, collector
-                    )
-
-                # Determine remaining candidates after speeches (those who gave speeches)
-                candidates_after_speech = [
-                    seat for seat in sheriff_candidates
-                    if seat in [e.actor for e in campaign_result.subphase_log.events]
-                ]
-
-                # If no candidates remain after speech phase, skip opt-out and election
-                if not candidates_after_speech:
-                    sheriff_candidates = []
-                else:
-                    # OptOut - candidates decide whether to stay in race
-
-                    # Hook: subphase start - OptOut
-                    if self._validator:
-                        await self._validator.on_subphase_start(SubPhase.OPT_OUT, state.day, state)
-
-                    opt_out_result = await self._run_opt_out(
-                        state=state,
-                        participants=all_participants,
-                        sheriff_candidates=candidates_after_speech,
-                    )
-                    collector.add_subphase_log(opt_out_result.subphase_log)
-                    state.apply_events(opt_out_result.subphase_log.events)
-
-                    # Hook: subphase end - OptOut
-                    if self._validator:
-                        await self._validator.on_subphase_end(
-                            SubPhase.OPT_OUT, state.day, Phase.DAY, state, collector
-                        )
-
-                    # Determine remaining candidates after opt-outs
-                    sheriff_candidates = [
-                        seat for seat in candidates_after_speech
-                        if seat not in self._get_opted_out_seats(opt_out_result.subphase_log.events)
-                    ]
-
-                # SheriffElection - vote for sheriff (only if candidates remain)
-                if sheriff_candidates:
-                    # Hook: subphase start - SheriffElection
-                    if self._validator:
-                        await self._validator.on_subphase_start(SubPhase.SHERIFF_ELECTION, state.day, state)
-
-                    sheriff_result = await self._run_sheriff_election(
-                        state=state,
-                        participants=all_participants,
-                        sheriff_candidates=sheriff_candidates,
-                    )
-                    collector.add_subphase_log(sheriff_result.subphase_log)
-                    state.apply_events(sheriff_result.subphase_log.events)
-
-                    # Hook: subphase end - SheriffElection
-                    if self._validator:
-                        await self._validator.on_subphase_end(
-                            SubPhase.SHERIFF_ELECTION, state.day, Phase.DAY, state, collector
-                        )
+            await self._run_day1_sheriff_phases(state, collector, all_participants)
 
         # DeathResolution - process night deaths (from NightOutcome)
+        # Must not start before the sheriff election finishes: a night victim
+        # may be the newly elected sheriff, so badge transfer prompts and the
+        # handler context must observe the election result.
 
         # Hook: subphase start - DeathResolution
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.DEATH_RESOLUTION, state.day, state)
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.DEATH_RESOLUTION, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         death_result = await self._run_death_resolution(
             state=state,
@@ -213,25 +168,32 @@ class DayScheduler:
             deaths=night_deaths,
         )
         collector.add_subphase_log(death_result.subphase_log)
+        death_events = death_result.subphase_log.events
+        death_seats = [e.actor for e in death_events if isinstance(e, DeathEvent)]
         # Apply death events to state (handles hunter shots and badge transfers)
-        state.apply_events(death_result.subphase_log.events)
+        state.apply_events(death_events)
 
         # Hook: subphase end - DeathResolution
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.DEATH_RESOLUTION, state.day, Phase.DAY, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Hook: death chain complete (for day deaths as well)
-        death_seats = [e.actor for e in death_result.subphase_log.events if hasattr(e, 'actor')]
-        if self._validator and death_seats:
-            await self._validator.on_death_chain_complete(death_seats, state)
+        if death_seats and self._on_death_chain_complete is not None:
+            pending = self._on_death_chain_complete(death_seats, state)
+            if self._validator_is_async:
+                await pending
 
         # Discussion - living players speak
 
         # Hook: subphase start - Discussion
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.DISCUSSION, state.day, state)
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.DISCUSSION, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         discussion_result = await self._run_discussion(
             state=state,
@@ -242,16 +204,20 @@ class DayScheduler:
         state.apply_events(discussion_result.subphase_log.events)
 
         # Hook: subphase end - Discussion
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.DISCUSSION, state.day, Phase.DAY, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Voting - banishment vote
 
         # Hook: subphase start - Voting
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.VOTING, state.day, state)
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.VOTING, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         voting_result = await self._run_voting(
             state=state,
@@ -260,17 +226,21 @@ class DayScheduler:
         collector.add_subphase_log(voting_result.subphase_log)
 
         # Hook: subphase end - Voting
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.VOTING, state.day, Phase.DAY, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Process banishment death if there was a banishment
         banished_seat = self._get_banished_seat(voting_result.subphase_log.events)
         if banished_seat is not None:
             # Hook: subphase start - BanishmentResolution
-            if self._validator:
-                await self._validator.on_subphase_start(SubPhase.BANISHMENT_RESOLUTION, state.day, state)
+            if on_subphase_start is not None:
+                pending = on_subphase_start(SubPhase.BANISHMENT_RESOLUTION, state.day, state)
+                if self._validator_is_async:
+                    await pending
 
             # Run banishment resolution to get death event
             banishment_result = await self._run_banishment_resolution(
@@ -282,10 +252,12 @@ class DayScheduler:
             state.apply_events(banishment_result.subphase_log.events)
 
             # Hook: subphase end - BanishmentResolution
-            if self._validator:
-                await self._validator.on_subphase_end(
+            if on_subphase_end is not None:
+                pending = on_subphase_end(
                     SubPhase.BANISHMENT_RESOLUTION, state.day, Phase.DAY, state, collector
                 )
+                if self._validator_is_async:
+                    await pending
         else:
             # No banishment, apply voting events (for Vote events)
             state.apply_events(voting_result.subphase_log.events)
@@ -294,38 +266,196 @@ class DayScheduler:
         is_over, winner = state.is_game_over()
 
         # Hook: victory check
-        if self._validator:
-            await self._validator.on_victory_check(state, is_over, winner)
+        if self._on_victory_check is not None:
+            pending = self._on_victory_check(state, is_over, winner)
+            if self._validator_is_async:
+                await pending
 
         if is_over:
             self._finalize_game(collector, winner)
 
         # Hook: day end
-        if self._validator:
-            await self._validator.on_phase_end(Phase.DAY, state.day, state, collector)
+        if self._on_phase_end is not None:
+            pending = self._on_phase_end(Phase.DAY, state.day, state, collector)
+            if self._validator_is_async:
+                await pending
 
         return state, collector
 
+    async def _run_day1_sheriff_phases(
+        self,
+        state: GameState,
+        collector: EventCollector,
+        participants: Sequence[tuple[int, Participant]],
+    ) -> None:
+        """Run the Day 1 sheriff subphases: Nomination -> Campaign -> OptOut -> SheriffElection.
+
+        Later subphases are skipped once no candidates remain.
+
+        Args:
+            state: Current game state (mutated in place)
+            collector: Event collector for the game
+            participants: Sequence of (seat, Participant) tuples
+        """
+        on_subphase_start = self._on_subphase_start
+        on_subphase_end = self._on_subphase_end
+
+        # Nomination - all players decide if they want to run for Sheriff
+
+        # Hook: subphase start - Nomination
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.NOMINATION, state.day, state)
+            if self._validator_is_async:
+                await pending
+
+        nomination_result = await self._run_nomination(
+            state=state,
+            participants=participants,
+        )
+        collector.add_subphase_log(nomination_result.subphase_log)
+        state.apply_events(nomination_result.subphase_log.events)
+
+        # Hook: subphase end - Nomination
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
+                SubPhase.NOMINATION, state.day, Phase.DAY, state, collector
+            )
+            if self._validator_is_async:
+                await pending
+
+        # Get candidates who nominated to run
+        sheriff_candidates = self._get_nominated_seats(nomination_result.subphase_log.events)
+
+        # If no one nominated, skip remaining sheriff phases
+        if not sheriff_candidates:
+            return
+
+        # Campaign - nominated candidates give speeches
+
+        # Hook: subphase start - Campaign
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.CAMPAIGN, state.day, state)
+            if self._validator_is_async:
+                await pending
+
+        campaign_result = await self._run_campaign(
+            state=state,
+            participants=participants,
+            sheriff_candidates=sheriff_candidates,
+        )
+        collector.add_subphase_log(campaign_result.subphase_log)
+        state.apply_events(campaign_result.subphase_log.events)
+
+        # Hook: subphase end - Campaign
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
+                SubPhase.CAMPAIGN, state.day, Phase.DAY, state, collector
+            )
+            if self._validator_is_async:
+                await pending
+
+        # Determine remaining candidates after speeches (those who gave speeches)
+        speech_actors = {e.actor for e in campaign_result.subphase_log.events}
+        candidates_after_speech = [
+            seat for seat in sheriff_candidates
+            if seat in speech_actors
+        ]
+
+        # If no candidates remain after speech phase, skip opt-out and election
+        if not candidates_after_speech:
+            sheriff_candidates = []
+        else:
+            # OptOut - candidates decide whether to stay in race
+
+            # Hook: subphase start - OptOut
+            if on_subphase_start is not None:
+                pending = on_subphase_start(SubPhase.OPT_OUT, state.day, state)
+                if self._validator_is_async:
+                    await pending
+
+            opt_out_result = await self._run_opt_out(
+                state=state,
+                participants=participants,
+                sheriff_candidates=candidates_after_speech,
+            )
+            collector.add_subphase_log(opt_out_result.subphase_log)
+            state.apply_events(opt_out_result.subphase_log.events)
+
+            # Hook: subphase end - OptOut
+            if on_subphase_end is not None:
+                pending = on_subphase_end(
+                    SubPhase.OPT_OUT, state.day, Phase.DAY, state, collector
+                )
+                if self._validator_is_async:
+                    await pending
+
+            # Determine remaining candidates after opt-outs
+            opted_out = set(self._get_opted_out_seats(opt_out_result.subphase_log.events))
+            sheriff_candidates = [
+                seat for seat in candidates_after_speech
+                if seat not in opted_out
+            ]
+
+        # SheriffElection - vote for sheriff (only if candidates remain)
+        if sheriff_candidates:
+            # Hook: subphase start - SheriffElection
+            if on_subphase_start is not None:
+                pending = on_subphase_start(SubPhase.SHERIFF_ELECTION, state.day, state)
+                if self._validator_is_async:
+                    await pending
+
+            sheriff_result = await self._run_sheriff_election(
+                state=state,
+                participants=participants,
+                sheriff_candidates=sheriff_candidates,
+            )
+            collector.add_subphase_log(sheriff_result.subphase_log)
+            state.apply_events(sheriff_result.subphase_log.events)
+
+            # Hook: subphase end - SheriffElection
+            if on_subphase_end is not None:
+                pending = on_subphase_end(
+                    SubPhase.SHERIFF_ELECTION, state.day, Phase.DAY, state, collector
+                )
+                if self._validator_is_async:
+                    await pending
+
     async def _run_nomination(
         self,
         state: GameState,
         participants: Sequence[tuple[int, Participant]],
     ) -> "HandlerResult":
         """Run Nomination subphase."""
-        from werewolf.handlers.nomination_handler import NominationHandler, HandlerResult
-        handler = NominationHandler()
+        handler = self._nomination_handler
         context = self._build_context(state)
         return await handler(context, participants)
 
     def _build_context(self, state: GameState) -> "DayPhaseContext":
-        """Build DayPhaseContext from GameState."""
-        return DayPhaseContext(
+        """Build DayPhaseContext from GameState.
+
+        The context references the state's containers, so it is reused until
+        the state is replaced, mutated by apply_events, or its day or sheriff
+        is reassigned.
+        """
+        key = self._ctx_key
+        if (
+            key is not None
+            and key[0] is state
+            and key[1] == state.epoch
+            and key[2] == state.day
+            and key[3] == state.sheriff
+        ):
+            return self._ctx
+        self._ctx = DayPhaseContext(
             players=state.players,
             living_players=state.living_players,
             dead_players=state.dead_players,
             sheriff=state.sheriff,
             day=state.day,
+            werewolf_mask=state.get_role_mask(Role.WEREWOLF),
         )
+        self._ctx_key = (state, state.epoch, state.day, state.sheriff)
+        return self._ctx
 
     async def _run_campaign(
         self,
@@ -334,8 +464,7 @@ class DayScheduler:
         sheriff_candidates: list[int],
     ) -> "HandlerResult":
         """Run Campaign subphase."""
-        from werewolf.handlers.campaign_handler import CampaignHandler, HandlerResult
-        handler = CampaignHandler()
+        handler = self._campaign_handler
         context = self._build_context(state)
         return await handler(context, participants, sheriff_candidates)
 
@@ -346,8 +475,7 @@ class DayScheduler:
         sheriff_candidates: list[int],
     ) -> "HandlerResult":
         """Run OptOut subphase."""
-        from werewolf.handlers.opt_out_handler import OptOutHandler, HandlerResult
-        handler = OptOutHandler()
+        handler = self._opt_out_handler
         context = OptOutPhaseContext(
             sheriff_candidates=sheriff_candidates,
             living_players=state.living_players,
@@ -363,8 +491,7 @@ class DayScheduler:
         sheriff_candidates: list[int],
     ) -> "HandlerResult":
         """Run SheriffElection subphase."""
-        from werewolf.handlers.sheriff_election_handler import SheriffElectionHandler, HandlerResult
-        handler = SheriffElectionHandler()
+        handler = self._sheriff_election_handler
         context = SheriffElectionPhaseContext(
             sheriff_candidates=sheriff_candidates,
             living_players=state.living_players,
@@ -387,9 +514,7 @@ class DayScheduler:
             participants: Dict mapping seat -> Participant
             deaths: Deaths dict from NightOutcome {seat: DeathCause}
         """
-        from werewolf.handlers.death_resolution_handler import DeathResolutionHandler, HandlerResult
-        from werewolf.events import SubPhase
-        handler = DeathResolutionHandler(rng=self._rng)
+        handler = self._death_handler
         context = self._build_context(state)
         # Use deaths from NightOutcome (passed from WerewolfGame)
         night_outcome = DeathResolutionNightOutcome(
@@ -406,8 +531,7 @@ class DayScheduler:
         collector: EventCollector,
     ) -> "HandlerResult":
         """Run Discussion subphase."""
-        from werewolf.handlers.discussion_handler import DiscussionHandler, HandlerResult
-        handler = DiscussionHandler()
+        handler = self._discussion_handler
         context = self._build_context(state)
         # Get all events for private history extraction
         events_so_far = collector.get_events()
@@ -419,20 +543,17 @@ class DayScheduler:
         participants: Sequence[tuple[int, Participant]],
     ) -> "HandlerResult":
         """Run Voting subphase."""
-        from werewolf.handlers.voting_handler import VotingHandler, HandlerResult
-        handler = VotingHandler()
+        handler = self._voting_handler
         context = self._build_context(state)
         return await handler(context, participants)
 
     def _get_opted_out_seats(self, events: list[GameEvent]) -> list[int]:
         """Get seats that opted out from events."""
-        from werewolf.events.game_events import SheriffOptOut
-        return [e.actor for e in events if isinstance(e, SheriffOptOut)]
+        return [e.actor for e in events if e.KIND is EventKind.SHERIFF_OPT_OUT]
 
     def _get_nominated_seats(self, events: list[GameEvent]) -> list[int]:
         """Get seats that nominated to run from nomination events."""
-        from werewolf.events.game_events import SheriffNomination
-        return [e.actor for e in events if isinstance(e, SheriffNomination) and e.running]
+        return [e.actor for e in events if e.KIND is EventKind.SHERIFF_NOMINATION and e.running]
 
     async def _run_banishment_resolution(
         self,
@@ -441,8 +562,7 @@ class DayScheduler:
         banished_seat: int,
     ) -> "HandlerResult":
         """Run BanishmentResolution subphase."""
-        from werewolf.handlers.banishment_resolution_handler import BanishmentResolutionHandler, HandlerResult, BanishmentInput
-        handler = BanishmentResolutionHandler(rng=self._rng)
+        handler = self._banishment_handler
         banishment_input = BanishmentInput(
             day=state.day,
             banished=banished_seat,
@@ -454,17 +574,10 @@ class DayScheduler:
 
     def _get_banished_seat(self, events: list[GameEvent]) -> Optional[int]:
         """Get banished seat from voting events."""
-        from werewolf.events.game_events import Banishment
-        for event in events:
-            if isinstance(event, Banishment):
-                return event.banished
-        return None
+        return next((e.banished for e in events if e.KIND is EventKind.BANISHMENT), None)
 
     def _finalize_game(self, collector: EventCollector, winner: Optional[str]) -> None:
         """Finalize game with winner."""
-        from werewolf.events.game_events import GameOver, VictoryCondition
-        from werewolf.engine import GameState
-
         # Determine victory condition based on winner and game state
         # This is a simplified version - a full implementation would track the condition
         if winner == "WEREWOLF":
@@ -491,81 +604,67 @@ class DayScheduler:
 from werewolf.models.player import Role
 
 
+@dataclass(slots=True, frozen=True)
 class DayPhaseContext:
     """Context for day phase handlers."""
 
-    def __init__(
-        self,
-        players: dict[int, Player],
-        living_players: set[int],
-        dead_players: set[int],
-        sheriff: Optional[int] = None,
-        day: int = 1,
-    ):
-        self.players = players
-        self.living_players = living_players
-        self.dead_players = dead_players
-        self.sheriff = sheriff
-        self.day = day
+    players: dict[int, Player]
+    living_players: set[int]
+    dead_players: set[int]
+    sheriff: Optional[int] = None
+    day: int = 1
+    # Seats holding Role.WEREWOLF; the scheduler passes GameState's mask,
+    # and it is derived from players when omitted
+    werewolf_mask: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.werewolf_mask is None:
+            mask = 0
+            for seat, player in self.players.items():
+                if player.role == Role.WEREWOLF:
+                    mask |= 1 << seat
+            object.__setattr__(self, "werewolf_mask", mask)
 
     def get_player(self, seat: int) -> Optional[Player]:
         return self.players.get(seat)
 
     def is_werewolf(self, seat: int) -> bool:
-        player = self.get_player(seat)
-        return player is not None and player.role == Role.WEREWOLF
+        return seat >= 0 and bool((self.werewolf_mask >> seat) & 1)
 
     def is_alive(self, seat: int) -> bool:
         return seat in self.living_players
 
 
+@dataclass(slots=True, frozen=True)
 class OptOutPhaseContext:
     """Context for OptOut handler."""
 
-    def __init__(
-        self,
-        sheriff_candidates: list[int],
-        living_players: set[int],
-        dead_players: set[int],
-        day: int = 1,
-    ):
-        self.sheriff_candidates = sheriff_candidates
-        self.living_players = living_players
-        self.dead_players = dead_players
-        self.day = day
+    sheriff_candidates: list[int]
+    living_players: set[int]
+    dead_players: set[int]
+    day: int = 1
 
     def is_alive(self, seat: int) -> bool:
         return seat in self.living_players
 
 
+@dataclass(slots=True, frozen=True)
 class SheriffElectionPhaseContext:
     """Context for SheriffElection handler."""
 
-    def __init__(
-        self,
-        sheriff_candidates: list[int],
-        living_players: set[int],
-        dead_players: set[int],
-        sheriff: Optional[int] = None,
-        day: int = 1,
-    ):
-        self.sheriff_candidates = sheriff_candidates
-        self.living_players = living_players
-        self.dead_players = dead_players
-        self.sheriff = sheriff
-        self.day = day
+    sheriff_candidates: list[int]
+    living_players: set[int]
+    dead_players: set[int]
+    sheriff: Optional[int] = None
+    day: int = 1
 
     def is_alive(self, seat: int) -> bool:
         return seat in self.living_players
 
 
+@dataclass(slots=True, frozen=True)
 class DeathResolutionNightOutcome:
     """Night outcome input for death resolution."""
 
-    def __init__(self, day: int, deaths: dict[int, DeathCause]):
-        self.day = day
-        self.deaths = deaths
-
-
-# Type alias for HandlerResult (any handler's result)
-HandlerResult = "DeathResolutionHandlerResult"  # Placeholder, actual type imported in methods
+    day: int
+    deaths: dict[int, DeathCause]
@@ -1,6 +1,7 @@
 """EventCollector - accumulates events from handlers into unified event log."""
 
-from typing import Callable, Optional
+from itertools import chain
+from typing import Callable, Iterator, Optional
 
 from werewolf.events import (
     GameEvent,
@@ -30,12 +31,17 @@ class EventCollector:
 
     The collector supports an optional callback that fires after each event:
         collector = EventCollector(day=1, on_event=my_callback)
+
+    Consumers that prefer batches (e.g. streaming serializers) can pass
+    on_events instead, which fires once per merged SubPhaseLog:
+        collector = EventCollector(day=1, on_events=my_batch_callback)
     """
 
     def __init__(
         self,
         day: int = 0,
         on_event: Optional[Callable[[GameEvent], None]] = None,
+        on_events: Optional[Callable[[list[GameEvent]], None]] = None,
     ):
         """Initialize the EventCollector.
 
@@ -43,6 +49,10 @@ class EventCollector:
             day: Current day number (defaults to 0 before game starts).
             on_event: Optional callback fired after each event is added.
                        Callback receives the GameEvent as argument.
+            on_events: Optional batch callback. Fired once with all events of
+                       each SubPhaseLog passed to add_subphase_log, and with a
+                       one-element list for each add_event call. Independent
+                       of on_event; both fire if both are given.
         """
         self._day = day
         self._event_log = GameEventLog(player_count=0)  # Will be set when game starts
@@ -50,7 +60,12 @@ class EventCollector:
         self._current_phase_log: PhaseLog | None = None
         self._current_subphase: SubPhase | None = None
         self._current_subphase_log: SubPhaseLog | None = None
+        # Subphase for events without micro_phase, set per phase
+        self._default_subphase: SubPhase | None = None
+        # ids of subphase logs already appended to the current phase
+        self._added_subphase_ids: set[int] = set()
         self._on_event = on_event
+        self._on_events = on_events
 
     @property
     def day(self) -> int:
@@ -76,14 +91,15 @@ class EventCollector:
         # Finalize current phase if exists
         self._finalize_phase()
 
-        # Start new phase
+        # Start new phase (numbered from 1 for both NIGHT and DAY)
         self._current_phase = phase
-        if phase == Phase.NIGHT:
-            phase_number = self._day if self._day > 0 else 1
-        else:  # DAY
-            phase_number = self._day if self._day > 0 else 1
-
-        self._current_phase_log = PhaseLog(number=phase_number, kind=phase)
+        self._current_phase_log = PhaseLog(
+            number=max(self._day, 1), kind=phase, subphases=[]
+        )
+        self._default_subphase = (
+            SubPhase.NIGHT_RESOLUTION if phase == Phase.NIGHT else SubPhase.VOTING
+        )
+        self._added_subphase_ids = set()
         self._event_log.phases.append(self._current_phase_log)
 
     def _finalize_subphase(self) -> None:
@@ -93,8 +109,8 @@ class EventCollector:
         """
         if self._current_subphase_log is not None and self._current_phase_log is not None:
             # Check if this subphase log is already in the phase's subphases
-            if self._current_subphase_log not in self._current_phase_log.subphases:
-                self._current_phase_log.subphases.append(self._current_subphase_log)
+            if id(self._current_subphase_log) not in self._added_subphase_ids:
+                self._add_subphase_to_phase(self._current_subphase_log)
             self._current_subphase_log = None
             self._current_subphase = None
 
@@ -106,6 +122,7 @@ class EventCollector:
         """
         if self._current_phase_log is not None:
             self._current_phase_log.subphases.append(subphase_log)
+            self._added_subphase_ids.add(id(subphase_log))
 
     def _finalize_phase(self) -> None:
         """Finalize the current phase to event log."""
@@ -130,16 +147,13 @@ class EventCollector:
         if event.day == 0:
             event.day = self._day
 
-        # Determine subphase from event if not set
-        subphase = event.micro_phase
-        if subphase is None:
-            # Default subphase based on phase type
-            subphase = SubPhase.NIGHT_RESOLUTION if self._current_phase == Phase.NIGHT else SubPhase.VOTING
+        # Determine subphase from event if not set (default depends on phase type)
+        subphase = event.micro_phase or self._default_subphase
 
         # Start new subphase if different from current
-        if self._current_subphase != subphase:
+        if subphase is not self._current_subphase:
             self._current_subphase = subphase
-            self._current_subphase_log = SubPhaseLog(micro_phase=subphase)
+            self._current_subphase_log = SubPhaseLog(micro_phase=subphase, events=[])
             # Immediately add to phase so events are visible
             self._add_subphase_to_phase(self._current_subphase_log)
 
@@ -148,8 +162,12 @@ class EventCollector:
             self._current_subphase_log.events.append(event)
 
         # Fire callback if registered
-        if self._on_event is not None:
-            self._on_event(event)
+        on_event = self._on_event
+        if on_event is not None:
+            on_event(event)
+        on_events = self._on_events
+        if on_events is not None:
+            on_events([event])
 
     def add_subphase_log(self, log: SubPhaseLog) -> None:
         """Merge a complete SubPhaseLog into the current phase.
@@ -163,17 +181,28 @@ class EventCollector:
         if self._current_phase_log is None:
             raise RuntimeError("No phase has been created. Call create_phase_log() first.")
 
-        # Update day for all events in the log
-        for event in log.events:
-            if event.day == 0:
-                event.day = self._day
+        events = log.events
+
+        # Update day for unstamped events (handlers usually set it already)
+        if any(event.day == 0 for event in events):
+            day = self._day
+            for event in events:
+                if event.day == 0:
+                    event.day = day
+
+        # Fire callback for each event in the subphase log
+        on_event = self._on_event
+        if on_event is not None:
+            for event in events:
+                on_event(event)
 
-            # Fire callback for each event in the subphase log
-            if self._on_event is not None:
-                self._on_event(event)
+        # Fire batch callback once for the whole subphase log
+        on_events = self._on_events
+        if on_events is not None and events:
+            on_events(events)
 
         # Add the subphase log to current phase
-        self._current_phase_log.subphases.append(log)
+        self._add_subphase_to_phase(log)
 
     def get_event_log(self) -> GameEventLog:
         """Get the complete GameEventLog with all phases.
@@ -185,17 +214,43 @@ class EventCollector:
         self._finalize_subphase()
         return self._event_log
 
+    @property
+    def last_subphase_log(self) -> SubPhaseLog | None:
+        """Get the most recently added SubPhaseLog of the latest phase.
+
+        Unlike get_event_log(), this leaves the current subphase open.
+
+        Returns:
+            The last SubPhaseLog, or None if the latest phase has none.
+        """
+        phases = self._event_log.phases
+        if not phases:
+            return None
+        subphases = phases[-1].subphases
+        return subphases[-1] if subphases else None
+
+    def iter_events(self) -> Iterator[GameEvent]:
+        """Iterate over all GameEvents in chronological order.
+
+        Unlike get_events(), no list is built. The iterator reads the live
+        log, so consume it before adding more events.
+
+        Returns:
+            Iterator over all GameEvents collected.
+        """
+        return chain.from_iterable(
+            subphase.events
+            for phase in self._event_log.phases
+            for subphase in phase.subphases
+        )
+
     def get_events(self) -> list[GameEvent]:
         """Get a flat list of all GameEvents in chronological order.
 
         Returns:
             List of all GameEvents collected.
         """
-        events: list[GameEvent] = []
-        for phase in self._event_log.phases:
-            for subphase in phase.subphases:
-                events.extend(subphase.events)
-        return events
+        return list(self.iter_events())
 
     def set_player_count(self, count: int) -> None:
         """Set the player count for the event log.
@@ -208,12 +263,17 @@ class EventCollector:
     def set_game_start(self, game_start: "GameStart") -> None:
         """Set the game start event.
 
+        Also records the event's player count and roles on the log, so no
+        separate set_player_count() call is needed.
+
         Args:
             game_start: The GameStart event.
         """
-        self._event_log.game_start = game_start
+        event_log = self._event_log
+        event_log.game_start = game_start
+        event_log.player_count = game_start.player_count
         # Also populate roles_secret on the event log for formatting
-        self._event_log.roles_secret = game_start.roles_secret.copy()
+        event_log.roles_secret = game_start.roles_secret.copy()
 
     def set_game_over(self, game_over: "GameOver") -> None:
         """Set the game over event.
@@ -1,96 +1,58 @@
 """Game state management for the Werewolf game."""
 
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, Callable, Iterable, Optional
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from werewolf.models.player import Player, Role
 from werewolf.events.game_events import GameEvent, DeathEvent, DeathCause
 
 
-class GameState(BaseModel):
-    """Represents the current state of the game.
+def _seats_to_mask(seats: Iterable[int]) -> int:
+    """Pack seat numbers into a bitmask (bit n set for seat n).
 
-    Manages player states, living/dead tracking, and victory conditions.
+    Negative numbers are not seats and are skipped.
     """
+    mask = 0
+    for seat in seats:
+        if seat >= 0:
+            mask |= 1 << seat
+    return mask
 
-    players: dict[int, Player]  # seat -> Player
-    living_players: set[int]  # seats of living players
-    dead_players: set[int]  # seats of dead players
-    sheriff: Optional[int] = None  # seat number of sheriff
-    day: int = 1  # current day number
 
-    def apply_events(self, events: list[GameEvent]) -> None:
-        """Apply a list of game events to update the game state.
+def _mask_to_seats(mask: int) -> set[int]:
+    """Unpack a seat bitmask into a set of seat numbers."""
+    return set(_mask_to_seat_tuple(mask))
 
-        Only processes DeathEvent to update living/dead players.
-        """
-        for event in events:
-            if isinstance(event, DeathEvent):
-                self._apply_death_event(event)
-
-    def _apply_death_event(self, event: DeathEvent) -> None:
-        """Apply a single death event to update player states."""
-        dead_seat = event.actor
-
-        # Mark player as dead in the players dict
-        if dead_seat in self.players:
-            self.players[dead_seat].is_alive = False
-
-        # Update living/dead sets
-        if dead_seat in self.living_players:
-            self.living_players.remove(dead_seat)
-            self.dead_players.add(dead_seat)
-
-        # Handle sheriff badge transfer
-        if event.badge_transfer_to is not None:
-            self.sheriff = event.badge_transfer_to
-            if event.badge_transfer_to in self.players:
-                self.players[event.badge_transfer_to].is_sheriff = True
-
-        # Handle hunter's final shot (death chain)
-        if event.hunter_shoot_target is not None:
-            self._apply_hunter_shot(event.hunter_shoot_target)
-
-    def _apply_hunter_shot(self, target_seat: int) -> None:
-        """Apply hunter's final shot, potentially causing another death."""
-        if target_seat in self.living_players and target_seat in self.players:
-            self.players[target_seat].is_alive = False
-            self.living_players.remove(target_seat)
-            self.dead_players.add(target_seat)
 
-    def apply_events_from_deaths(self, deaths: dict[int, DeathCause]) -> None:
-        """Apply deaths from a deaths dict to update player states.
+def _mask_to_seat_tuple(mask: int) -> tuple[int, ...]:
+    """Unpack a seat bitmask into seat numbers in ascending order."""
+    seats = []
+    while mask:
+        lsb = mask & -mask
+        seats.append(lsb.bit_length() - 1)
+        mask ^= lsb
+    return tuple(seats)
 
-        Args:
-            deaths: Dict mapping seat -> DeathCause
-        """
-        for seat in deaths.keys():
-            if seat in self.players:
-                self.players[seat].is_alive = False
-            if seat in self.living_players:
-                self.living_players.remove(seat)
-                self.dead_players.add(seat)
-
-    def is_game_over(self) -> tuple[bool, Optional[str]]:
-        """Check if the game has ended and return the winner.
 
-        Returns:
-            tuple: (is_game_over, winner) where winner is "VILLAGER", "WEREWOLF", "TIE", or None if game not over
-        """
-        werewolf_count = self.get_role_count(Role.WEREWOLF)
-        god_count = self.get_god_count()
-        villager_count = self.get_ordinary_villager_count()
+GameOverResult = tuple[bool, Optional[str]]
 
-        werewolves_alive = werewolf_count > 0
-        villagers_alive = villager_count > 0
-        gods_alive = god_count > 0
 
+def _make_game_over_check(
+    werewolf_mask: int, god_mask: int, villager_mask: int
+) -> Callable[[int], GameOverResult]:
+    """Build the victory check for a fixed role layout.
+
+    The role masks are captured as free variables, so the returned function
+    only needs the living mask.
+    """
+
+    def check(living_mask: int) -> GameOverResult:
         # Check each victory condition independently
         # - Villager victory condition: ALL_WEREWOLVES_KILLED
         # - Werewolf victory condition: ALL_GODS_KILLED OR ALL_VILLAGERS_KILLED
-        werewolves_eliminated = not werewolves_alive
-        villagers_eliminated = not villagers_alive
-        gods_eliminated = not gods_alive
+        werewolves_eliminated = not living_mask & werewolf_mask
+        villagers_eliminated = not living_mask & villager_mask
+        gods_eliminated = not living_mask & god_mask
 
         # Werewolf wins if all villagers OR all gods are dead
         werewolf_condition_met = villagers_eliminated or gods_eliminated
@@ -110,32 +72,276 @@ class GameState(BaseModel):
 
         return False, None
 
+    return check
+
+
+_GOD_ROLES: frozenset[Role] = frozenset({Role.SEER, Role.WITCH, Role.GUARD, Role.HUNTER})
+
+
+class GameState(BaseModel):
+    """Represents the current state of the game.
+
+    Manages player states, living/dead tracking, and victory conditions.
+    living_mask is the only record of who is alive: living_players and
+    dead_players are read-only views derived from it.
+    Seats are bucketed once per role group (werewolves, gods, ordinary
+    villagers) as masks, so victory checks and counts AND those with
+    living_mask instead of classifying living players by role.
+    """
+
+    # Unknown fields are rejected rather than ignored, so a caller still
+    # passing the removed dead_players field gets an error instead of a
+    # state that silently disagrees with it
+    model_config = ConfigDict(extra="forbid")
+
+    players: dict[int, Player]  # seat -> Player
+    sheriff: Optional[int] = None  # seat number of sheriff
+    day: int = 1  # current day number
+
+    # Bumped whenever applying events mutates players, living players or
+    # sheriff, and whenever players or living_players is reassigned
+    _epoch: int = PrivateAttr(default=0)
+    # Seats of living players (bit n set when seat n is alive)
+    _living_mask: int = PrivateAttr(default=0)
+    # (living_mask, living seats) of the last living_players access
+    _living_players_cache: Optional[tuple[int, frozenset[int]]] = PrivateAttr(default=None)
+    # Players indexed by seat (None for gaps), rebuilt with the role masks
+    _players_by_seat: list[Optional[Player]] = PrivateAttr(default_factory=list)
+    # Seats held by any player, living or dead
+    _seats_mask: int = PrivateAttr(default=0)
+    # Seats per role (roles never change during a game), plus the three
+    # victory groups on their own so their counts are a single popcount
+    _role_masks: dict[Role, int] = PrivateAttr(default_factory=dict)
+    _god_mask: int = PrivateAttr(default=0)
+    _werewolf_mask: int = PrivateAttr(default=0)
+    _villager_mask: int = PrivateAttr(default=0)
+    # Victory check specialized to the role masks, rebuilt with them
+    _game_over_check: Optional[Callable[[int], GameOverResult]] = PrivateAttr(default=None)
+    # (living_mask, result) of the last is_game_over() call
+    _game_over_cache: Optional[tuple[int, GameOverResult]] = PrivateAttr(default=None)
+    # (living_mask, role -> living seats) of the last get_living_role_seats() call
+    _living_by_role_cache: Optional[tuple[int, dict[Role, tuple[int, ...]]]] = PrivateAttr(default=None)
+
+    def __init__(self, /, living_players: Iterable[int], **data: Any) -> None:
+        super().__init__(**data)
+        self._living_mask = _seats_to_mask(living_players)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._index_players()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "living_players":
+            # Not a field: replacing the living seats replaces the mask
+            self._living_mask = _seats_to_mask(value)
+            self._epoch += 1
+            return
+        super().__setattr__(name, value)
+        if name == "players":
+            self._index_players()
+            self._epoch += 1
+
+    def _index_players(self) -> None:
+        """Recompute the seat-indexed player list and per-role seat masks."""
+        size = max(self.players, default=-1) + 1
+        players_by_seat: list[Optional[Player]] = [None] * size
+        role_masks: dict[Role, int] = {}
+        for seat, player in self.players.items():
+            players_by_seat[seat] = player
+            role_masks[player.role] = role_masks.get(player.role, 0) | (1 << seat)
+        self._players_by_seat = players_by_seat
+        self._seats_mask = _seats_to_mask(self.players)
+        self._role_masks = role_masks
+        self._game_over_cache = None
+        self._living_by_role_cache = None
+        self._werewolf_mask = role_masks.get(Role.WEREWOLF, 0)
+        self._villager_mask = role_masks.get(Role.ORDINARY_VILLAGER, 0)
+        self._god_mask = 0
+        for role in _GOD_ROLES:
+            self._god_mask |= role_masks.get(role, 0)
+        self._game_over_check = _make_game_over_check(
+            self._werewolf_mask,
+            self._god_mask,
+            self._villager_mask,
+        )
+
+    @property
+    def epoch(self) -> int:
+        """Mutation counter, for callers caching views derived from this state."""
+        return self._epoch
+
+    @property
+    def living_mask(self) -> int:
+        """Bitmask of living seats (bit n set when seat n is alive)."""
+        return self._living_mask
+
+    @property
+    def living_players(self) -> frozenset[int]:
+        """Seats of living players, derived from living_mask.
+
+        Read-only; assign a new collection of seats to replace them.
+        """
+        living_mask = self._living_mask
+        cache = self._living_players_cache
+        if cache is not None and cache[0] == living_mask:
+            return cache[1]
+        seats = frozenset(_mask_to_seat_tuple(living_mask))
+        self._living_players_cache = (living_mask, seats)
+        return seats
+
+    @property
+    def dead_mask(self) -> int:
+        """Bitmask of dead seats (every player seat not in living_mask)."""
+        return self._seats_mask & ~self._living_mask
+
+    @property
+    def dead_players(self) -> set[int]:
+        """Seats of dead players, materialized from dead_mask on each access."""
+        return _mask_to_seats(self.dead_mask)
+
+    def copy_for_day(self) -> "GameState":
+        """Create an independent copy of the state for a day phase.
+
+        Cheaper than model_copy(deep=True): only the players, which
+        apply_events mutates, are duplicated. Player fields are all scalars,
+        so a shallow per-player copy is sufficient, and the living seats are
+        an int mask copied along with the model.
+
+        Returns:
+            A new GameState that can be mutated without affecting this one.
+        """
+        new = self.model_copy()
+        new.players = {seat: player.model_copy() for seat, player in self.players.items()}
+        return new
+
+    def apply_events(self, events: list[GameEvent]) -> None:
+        """Apply a list of game events to update the game state.
+
+        Only processes DeathEvent to update living players. All deaths
+        in the batch are applied together, then badge transfers and hunter
+        shots in event order.
+        """
+        has_deaths = False
+        deaths_mask = 0
+        badge_targets: list[int] = []
+        hunter_targets: list[int] = []
+        for event in events:
+            if isinstance(event, DeathEvent):
+                has_deaths = True
+                # A negative seat is not a player, so there is no one to kill
+                if event.actor >= 0:
+                    deaths_mask |= 1 << event.actor
+                if event.badge_transfer_to is not None:
+                    badge_targets.append(event.badge_transfer_to)
+                if event.hunter_shoot_target is not None:
+                    hunter_targets.append(event.hunter_shoot_target)
+
+        if not has_deaths:
+            return
+        self._epoch += 1
+        self._apply_deaths_mask(deaths_mask)
+
+        # Handle sheriff badge transfer (the last transfer wins)
+        for target in badge_targets:
+            self.sheriff = target
+            player = self.get_player(target)
+            if player is not None:
+                player.is_sheriff = True
+
+        # Handle hunter's final shot (death chain). A shot that continues the
+        # chain arrives as its own DeathEvent in the batch, so one mask update
+        # covers every target that is still alive.
+        shot_mask = _seats_to_mask(hunter_targets) & self._living_mask & self._seats_mask
+        if shot_mask:
+            self._apply_deaths_mask(shot_mask)
+
+    def _apply_deaths_mask(self, deaths_mask: int) -> None:
+        """Mark every living seat set in deaths_mask as dead.
+
+        Seats that are already dead are skipped, so Player.is_alive is
+        written once per death rather than once per death event.
+        """
+        players_by_seat = self._players_by_seat
+        size = len(players_by_seat)
+        living_mask = self._living_mask
+        remaining = deaths_mask & living_mask
+        while remaining:
+            lsb = remaining & -remaining
+            seat = lsb.bit_length() - 1
+            remaining ^= lsb
+
+            # Mark player as dead
+            if seat < size:
+                player = players_by_seat[seat]
+                if player is not None:
+                    player.is_alive = False
+        self._living_mask = living_mask & ~deaths_mask
+
+    def apply_events_from_deaths(self, deaths: dict[int, DeathCause]) -> None:
+        """Apply deaths from a deaths dict to update player states.
+
+        Seats that are already dead, or not seats at all (negative), are
+        ignored; if none of the seats is alive the state (and its epoch) is
+        left untouched.
+
+        Args:
+            deaths: Dict mapping seat -> DeathCause
+        """
+        deaths_mask = _seats_to_mask(deaths) & self._living_mask
+        if not deaths_mask:
+            return
+        self._epoch += 1
+        self._apply_deaths_mask(deaths_mask)
+
+    def is_game_over(self) -> GameOverResult:
+        """Check if the game has ended and return the winner.
+
+        The result only depends on who is alive, so it is cached until
+        living_mask changes.
+
+        Returns:
+            tuple: (is_game_over, winner) where winner is "VILLAGER", "WEREWOLF", "TIE", or None if game not over
+        """
+        cache = self._game_over_cache
+        if cache is not None and cache[0] == self._living_mask:
+            return cache[1]
+        result = self._game_over_check(self._living_mask)
+        self._game_over_cache = (self._living_mask, result)
+        return result
+
+    def get_role_mask(self, role: Role) -> int:
+        """Get the bitmask of seats (living or dead) holding a role."""
+        return self._role_masks.get(role, 0)
+
+    def get_living_role_seats(self, role: Role) -> tuple[int, ...]:
+        """Get the living seats holding a role, in seat order.
+
+        The role -> seats index is rebuilt lazily once living_mask changes.
+        """
+        living_mask = self._living_mask
+        cache = self._living_by_role_cache
+        if cache is None or cache[0] != living_mask:
+            cache = (living_mask, {
+                r: _mask_to_seat_tuple(living_mask & mask)
+                for r, mask in self._role_masks.items()
+            })
+            self._living_by_role_cache = cache
+        return cache[1].get(role, ())
+
     def get_role_count(self, role: Role) -> int:
         """Get count of living players with a specific role."""
-        count = 0
-        for seat in self.living_players:
-            player = self.players.get(seat)
-            if player and player.role == role:
-                count += 1
-        return count
+        return (self._living_mask & self._role_masks.get(role, 0)).bit_count()
 
     def get_god_count(self) -> int:
         """Get count of living god roles (Seer, Witch, Guard, Hunter)."""
-        god_roles = {Role.SEER, Role.WITCH, Role.GUARD, Role.HUNTER}
-        count = 0
-        for seat in self.living_players:
-            player = self.players.get(seat)
-            if player and player.role in god_roles:
-                count += 1
-        return count
+        return (self._living_mask & self._god_mask).bit_count()
 
     def get_ordinary_villager_count(self) -> int:
         """Get count of living ordinary villagers."""
-        return self.get_role_count(Role.ORDINARY_VILLAGER)
+        return (self._living_mask & self._villager_mask).bit_count()
 
     def get_werewolf_count(self) -> int:
         """Get count of living werewolves."""
-        return self.get_role_count(Role.WEREWOLF)
+        return (self._living_mask & self._werewolf_mask).bit_count()
 
     def get_player(self, seat: int) -> Optional[Player]:
         """Get player by seat number.
@@ -146,7 +352,9 @@ class GameState(BaseModel):
         Returns:
             Player if found, None otherwise
         """
-        return self.players.get(seat)
+        if 0 <= seat < len(self._players_by_seat):
+            return self._players_by_seat[seat]
+        return None
 
     def is_alive(self, seat: int) -> bool:
         """Check if a player is alive.
@@ -157,7 +365,19 @@ class GameState(BaseModel):
         Returns:
             True if player is alive, False otherwise
         """
-        return seat in self.living_players
+        return seat >= 0 and bool((self._living_mask >> seat) & 1)
+
+    def is_dead(self, seat: int) -> bool:
+        """Check if a seat holds a player who is dead.
+
+        Args:
+            seat: The player's seat number
+
+        Returns:
+            True if the seat has a player and that player is dead, False
+            otherwise (including seats without a player)
+        """
+        return seat >= 0 and bool((self.dead_mask >> seat) & 1)
 
     def is_werewolf(self, seat: int) -> bool:
         """Check if a player is a werewolf.
@@ -168,8 +388,7 @@ class GameState(BaseModel):
         Returns:
             True if player is a werewolf, False otherwise
         """
-        player = self.players.get(seat)
-        return player is not None and player.role == Role.WEREWOLF
+        return seat >= 0 and bool((self._werewolf_mask >> seat) & 1)
 
     def get_sheriff(self) -> Optional[int]:
         """Get the current sheriff's seat number.
@@ -34,30 +34,23 @@ class NightActionResolver:
                 - Otherwise -> WEREWOLF_KILL
         """
         deaths: dict[int, DeathCause] = {}
-
-        # Resolution order: Poison first (kills regardless of guard)
-        if actions.poison_target is not None:
-            poison_target = actions.poison_target
-            # Poison only kills if target is alive
-            if state.is_alive(poison_target):
-                deaths[poison_target] = DeathCause.POISON
-
-        # Werewolf kill resolution
-        if actions.kill_target is not None:
-            kill_target = actions.kill_target
-
-            # Werewolf kill is saved if:
-            # 1. Antidoted (antidote_target matches kill_target)
-            # 2. OR Guarded AND guard_target matches kill_target
-            is_antidoted = actions.antidote_target == kill_target
-            is_guarded = (
-                actions.guard_target is not None
-                and actions.guard_target == kill_target
-            )
-
-            if not is_antidoted and not is_guarded:
-                # Kill only happens if target is alive
-                if state.is_alive(kill_target):
-                    deaths[kill_target] = DeathCause.WEREWOLF_KILL
+        living_mask = state.living_mask
+
+        # Poison only kills if target is alive (regardless of guard)
+        poison_mask = actions.poison_mask & living_mask
+        # Werewolf kill is saved if antidoted or guarded, and only kills
+        # a living target. All target masks are one-hot or empty.
+        kill_mask = (
+            actions.kill_mask
+            & ~actions.antidote_mask
+            & ~actions.guard_mask
+            & living_mask
+        )
+
+        # Resolution order: Poison first, so a kill on the same seat wins
+        if poison_mask:
+            deaths[poison_mask.bit_length() - 1] = DeathCause.POISON
+        if kill_mask:
+            deaths[kill_mask.bit_length() - 1] = DeathCause.WEREWOLF_KILL
 
         return deaths
@@ -1,20 +1,34 @@
 """Night action storage for tracking persistent state across nights."""
 
-from typing import Optional, Set
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+def _seat_mask(seat: Optional[int]) -> int:
+    """One-hot seat bitmask for an optional target (0 when unset)."""
+    if seat is None or seat < 0:
+        return 0
+    return 1 << seat
 
 
 class NightActionSnapshot(BaseModel):
     """Persistent state snapshot for night actions.
 
     This captures only the persistent state that needs to be tracked
-    across nights (potions used, previous guard target).
+    across nights (potions used, previous guard target, seer checks).
+    Snapshots are immutable, so the all-default snapshot is shared.
     """
+    model_config = ConfigDict(frozen=True)
+
     antidote_used: bool = False
     poison_used: bool = False
     guard_prev_target: Optional[int] = None
-    # Seer checks are persistent - we track who has been checked
-    seer_checks: set[int] = set()
+    # Seer checks are persistent - seat bitmask of who has been checked
+    seer_checks: int = 0
+
+
+# Shared snapshot for stores with no persistent state yet (early nights)
+_DEFAULT_SNAPSHOT = NightActionSnapshot()
 
 
 class NightActionStore(BaseModel):
@@ -24,7 +38,7 @@ class NightActionStore(BaseModel):
     - antidote_used: Whether witch's antidote has been used
     - poison_used: Whether witch's poison has been used
     - guard_prev_target: The player guarded previous night (for restriction)
-    - seer_checks: Set of seats already checked by the seer
+    - seer_checks: Seat bitmask of players already checked by the seer
 
     Ephemeral state (cleared each night):
     - kill_target: Werewolves' chosen kill target
@@ -36,8 +50,8 @@ class NightActionStore(BaseModel):
     antidote_used: bool = False
     poison_used: bool = False
     guard_prev_target: Optional[int] = None
-    # Seer checks are persistent - track all players the seer has checked
-    seer_checks: set[int] = set()
+    # Seer checks are persistent - seat bitmask of all players the seer has checked
+    seer_checks: int = 0
 
     # Ephemeral (cleared each night)
     kill_target: Optional[int] = None
@@ -45,6 +59,26 @@ class NightActionStore(BaseModel):
     poison_target: Optional[int] = None
     guard_target: Optional[int] = None
 
+    @property
+    def kill_mask(self) -> int:
+        """Seat bitmask of kill_target."""
+        return _seat_mask(self.kill_target)
+
+    @property
+    def antidote_mask(self) -> int:
+        """Seat bitmask of antidote_target."""
+        return _seat_mask(self.antidote_target)
+
+    @property
+    def poison_mask(self) -> int:
+        """Seat bitmask of poison_target."""
+        return _seat_mask(self.poison_target)
+
+    @property
+    def guard_mask(self) -> int:
+        """Seat bitmask of guard_target."""
+        return _seat_mask(self.guard_target)
+
     def snapshot(self) -> NightActionSnapshot:
         """Create a snapshot of persistent state for next night.
 
@@ -52,11 +86,18 @@ class NightActionStore(BaseModel):
             NightActionSnapshot containing antidote_used, poison_used,
             guard_prev_target, and seer_checks.
         """
+        if (
+            not self.antidote_used
+            and not self.poison_used
+            and self.guard_prev_target is None
+            and not self.seer_checks
+        ):
+            return _DEFAULT_SNAPSHOT
         return NightActionSnapshot(
             antidote_used=self.antidote_used,
             poison_used=self.poison_used,
             guard_prev_target=self.guard_prev_target,
-            seer_checks=self.seer_checks.copy(),
+            seer_checks=self.seer_checks,
         )
 
     @classmethod
@@ -74,7 +115,24 @@ class NightActionStore(BaseModel):
             antidote_used=snapshot.antidote_used,
             poison_used=snapshot.poison_used,
             guard_prev_target=snapshot.guard_prev_target,
-            seer_checks=snapshot.seer_checks.copy(),
+            seer_checks=snapshot.seer_checks,
+        )
+
+    def next_night(self) -> "NightActionStore":
+        """Create the store for the next night without an intermediate snapshot.
+
+        Equivalent to from_snapshot(self.snapshot()). Every persistent field
+        is immutable, so the new store can share the values directly.
+
+        Returns:
+            A new NightActionStore with this store's persistent state and
+            all ephemeral targets set to None.
+        """
+        return NightActionStore(
+            antidote_used=self.antidote_used,
+            poison_used=self.poison_used,
+            guard_prev_target=self.guard_prev_target,
+            seer_checks=self.seer_checks,
         )
 
     def reset_for_new_night(self) -> None:
@@ -7,8 +7,9 @@ Night order:
 4. Resolve deaths via NightActionResolver
 """
 
+import asyncio
 import random
-from typing import Protocol, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Protocol, Optional, Sequence, TypeVar, TYPE_CHECKING
 
 from werewolf.engine import (
     GameState,
@@ -17,6 +18,7 @@ from werewolf.engine import (
     NightActionResolver,
 )
 from werewolf.engine.game_state import GameState
+from werewolf.engine.validator import NoOpValidator, bind_hooks, is_async_validator
 from werewolf.events import (
     Phase,
     SubPhase,
@@ -35,14 +37,14 @@ if TYPE_CHECKING:
 from werewolf.handlers.werewolf_handler import (
     WerewolfHandler,
     PhaseContext as WerewolfPhaseContext,
-    HandlerResult as WerewolfHandlerResult,
+    WerewolfHandlerResult,
 )
 from werewolf.handlers.witch_handler import (
     WitchHandler,
     NightActions as WitchNightActions,
-    HandlerResult as WitchHandlerResult,
+    WitchHandlerResult,
 )
-from werewolf.handlers.guard_handler import GuardHandler, HandlerResult as GuardHandlerResult
+from werewolf.handlers.guard_handler import GuardHandler, GuardHandlerResult
 from werewolf.handlers.seer_handler import SeerHandler, HandlerResult as SeerHandlerResult
 from werewolf.handlers.death_resolution_handler import (
     DeathResolutionHandler,
@@ -51,6 +53,8 @@ from werewolf.handlers.death_resolution_handler import (
 )
 from werewolf.handlers.witch_handler import MaxRetriesExceededError
 
+_ResultT = TypeVar("_ResultT")
+
 
 class Participant(Protocol):
     """A player (AI or human) that can make decisions."""
@@ -77,7 +81,8 @@ class NightScheduler:
 
         Args:
             validator: Optional validator for runtime rule checking.
-                       Pass None or NoOpValidator for production (zero overhead).
+                       Pass None for production (zero overhead). A plain
+                       NoOpValidator is treated the same as None.
             rng: Optional RNG for reproducible games.
         """
         self._werewolf_handler = WerewolfHandler()
@@ -86,7 +91,17 @@ class NightScheduler:
         self._seer_handler = SeerHandler()
         self._resolver = NightActionResolver()
         self._death_handler = DeathResolutionHandler(rng=rng)
-        self._validator = validator
+        self._validator = None if type(validator) is NoOpValidator else validator
+
+        # Decided once: hook sites await the result only for async validators
+        self._validator_is_async = is_async_validator(self._validator)
+        # Bind the hooks the validator uses; the rest stay None and are skipped
+        hooks = bind_hooks(self._validator)
+        self._on_phase_start = hooks["on_phase_start"]
+        self._on_phase_end = hooks["on_phase_end"]
+        self._on_subphase_start = hooks["on_subphase_start"]
+        self._on_subphase_end = hooks["on_subphase_end"]
+        self._on_death_chain_complete = hooks["on_death_chain_complete"]
 
     async def run_night(
         self,
@@ -112,124 +127,123 @@ class NightScheduler:
         Returns:
             Tuple of (updated state, updated actions, updated collector).
         """
-        # Create fresh NightActionStore from snapshot (preserves persistent state)
-        night_actions = NightActionStore.from_snapshot(actions.snapshot())
+        # Bind once: hooks the validator does not use are None and skipped
+        on_subphase_start = self._on_subphase_start
+        on_subphase_end = self._on_subphase_end
+
+        # Create fresh NightActionStore (preserves persistent state)
+        night_actions = actions.next_night()
 
         # Set day BEFORE creating phase log (so phase number uses correct day)
         collector.day = state.day
 
         # Hook: night start
-        if self._validator:
-            await self._validator.on_phase_start(Phase.NIGHT, state.day, state)
+        if self._on_phase_start is not None:
+            pending = self._on_phase_start(Phase.NIGHT, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         # Create phase log for NIGHT
         collector.create_phase_log(Phase.NIGHT)
 
-        # Hook: subphase start - WerewolfAction
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.WEREWOLF_ACTION, state.day, state)
-
         # Build PhaseContext for handlers
         context = self._build_phase_context(state)
 
-        # Get events so far for public visibility filtering
-        events_so_far = collector.get_events()
-
         # Step 1: WerewolfAction
         werewolf_participants = self._extract_role_participants(
             participants, state, Role.WEREWOLF
         )
-        ww_result = await self._run_werewolf_action(context, werewolf_participants, events_so_far)
-        collector.add_subphase_log(ww_result.subphase_log)
-
-        # Hook: subphase end - WerewolfAction
-        if self._validator:
-            await self._validator.on_subphase_end(
-                SubPhase.WEREWOLF_ACTION, state.day, Phase.NIGHT, state, collector
-            )
+        # Get events so far for public visibility filtering
+        events_so_far = collector.get_events()
+        ww_result = await self._run_subphase(
+            on_subphase_start, on_subphase_end,
+            SubPhase.WEREWOLF_ACTION, state, collector,
+            self._run_werewolf_action(context, werewolf_participants, events_so_far),
+        )
 
         # Update kill_target from werewolf action
-        self._update_kill_target(ww_result, night_actions)
+        night_actions.kill_target = ww_result.kill_target
 
         # Step 2: WitchAction
         witch_participants = self._extract_role_participants(
             participants, state, Role.WITCH
         )
-
-        # Hook: subphase start - WitchAction
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.WITCH_ACTION, state.day, state)
-
         # Update events_so_far with werewolf action events
         events_so_far = collector.get_events()
-
-        witch_result = await self._run_witch_action(context, witch_participants, night_actions, events_so_far)
-        collector.add_subphase_log(witch_result.subphase_log)
-
-        # Hook: subphase end - WitchAction
-        if self._validator:
-            await self._validator.on_subphase_end(
-                SubPhase.WITCH_ACTION, state.day, Phase.NIGHT, state, collector
-            )
+        witch_result = await self._run_subphase(
+            on_subphase_start, on_subphase_end,
+            SubPhase.WITCH_ACTION, state, collector,
+            self._run_witch_action(context, witch_participants, night_actions, events_so_far),
+        )
 
         # Update antidote/poison targets from witch action
-        self._update_witch_targets(witch_result, night_actions)
-
-        # Step 3: GuardAction + SeerAction (parallel - run sequentially for simplicity)
+        if witch_result.antidote_target is not None:
+            night_actions.antidote_target = witch_result.antidote_target
+            night_actions.antidote_used = True
+        if witch_result.poison_target is not None:
+            night_actions.poison_target = witch_result.poison_target
+            night_actions.poison_used = True
+
+        # Step 3: GuardAction + SeerAction (parallel)
+        # Neither handler depends on the other's result, so both are queried
+        # concurrently. This step bypasses _run_subphase so that logs and end
+        # hooks follow Guard -> Seer order whichever handler finishes first.
         guard_participants = self._extract_role_participants(
             participants, state, Role.GUARD
         )
+        seer_participants = self._extract_role_participants(
+            participants, state, Role.SEER
+        )
 
-        # Hook: subphase start - GuardAction
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.GUARD_ACTION, state.day, state)
+        # Hook: subphase start - GuardAction, SeerAction
+        if on_subphase_start is not None:
+            for subphase in (SubPhase.GUARD_ACTION, SubPhase.SEER_ACTION):
+                pending = on_subphase_start(subphase, state.day, state)
+                if self._validator_is_async:
+                    await pending
 
         # Update events_so_far with witch action events
         events_so_far = collector.get_events()
 
-        guard_result = await self._run_guard_action(
-            context, guard_participants, night_actions, events_so_far
+        # Pass seer_checks from persistent state
+        guard_result, seer_result = await asyncio.gather(
+            self._run_guard_action(context, guard_participants, night_actions, events_so_far),
+            self._run_seer_action(context, seer_participants, night_actions.seer_checks, events_so_far),
         )
+
         collector.add_subphase_log(guard_result.subphase_log)
 
         # Hook: subphase end - GuardAction
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.GUARD_ACTION, state.day, Phase.NIGHT, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Update guard_target from guard action
-        self._update_guard_target(guard_result, night_actions)
-
-        # Update events_so_far with guard action events
-        events_so_far = collector.get_events()
+        night_actions.guard_target = guard_result.guard_target
 
-        seer_participants = self._extract_role_participants(
-            participants, state, Role.SEER
-        )
-
-        # Hook: subphase start - SeerAction
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.SEER_ACTION, state.day, state)
-
-        # Pass seer_checks from persistent state
-        seer_result = await self._run_seer_action(context, seer_participants, night_actions.seer_checks, events_so_far)
         collector.add_subphase_log(seer_result.subphase_log)
 
         # Update seer_checks with the target (track all checked players)
         self._update_seer_check(seer_result, night_actions)
 
         # Hook: subphase end - SeerAction
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.SEER_ACTION, state.day, Phase.NIGHT, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Step 4: Resolve deaths (who died, cause)
 
         # Hook: subphase start - NightResolution
-        if self._validator:
-            await self._validator.on_subphase_start(SubPhase.NIGHT_RESOLUTION, state.day, state)
+        if on_subphase_start is not None:
+            pending = on_subphase_start(SubPhase.NIGHT_RESOLUTION, state.day, state)
+            if self._validator_is_async:
+                await pending
 
         deaths = self._resolver.resolve(state, night_actions)
 
@@ -242,28 +256,60 @@ class NightScheduler:
         collector.add_event(night_outcome_event)
 
         # Hook: subphase end - NightResolution
-        if self._validator:
-            await self._validator.on_subphase_end(
+        if on_subphase_end is not None:
+            pending = on_subphase_end(
                 SubPhase.NIGHT_RESOLUTION, state.day, Phase.NIGHT, state, collector
             )
+            if self._validator_is_async:
+                await pending
 
         # Apply death events to state (remove dead players, handle hunter shots, badge transfer)
         # This is done immediately to update living/dead status for the day
         state.apply_events_from_deaths(deaths)
 
         # Hook: death chain complete
-        if self._validator:
-            await self._validator.on_death_chain_complete(list(deaths.keys()), state)
+        if self._on_death_chain_complete is not None:
+            pending = self._on_death_chain_complete(list(deaths.keys()), state)
+            if self._validator_is_async:
+                await pending
 
         # Update actions with any persisted changes (e.g., antidote_used, poison_used)
-        actions = self._update_actions_persistent_state(actions, night_actions)
+        actions = self._update_actions_persistent_state(night_actions)
 
         # Hook: night end
-        if self._validator:
-            await self._validator.on_phase_end(Phase.NIGHT, state.day, state, collector)
+        if self._on_phase_end is not None:
+            pending = self._on_phase_end(Phase.NIGHT, state.day, state, collector)
+            if self._validator_is_async:
+                await pending
 
         return state, actions, collector, deaths
 
+    async def _run_subphase(
+        self,
+        on_start: Optional[Callable[..., Any]],
+        on_end: Optional[Callable[..., Any]],
+        subphase: SubPhase,
+        state: GameState,
+        collector: EventCollector,
+        handler_coro: Awaitable[_ResultT],
+    ) -> _ResultT:
+        """Run one sequential night subphase.
+
+        Calls the start hook, awaits the handler coroutine, appends its
+        subphase log and calls the end hook. A hook that is None is skipped.
+        """
+        if on_start is not None:
+            pending = on_start(subphase, state.day, state)
+            if self._validator_is_async:
+                await pending
+        result = await handler_coro
+        collector.add_subphase_log(result.subphase_log)
+        if on_end is not None:
+            pending = on_end(subphase, state.day, Phase.NIGHT, state, collector)
+            if self._validator_is_async:
+                await pending
+        return result
+
     def _build_phase_context(self, state: GameState) -> WerewolfPhaseContext:
         """Build PhaseContext from GameState for handlers."""
         return WerewolfPhaseContext(
@@ -279,26 +325,28 @@ class NightScheduler:
         participants: dict[int, Participant],
         state: GameState,
         role: Role,
-    ) -> dict[int, Participant]:
-        """Extract participants for a specific role from the participants dict."""
-        result = {}
-        for seat in state.living_players:
-            player = state.players.get(seat)
-            if player and player.role == role:
-                if seat in participants:
-                    result[seat] = participants[seat]
-        return result
+    ) -> tuple[tuple[int, Participant], ...]:
+        """Extract (seat, Participant) pairs for a living role, in seat order.
+
+        The result is passed to the handlers as-is, so no per-handler list
+        is built from it.
+        """
+        return tuple(
+            (seat, participants[seat])
+            for seat in state.get_living_role_seats(role)
+            if seat in participants
+        )
 
     async def _run_werewolf_action(
         self,
         context: WerewolfPhaseContext,
-        participants: dict[int, Participant],
+        participants: Sequence[tuple[int, Participant]],
         events_so_far: list[GameEvent],
     ) -> WerewolfHandlerResult:
         """Run werewolf action subphase."""
         try:
             return await self._werewolf_handler(
-                context, list(participants.items()), events_so_far
+                context, participants, events_so_far
             )
         except MaxRetriesExceededError:
             # If werewolves fail to decide after retries, return empty result (skip kill)
@@ -315,7 +363,7 @@ class NightScheduler:
     async def _run_witch_action(
         self,
         context: WerewolfPhaseContext,
-        participants: dict[int, Participant],
+        participants: Sequence[tuple[int, Participant]],
         night_actions: NightActionStore,
         events_so_far: list[GameEvent],
     ) -> WitchHandlerResult:
@@ -329,7 +377,7 @@ class NightScheduler:
 
         try:
             return await self._witch_handler(
-                context, list(participants.items()), witch_night_actions, events_so_far
+                context, participants, witch_night_actions, events_so_far
             )
         except MaxRetriesExceededError:
             # If witch fails to decide after retries, return empty result (pass)
@@ -346,7 +394,7 @@ class NightScheduler:
     async def _run_guard_action(
         self,
         context: WerewolfPhaseContext,
-        participants: dict[int, Participant],
+        participants: Sequence[tuple[int, Participant]],
         night_actions: NightActionStore,
         events_so_far: list[GameEvent],
     ) -> GuardHandlerResult:
@@ -354,7 +402,7 @@ class NightScheduler:
         try:
             return await self._guard_handler(
                 context,
-                list(participants.items()),
+                participants,
                 guard_prev_target=night_actions.guard_prev_target,
                 events_so_far=events_so_far,
             )
@@ -373,13 +421,13 @@ class NightScheduler:
     async def _run_seer_action(
         self,
         context: WerewolfPhaseContext,
-        participants: dict[int, Participant],
-        seer_checks: set[int],
+        participants: Sequence[tuple[int, Participant]],
+        seer_checks: int,
         events_so_far: list[GameEvent],
     ) -> SeerHandlerResult:
         """Run seer action subphase."""
         try:
-            return await self._seer_handler(context, list(participants.items()), seer_checks, events_so_far)
+            return await self._seer_handler(context, participants, seer_checks, events_so_far)
         except MaxRetriesExceededError:
             # If seer fails to decide after retries, return empty result (skip)
             from werewolf.events import SubPhase
@@ -406,44 +454,6 @@ class NightScheduler:
             context, night_outcome, list(participants.items())
         )
 
-    def _update_kill_target(
-        self, result: WerewolfHandlerResult, actions: NightActionStore
-    ) -> None:
-        """Extract kill_target from werewolf result and update actions."""
-        from werewolf.events.game_events import WerewolfKill
-
-        for event in result.subphase_log.events:
-            if isinstance(event, WerewolfKill):
-                actions.kill_target = event.target
-                break
-
-    def _update_witch_targets(
-        self, result: WitchHandlerResult, actions: NightActionStore
-    ) -> None:
-        """Extract antidote/poison targets from witch result and update actions."""
-        from werewolf.events.game_events import WitchAction, WitchActionType
-
-        for event in result.subphase_log.events:
-            if isinstance(event, WitchAction):
-                if event.action_type == WitchActionType.ANTIDOTE:
-                    actions.antidote_target = event.target
-                    actions.antidote_used = True
-                elif event.action_type == WitchActionType.POISON:
-                    actions.poison_target = event.target
-                    actions.poison_used = True
-                break
-
-    def _update_guard_target(
-        self, result: GuardHandlerResult, actions: NightActionStore
-    ) -> None:
-        """Extract guard_target from guard result and update actions."""
-        from werewolf.events.game_events import GuardAction
-
-        for event in result.subphase_log.events:
-            if isinstance(event, GuardAction):
-                actions.guard_target = event.target
-                break
-
     def _update_seer_check(
         self, result: SeerHandlerResult, actions: NightActionStore
     ) -> None:
@@ -452,24 +462,20 @@ class NightScheduler:
 
         for event in result.subphase_log.events:
             if isinstance(event, SeerAction):
-                # Add to set of checked players
-                actions.seer_checks.add(event.target)
+                # Add to mask of checked players
+                actions.seer_checks |= 1 << event.target
                 break
 
     def _update_actions_persistent_state(
         self,
-        original: NightActionStore,
-        updated: NightActionStore,
+        night_actions: NightActionStore,
     ) -> NightActionStore:
-        """Update persistent state from nightly actions back to original store."""
-        # Return a new NightActionStore with persistent state preserved
-        return NightActionStore(
-            antidote_used=updated.antidote_used,
-            poison_used=updated.poison_used,
-            guard_prev_target=updated.guard_target,  # Tonight's guard target becomes prev for next night
-            seer_checks=updated.seer_checks.copy(),  # Preserve seer check history
-            kill_target=None,  # Reset ephemeral targets
-            antidote_target=None,
-            poison_target=None,
-            guard_target=None,
-        )
+        """Turn tonight's store into the persistent store for the next night.
+
+        night_actions is private to run_night, so it is updated in place
+        rather than copied into a new store.
+        """
+        # Tonight's guard target becomes prev for next night
+        night_actions.guard_prev_target = night_actions.guard_target
+        night_actions.reset_for_new_night()
+        return night_actions
@@ -14,19 +14,93 @@ Usage:
     game = WerewolfGame(players, participants)  # Fast, no validation
 """
 
-from typing import Protocol, Optional
+import functools
+import inspect
+from typing import Any, Callable, Protocol, Optional, Sequence
 from werewolf.engine import GameState, EventCollector
 from werewolf.events import GameEvent, Phase, SubPhase
+from werewolf.events.game_events import (
+    WerewolfKill,
+    WitchAction,
+    GuardAction,
+    SeerAction,
+    Vote,
+    Banishment,
+    DeathEvent,
+    SheriffOutcome,
+)
+
+
+@functools.cache
+def _validation():
+    """Return the werewolf.validation package, importing it on first use.
+
+    The validation modules import engine modules, so they cannot be
+    imported while werewolf.engine is still initializing.
+    """
+    from werewolf import validation
+    return validation
+
+
+# One bit per subphase, used to record completed subphases as an int
+_SUBPHASE_BITS: dict[SubPhase, int] = {
+    subphase: 1 << i for i, subphase in enumerate(SubPhase)
+}
+
+
+@functools.cache
+def _subphases_from_mask(mask: int) -> frozenset[SubPhase]:
+    """Decode a completed-subphase bitmask into the set validators expect."""
+    return frozenset(
+        subphase for subphase, bit in _SUBPHASE_BITS.items() if mask & bit
+    )
+
+
+# Names of every GameValidator hook
+GAME_VALIDATOR_HOOKS: frozenset[str] = frozenset({
+    "on_game_start",
+    "on_phase_start",
+    "on_phase_end",
+    "on_subphase_start",
+    "on_subphase_end",
+    "on_event_applied",
+    "on_events_applied",
+    "on_death_chain_complete",
+    "on_victory_check",
+    "on_game_over",
+})
+
+
+def bind_hooks(validator: Optional[object]) -> dict[str, Optional[Callable[..., Any]]]:
+    """Map each hook name to validator's bound method, or None if unused.
+
+    Hooks outside the validator's hooks_used (all hooks when it has none)
+    map to None, so schedulers skip them without touching the validator.
+    """
+    hooks_used = (
+        frozenset() if validator is None
+        else getattr(validator, "hooks_used", GAME_VALIDATOR_HOOKS)
+    )
+    return {
+        name: getattr(validator, name) if name in hooks_used else None
+        for name in GAME_VALIDATOR_HOOKS
+    }
 
 
 class GameValidator(Protocol):
     """Hooks for runtime validation at key game points.
 
-    All methods are async and return nothing. Violations are collected
-    internally and can be retrieved via get_violations().
+    All methods are synchronous and return nothing. Violations are
+    collected internally and can be retrieved via get_violations().
+    A validator that needs I/O implements AsyncGameValidator instead.
+
+    hooks_used names the hooks that do any work. Schedulers bind only
+    those and skip calling the rest.
     """
 
-    async def on_game_start(
+    hooks_used: frozenset[str]
+
+    def on_game_start(
         self,
         state: GameState,
         collector: EventCollector,
@@ -34,7 +108,7 @@ class GameValidator(Protocol):
         """Called when game starts. Validates initial state."""
         ...
 
-    async def on_phase_start(
+    def on_phase_start(
         self,
         phase: Phase,
         day: int,
@@ -43,7 +117,7 @@ class GameValidator(Protocol):
         """Called at the start of each phase (night/day)."""
         ...
 
-    async def on_phase_end(
+    def on_phase_end(
         self,
         phase: Phase,
         day: int,
@@ -53,7 +127,7 @@ class GameValidator(Protocol):
         """Called at the end of each phase."""
         ...
 
-    async def on_subphase_start(
+    def on_subphase_start(
         self,
         subphase: SubPhase,
         day: int,
@@ -62,7 +136,7 @@ class GameValidator(Protocol):
         """Called at the start of each subphase."""
         ...
 
-    async def on_subphase_end(
+    def on_subphase_end(
         self,
         subphase: SubPhase,
         day: int,
@@ -73,7 +147,7 @@ class GameValidator(Protocol):
         """Called at the end of each subphase."""
         ...
 
-    async def on_event_applied(
+    def on_event_applied(
         self,
         event: GameEvent,
         state: GameState,
@@ -81,7 +155,15 @@ class GameValidator(Protocol):
         """Called after each event is applied to state."""
         ...
 
-    async def on_death_chain_complete(
+    def on_events_applied(
+        self,
+        events: Sequence[GameEvent],
+        state: GameState,
+    ) -> None:
+        """Called once after a subphase's events are applied to state."""
+        ...
+
+    def on_death_chain_complete(
         self,
         deaths: list[int],
         state: GameState,
@@ -89,7 +171,7 @@ class GameValidator(Protocol):
         """Called when a death chain is fully resolved (includes hunter shots, badge transfer)."""
         ...
 
-    async def on_victory_check(
+    def on_victory_check(
         self,
         state: GameState,
         is_over: bool,
@@ -98,7 +180,7 @@ class GameValidator(Protocol):
         """Called when checking for game over conditions."""
         ...
 
-    async def on_game_over(
+    def on_game_over(
         self,
         winner: str,
         state: GameState,
@@ -108,21 +190,121 @@ class GameValidator(Protocol):
         ...
 
 
+class AsyncGameValidator(Protocol):
+    """GameValidator variant whose hooks are coroutines.
+
+    Only for validators that need I/O. WerewolfGame and the schedulers
+    detect one once and await each hook where it fires, so a hook sees
+    the state as it is at that point and a raised error stops the game
+    there.
+    """
+
+    async def on_game_start(
+        self,
+        state: GameState,
+        collector: EventCollector,
+    ) -> None: ...
+
+    async def on_phase_start(
+        self,
+        phase: Phase,
+        day: int,
+        state: GameState,
+    ) -> None: ...
+
+    async def on_phase_end(
+        self,
+        phase: Phase,
+        day: int,
+        state: GameState,
+        collector: EventCollector,
+    ) -> None: ...
+
+    async def on_subphase_start(
+        self,
+        subphase: SubPhase,
+        day: int,
+        state: GameState,
+    ) -> None: ...
+
+    async def on_subphase_end(
+        self,
+        subphase: SubPhase,
+        day: int,
+        phase: Phase,
+        state: GameState,
+        collector: EventCollector,
+    ) -> None: ...
+
+    async def on_event_applied(
+        self,
+        event: GameEvent,
+        state: GameState,
+    ) -> None: ...
+
+    async def on_events_applied(
+        self,
+        events: Sequence[GameEvent],
+        state: GameState,
+    ) -> None: ...
+
+    async def on_death_chain_complete(
+        self,
+        deaths: list[int],
+        state: GameState,
+    ) -> None: ...
+
+    async def on_victory_check(
+        self,
+        state: GameState,
+        is_over: bool,
+        winner: Optional[str],
+    ) -> None: ...
+
+    async def on_game_over(
+        self,
+        winner: str,
+        state: GameState,
+        collector: EventCollector,
+    ) -> list: ...
+
+
+def is_async_validator(validator: object) -> bool:
+    """Return True if validator's hooks are coroutine functions."""
+    if validator is None:
+        return False
+    hooks_used = getattr(validator, "hooks_used", GAME_VALIDATOR_HOOKS)
+    return any(
+        inspect.iscoroutinefunction(getattr(validator, name, None))
+        for name in hooks_used
+    )
+
+
 class NoOpValidator:
     """No-op validator for production use (zero overhead).
 
-    This validator does nothing - all hooks are no-ops.
-    Use this or pass None to avoid validation overhead.
+    This validator does nothing - all hooks are no-ops. Production code
+    passes None instead; this class remains the base of CollectingValidator.
+
+    Hooks are plain methods, so calling one allocates no coroutine and
+    never yields to the event loop.
+
+    hooks_used lists every hook, so a subclass that overrides any hook is
+    called without further setup.
     """
 
-    async def on_game_start(
+    __slots__ = ()
+
+    hooks_used: frozenset[str] = GAME_VALIDATOR_HOOKS
+
+    def on_game_start(
         self,
         state: GameState,
         collector: EventCollector,
     ) -> None:
         pass
 
-    async def on_phase_start(
+    def on_phase_start(
         self,
         phase: Phase,
         day: int,
@@ -130,7 +312,7 @@ class NoOpValidator:
     ) -> None:
         pass
 
-    async def on_phase_end(
+    def on_phase_end(
         self,
         phase: Phase,
         day: int,
@@ -139,7 +321,7 @@ class NoOpValidator:
     ) -> None:
         pass
 
-    async def on_subphase_start(
+    def on_subphase_start(
         self,
         subphase: SubPhase,
         day: int,
@@ -147,7 +329,7 @@ class NoOpValidator:
     ) -> None:
         pass
 
-    async def on_subphase_end(
+    def on_subphase_end(
         self,
         subphase: SubPhase,
         day: int,
@@ -157,21 +339,29 @@ class NoOpValidator:
     ) -> None:
         pass
 
-    async def on_event_applied(
+    def on_event_applied(
         self,
         event: GameEvent,
         state: GameState,
     ) -> None:
         pass
 
-    async def on_death_chain_complete(
+    def on_events_applied(
+        self,
+        events: Sequence[GameEvent],
+        state: GameState,
+    ) -> None:
+        for event in events:
+            self.on_event_applied(event, state)
+
+    def on_death_chain_complete(
         self,
         deaths: list[int],
         state: GameState,
     ) -> None:
         pass
 
-    async def on_victory_check(
+    def on_victory_check(
         self,
         state: GameState,
         is_over: bool,
@@ -179,7 +369,7 @@ class NoOpValidator:
     ) -> None:
         pass
 
-    async def on_game_over(
+    def on_game_over(
         self,
         winner: str,
         state: GameState,
@@ -194,13 +384,62 @@ class CollectingValidator(NoOpValidator):
     Use this in tests to verify game rules are being followed.
 
     All validation functions from src/werewolf/validation/ are composed here.
-    Lazy imports are used to avoid circular imports.
+    They are reached through _validation(), which imports the package once
+    to avoid circular imports.
     """
 
+    __slots__ = (
+        "_violations",
+        "_phase_history",
+        "_subphase_history",
+        "_event_dispatch",
+    )
+
+    # on_subphase_start and on_victory_check do nothing here
+    hooks_used: frozenset[str] = GAME_VALIDATOR_HOOKS - {
+        "on_subphase_start",
+        "on_victory_check",
+    }
+
     def __init__(self):
         self._violations = []
         self._phase_history = []
-        self._subphase_history = {}
+        # day -> phase -> bitmask of completed subphases
+        self._subphase_history: dict[int, dict[Phase, int]] = {}
+        self._event_dispatch = self._build_event_dispatch()
+
+    @staticmethod
+    def _build_event_dispatch() -> dict[type, tuple[Callable, ...]]:
+        """Map each validated event class to its (event, state) validators.
+
+        Lookups use type(event), so only concrete leaf event classes may
+        appear as keys.
+        """
+        v = _validation()
+        return {
+            WerewolfKill: (v.validate_werewolf_action,),
+            # Would need antidote_used, poison_used from game state
+            WitchAction: (
+                functools.partial(
+                    v.validate_witch_action,
+                    antidote_used=False,
+                    poison_used=False,
+                ),
+            ),
+            # Would need prev_guard_target from game state
+            GuardAction: (
+                functools.partial(v.validate_guard_action, prev_guard_target=None),
+            ),
+            SeerAction: (v.validate_seer_action,),
+            Vote: (v.validate_vote,),
+            Banishment: (v.validate_banishment,),
+            DeathEvent: (
+                v.validate_death_resolution,
+                v.validate_badge_transfer,
+                v.validate_hunter_banishment_shot,
+            ),
+            SheriffOutcome: (v.validate_sheriff_election,),
+        }
 
     def get_violations(self):
         """Get all collected violations."""
@@ -212,30 +451,30 @@ class CollectingValidator(NoOpValidator):
         self._phase_history.clear()
         self._subphase_history.clear()
 
-    async def on_game_start(
+    def on_game_start(
         self,
         state: GameState,
         collector: EventCollector,
     ) -> None:
         """Validate game initialization rules B.1-B.4."""
-        from werewolf.validation import validate_game_start
-        violations = validate_game_start(state)
+        v = _validation()
+        violations = v.validate_game_start(state)
         self._violations.extend(violations)
 
-    async def on_phase_start(
+    def on_phase_start(
         self,
         phase: Phase,
         day: int,
         state: GameState,
     ) -> None:
         """Validate phase ordering C.1-C.15."""
-        from werewolf.validation import validate_phase_order
+        v = _validation()
         previous = self._phase_history[-1] if self._phase_history else None
-        violations = validate_phase_order(phase, previous, state)
+        violations = v.validate_phase_order(phase, previous, state)
         self._violations.extend(violations)
         self._phase_history.append(phase)
 
-    async def on_phase_end(
+    def on_phase_end(
         self,
         phase: Phase,
         day: int,
@@ -243,11 +482,11 @@ class CollectingValidator(NoOpValidator):
         collector: EventCollector,
     ) -> None:
         """Validate event logging N.1-N.6."""
-        from werewolf.validation import validate_event_logging
-        violations = validate_event_logging(collector, phase, day)
+        v = _validation()
+        violations = v.validate_event_logging(collector, phase, day)
         self._violations.extend(violations)
 
-    async def on_subphase_start(
+    def on_subphase_start(
         self,
         subphase: SubPhase,
         day: int,
@@ -257,7 +496,7 @@ class CollectingValidator(NoOpValidator):
         # Note: subphase tracking is done in on_subphase_end with phase info
         # This method just exists for API compatibility
 
-    async def on_subphase_end(
+    def on_subphase_end(
         self,
         subphase: SubPhase,
         day: int,
@@ -266,147 +505,86 @@ class CollectingValidator(NoOpValidator):
         collector: EventCollector,
     ) -> None:
         """Validate and track subphase ordering."""
-        from werewolf.validation import (
-            validate_night_subphase_order,
-            validate_day_subphase_order,
-            validate_werewolf_single_query,
-            validate_seer_result,
-            validate_subphase_phase_match,
-        )
+        v = _validation()
 
         # C.17: Validate subphase matches its phase (catches handler bugs)
-        violations = validate_subphase_phase_match(phase, subphase)
-        self._violations.extend(violations)
+        violations = v.validate_subphase_phase_match(phase, subphase)
 
-        # Use (phase, day) as key to separate night and day subphase history
-        key = (phase, day)
-        completed = self._subphase_history.get(key, set())
+        # Keep night and day subphase history separate within each day
+        day_history = self._subphase_history.setdefault(day, {})
+        completed_mask = day_history.get(phase, 0)
+        completed = _subphases_from_mask(completed_mask)
 
         if phase == Phase.NIGHT:
-            violations = validate_night_subphase_order(completed, subphase)
-            self._violations.extend(violations)
+            violations += v.validate_night_subphase_order(completed, subphase)
         elif phase == Phase.DAY:
-            violations = validate_day_subphase_order(
+            violations += v.validate_day_subphase_order(
                 completed, subphase, day,
                 has_candidates=True,
                 has_opted_out=True,
                 has_sheriff_candidates=True,
             )
-            self._violations.extend(violations)
 
         # C.16: WerewolfAction should make exactly one collective decision
         if subphase == SubPhase.WEREWOLF_ACTION:
-            # Get events from the most recent subphase log
-            event_log = collector.get_event_log()
-            if event_log.phases:
-                last_phase = event_log.phases[-1]
-                if last_phase.subphases:
-                    last_subphase = last_phase.subphases[-1]
-                    if last_subphase.micro_phase == SubPhase.WEREWOLF_ACTION:
-                        violations = validate_werewolf_single_query(last_subphase.events)
-                        self._violations.extend(violations)
+            last_subphase = collector.last_subphase_log
+            if last_subphase is not None and last_subphase.micro_phase == subphase:
+                violations += v.validate_werewolf_single_query(last_subphase.events)
 
         # G.3: Seer result must match target's actual role
-        if subphase == SubPhase.SEER_ACTION:
-            event_log = collector.get_event_log()
-            if event_log.phases:
-                last_phase = event_log.phases[-1]
-                if last_phase.subphases:
-                    last_subphase = last_phase.subphases[-1]
-                    if last_subphase.micro_phase == SubPhase.SEER_ACTION:
-                        violations = validate_seer_result(last_subphase.events, state)
-                        self._violations.extend(violations)
+        elif subphase == SubPhase.SEER_ACTION:
+            last_subphase = collector.last_subphase_log
+            if last_subphase is not None and last_subphase.micro_phase == subphase:
+                violations += v.validate_seer_result(last_subphase.events, state)
+
+        self._violations.extend(violations)
 
         # Track this subphase as completed AFTER validation
-        if key not in self._subphase_history:
-            self._subphase_history[key] = set()
-        self._subphase_history[key].add(subphase)
+        day_history[phase] = completed_mask | _SUBPHASE_BITS[subphase]
 
-    async def on_event_applied(
+    def on_event_applied(
         self,
         event: GameEvent,
         state: GameState,
     ) -> None:
         """Validate event and state consistency."""
-        from werewolf.validation import (
-            validate_state_consistency,
-            validate_werewolf_action,
-            validate_witch_action,
-            validate_guard_action,
-            validate_seer_action,
-            validate_vote,
-            validate_banishment,
-            validate_death_resolution,
-            validate_badge_transfer,
-            validate_sheriff_election,
-            validate_hunter_banishment_shot,
-        )
+        v = _validation()
 
         # State consistency (M.1-M.7)
-        violations = validate_state_consistency(state, event)
-        self._violations.extend(violations)
+        violations = v.validate_state_consistency(state, event)
 
         # Event-type specific validation
-        from werewolf.events.game_events import (
-            WerewolfKill,
-            WitchAction,
-            GuardAction,
-            SeerAction,
-            Vote,
-            Banishment,
-            DeathEvent,
-            SheriffOutcome,
-        )
-
-        if isinstance(event, WerewolfKill):
-            violations = validate_werewolf_action(event, state)
-            self._violations.extend(violations)
-
-        elif isinstance(event, WitchAction):
-            # Would need antidote_used, poison_used from game state
-            violations = validate_witch_action(event, state, False, False)
-            self._violations.extend(violations)
-
-        elif isinstance(event, GuardAction):
-            # Would need prev_guard_target from game state
-            violations = validate_guard_action(event, state, None)
-            self._violations.extend(violations)
-
-        elif isinstance(event, SeerAction):
-            violations = validate_seer_action(event, state)
-            self._violations.extend(violations)
-
-        elif isinstance(event, Vote):
-            violations = validate_vote(event, state)
-            self._violations.extend(violations)
-
-        elif isinstance(event, Banishment):
-            violations = validate_banishment(event, state)
-            self._violations.extend(violations)
+        for validate in self._event_dispatch.get(type(event), ()):
+            violations += validate(event, state)
 
-        elif isinstance(event, DeathEvent):
-            violations = validate_death_resolution(event, state)
-            self._violations.extend(violations)
-            violations = validate_badge_transfer(event, state)
-            self._violations.extend(violations)
-            violations = validate_hunter_banishment_shot(event, state)
-            self._violations.extend(violations)
+        self._violations.extend(violations)
 
-        elif isinstance(event, SheriffOutcome):
-            violations = validate_sheriff_election(event, state)
-            self._violations.extend(violations)
+    def on_events_applied(
+        self,
+        events: Sequence[GameEvent],
+        state: GameState,
+    ) -> None:
+        """Validate a subphase's events and state consistency in one call."""
+        v = _validation()
+        dispatch = self._event_dispatch
+        violations = []
+        for event in events:
+            violations += v.validate_state_consistency(state, event)
+            for validate in dispatch.get(type(event), ()):
+                violations += validate(event, state)
+        self._violations.extend(violations)
 
-    async def on_death_chain_complete(
+    def on_death_chain_complete(
         self,
         deaths: list[int],
         state: GameState,
     ) -> None:
         """Validate death chain completion."""
-        from werewolf.validation import validate_no_duplicate_sheriff
-        violations = validate_no_duplicate_sheriff(state)
+        v = _validation()
+        violations = v.validate_no_duplicate_sheriff(state)
         self._violations.extend(violations)
 
-    async def on_victory_check(
+    def on_victory_check(
         self,
         state: GameState,
         is_over: bool,
@@ -417,45 +595,41 @@ class CollectingValidator(NoOpValidator):
         # Actual validation happens at game over
         pass
 
-    async def on_game_over(
+    def on_game_over(
         self,
         winner: str,
         state: GameState,
         collector: EventCollector,
     ) -> list:
         """Return all collected violations at game end."""
-        from werewolf.validation import (
-            validate_no_duplicate_sheriff,
-            validate_state_consistency,
-            validate_victory,
-        )
+        v = _validation()
 
         # Validate sheriff state is consistent
-        violations = validate_no_duplicate_sheriff(state)
+        violations = v.validate_no_duplicate_sheriff(state)
         self._violations.extend(violations)
 
         # Final state consistency check
-        violations = validate_state_consistency(state, None)
+        violations = v.validate_state_consistency(state, None)
         self._violations.extend(violations)
 
         # Validate victory conditions (A.1-A.5)
         declared_winner = winner if winner else None
-        violations = validate_victory(state, declared_winner, True)
+        violations = v.validate_victory(state, declared_winner, True)
         self._violations.extend(violations)
 
         return self._violations
 
 
-def create_validator(collect: bool = False):
+def create_validator(collect: bool = False) -> Optional[GameValidator]:
     """Factory function to create appropriate validator.
 
     Args:
         collect: If True, returns CollectingValidator for tests.
-                 If False, returns NoOpValidator for production.
+                 If False, returns None for production (hooks are skipped).
 
     Returns:
-        A GameValidator implementation.
+        A GameValidator implementation, or None.
     """
     if collect:
         return CollectingValidator()
-    return NoOpValidator()
+    return None
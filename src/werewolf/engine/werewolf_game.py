@@ -10,6 +10,11 @@ from werewolf.engine import (
     NightScheduler,
     DayScheduler,
 )
+from werewolf.engine.validator import (
+    NoOpValidator,
+    bind_hooks,
+    is_async_validator,
+)
 from werewolf.models import Player
 from werewolf.events import (
     GameEvent,
@@ -24,7 +29,7 @@ from werewolf.handlers import Participant
 
 # Import validator for type hints (avoid circular import)
 if TYPE_CHECKING:
-    from werewolf.engine.validator import GameValidator
+    from werewolf.engine.validator import AsyncGameValidator, GameValidator
 
 # Maximum number of days before game is forced to end (prevent infinite loops)
 MAX_GAME_DAYS = 20
@@ -46,7 +51,7 @@ class WerewolfGame:
         players: dict[int, Player],
         participants: dict[int, Participant],
         seed: Optional[int] = None,
-        validator: Optional["GameValidator"] = None,
+        validator: Optional["GameValidator | AsyncGameValidator"] = None,
         event_callback: Optional[Callable[["GameEvent"], None]] = None,
     ):
         """Initialize the WerewolfGame.
@@ -58,14 +63,27 @@ class WerewolfGame:
             seed: Optional random seed for reproducible games. If None, uses
                   natural randomness. Same seed + same participants = identical game.
             validator: Optional validator for runtime rule checking.
-                       Pass None or NoOpValidator for production (zero overhead).
+                       Pass None for production (zero overhead). A plain
+                       NoOpValidator is treated the same as None. The hooks
+                       of an AsyncGameValidator are awaited where they fire.
             event_callback: Optional callback fired after each event is added.
                            Callback receives the GameEvent as argument.
         """
         self.players = players
         self.participants = participants
+        # Roles are fixed for the whole game, so this is built once
+        self._roles_secret: dict[int, str] = {
+            seat: player.role.value for seat, player in players.items()
+        }
         self._seed = seed
+        if type(validator) is NoOpValidator:
+            validator = None
         self._validator = validator
+        # Decided once: hook sites await the result only for async validators
+        self._validator_is_async = is_async_validator(validator)
+        hooks = bind_hooks(validator)
+        self._on_game_start = hooks["on_game_start"]
+        self._on_game_over = hooks["on_game_over"]
 
         # Initialize RNG for reproducibility (used by handlers)
         self._rng = random.Random(seed) if seed is not None else None
@@ -74,7 +92,6 @@ class WerewolfGame:
         self._state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
             sheriff=None,
             day=1,
         )
@@ -105,16 +122,24 @@ class WerewolfGame:
             Tuple of (event_log, winner) where winner is "WEREWOLF" or "VILLAGER"
             (or None if game ended without a clear winner)
         """
-        # Set up the event log
-        self._collector.set_player_count(len(self.players))
-
-        # Record game start
+        # Bind once: the loop reads these every cycle; the schedulers hand
+        # back state, actions and collector, written back after the loop
+        state = self._state
+        actions = self._night_actions
+        collector = self._collector
+        participants = self.participants
+        run_night = self._night_scheduler.run_night
+        run_day = self._day_scheduler.run_day
+
+        # Record game start (also sets the log's player count and roles)
         game_start = self._create_game_start()
-        self._collector.set_game_start(game_start)
+        collector.set_game_start(game_start)
 
         # Hook: game start
-        if self._validator:
-            await self._validator.on_game_start(self._state, self._collector)
+        if self._on_game_start is not None:
+            pending = self._on_game_start(state, collector)
+            if self._validator_is_async:
+                await pending
 
         winner: Optional[str] = None
         current_day = 1
@@ -123,83 +148,69 @@ class WerewolfGame:
         while current_day <= MAX_GAME_DAYS:
             # Increment day number for this night/day cycle
             # Night N runs when state.day = N, followed by Day N
-            self._state.day = current_day
+            state.day = current_day
 
             # Run night phase and get deaths
-            self._state, self._night_actions, self._collector, night_deaths = await self._night_scheduler.run_night(
-                state=self._state,
-                actions=self._night_actions,
-                collector=self._collector,
-                participants=self.participants,
+            state, actions, collector, night_deaths = await run_night(
+                state=state,
+                actions=actions,
+                collector=collector,
+                participants=participants,
             )
 
             # Check if game ended (werewolves killed during night)
-            is_over, winner = self._state.is_game_over()
+            is_over, winner = state.is_game_over()
             if is_over:
                 break
 
             # Run day phase (pass deaths from previous night for death resolution)
-            self._state, self._collector = await self._day_scheduler.run_day(
-                state=self._state,
-                collector=self._collector,
-                participants=self.participants,
+            state, collector = await run_day(
+                state=state,
+                collector=collector,
+                participants=participants,
                 night_deaths=night_deaths,
             )
             current_day += 1
 
             # Check if game ended (banishment or werewolves killed)
-            is_over, winner = self._state.is_game_over()
+            is_over, winner = state.is_game_over()
             if is_over:
                 # Handle tie case: when both victory conditions are met, is_game_over returns None
                 if winner is None:
                     winner = "TIE"
                 break
 
+        self._state = state
+        self._night_actions = actions
+        self._collector = collector
+
         # If we hit max days, force a winner based on current state
         if winner is None:
-            is_over, winner = self._state.is_game_over()
+            is_over, winner = state.is_game_over()
             if not is_over:
-                # Fallback: determine winner by current counts
-                werewolf_count = self._state.get_werewolf_count()
-                god_count = self._state.get_god_count()
-                villager_count = self._state.get_ordinary_villager_count()
-
-                werewolves_alive = werewolf_count > 0
-                villagers_alive = villager_count > 0
-                gods_alive = god_count > 0
-
-                # Check for tie (both victory conditions met)
-                villagers_win = not werewolves_alive
-                werewolves_win = werewolves_alive and (not gods_alive or not villagers_alive)
-
-                if villagers_win and werewolves_win:
-                    # Tie - both conditions met
-                    winner = "TIE"
-                elif werewolves_alive and (not gods_alive or not villagers_alive):
-                    winner = "WEREWOLF"
-                elif not werewolves_alive:
-                    winner = "VILLAGER"
-                else:
-                    # All three groups (werewolves, gods, villagers) still alive after MAX_GAME_DAYS.
-                    # Declare tie - no team has achieved victory.
-                    winner = "TIE"
+                # is_game_over() already checked every victory condition on
+                # the same role masks, so werewolves, gods and villagers are
+                # all still alive after MAX_GAME_DAYS: no team has won.
+                winner = "TIE"
 
         # Create GameOver event
         game_over = self._create_game_over(winner)
-        self._collector.set_game_over(game_over)
+        collector.set_game_over(game_over)
 
         # Hook: game over
-        if self._validator:
-            await self._validator.on_game_over(winner, self._state, self._collector)
+        if self._on_game_over is not None:
+            pending = self._on_game_over(winner, state, collector)
+            if self._validator_is_async:
+                await pending
 
         # Return event log and winner (canonical singular form)
-        return self._collector.get_event_log(), winner
+        return collector.get_event_log(), winner
 
     def _create_game_start(self) -> GameStart:
         """Create the GameStart event."""
         return GameStart(
             player_count=len(self.players),
-            roles_secret={seat: player.role.value for seat, player in self.players.items()},
+            roles_secret=self._roles_secret,
         )
 
     def _create_game_over(self, winner: Optional[str]) -> GameOver:
@@ -1,42 +1,46 @@
 """Events package."""
 
-from werewolf.events.game_events import (
-    # Base
-    GameEvent,
-    CharacterAction,
-    TargetAction,
-    # Enums
-    Phase,
-    SubPhase,
-    DeathCause,
-    WitchActionType,
-    SeerResult,
-    VictoryCondition,
-    # Non-Character Events
-    GameStart,
-    DeathAnnouncement,
-    SheriffOutcome,
-    Banishment,
-    NightOutcome,
-    VictoryOutcome,
-    GameOver,
-    # Character Actions
-    WitchAction,
-    SeerAction,
-    Speech,
-    SheriffOptOut,
-    SheriffNomination,
-    Vote,
-    DeathEvent,
-    WerewolfKill,
-    GuardAction,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from werewolf.events.event_log import (
-    GameEventLog,
-    PhaseLog,
-    SubPhaseLog,
-)
+if TYPE_CHECKING:
+    from werewolf.events.game_events import (
+        # Base
+        GameEvent,
+        CharacterAction,
+        TargetAction,
+        # Enums
+        EventKind,
+        Phase,
+        SubPhase,
+        DeathCause,
+        WitchActionType,
+        SeerResult,
+        VictoryCondition,
+        # Non-Character Events
+        GameStart,
+        DeathAnnouncement,
+        SheriffOutcome,
+        Banishment,
+        NightOutcome,
+        VictoryOutcome,
+        GameOver,
+        # Character Actions
+        WitchAction,
+        SeerAction,
+        Speech,
+        SheriffOptOut,
+        SheriffNomination,
+        Vote,
+        DeathEvent,
+        WerewolfKill,
+        GuardAction,
+    )
+    from werewolf.events.event_log import (
+        GameEventLog,
+        PhaseLog,
+        SubPhaseLog,
+    )
 
 __all__ = [
     # Base
@@ -44,6 +48,7 @@ __all__ = [
     "CharacterAction",
     "TargetAction",
     # Enums
+    "EventKind",
     "Phase",
     "SubPhase",
     "DeathCause",
@@ -73,3 +78,28 @@ __all__ = [
     "PhaseLog",
     "SubPhaseLog",
 ]
+
+# Every export is imported on first access (PEP 562), so importing the
+# package (or one of its submodules) loads only what is used
+_LOG_EXPORTS = frozenset({"GameEventLog", "PhaseLog", "SubPhaseLog"})
+_LAZY_EXPORTS: dict[str, str] = {
+    name: (
+        "werewolf.events.event_log"
+        if name in _LOG_EXPORTS
+        else "werewolf.events.game_events"
+    )
+    for name in __all__
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -3,7 +3,7 @@
 Formats game events with ROLE(seat) notation and narrative descriptions.
 """
 
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from .game_events import (
     GameEvent,
@@ -23,9 +23,17 @@ from .game_events import (
     GameStart,
     GameOver,
     VictoryOutcome,
+    preview,
 )
 
 
+_DEATH_CAUSE_TEXT: dict[str, str] = {
+    "WEREWOLF_KILL": "killed by werewolves",
+    "POISON": "poisoned by witch",
+    "BANISHMENT": "banished by vote",
+}
+
+
 class EventFormatter:
     """Format game events with ROLE(seat) notation.
 
@@ -41,6 +49,10 @@ class EventFormatter:
             roles_secret: Dict mapping seat number to role name
         """
         self.roles_secret = roles_secret
+        # Roles never change during a game, so each seat's label is built once
+        self._role_seat_cache: dict[int, str] = {
+            seat: f"{role}({seat})" for seat, role in roles_secret.items()
+        }
 
     def format(self, event: GameEvent) -> str:
         """Format a single event with role context.
@@ -55,41 +67,11 @@ class EventFormatter:
 
     def _dispatch(self, event: GameEvent) -> str:
         """Route event to appropriate formatter method."""
-        if isinstance(event, WerewolfKill):
-            return self._format_werewolf_kill(event)
-        elif isinstance(event, WitchAction):
-            return self._format_witch_action(event)
-        elif isinstance(event, SeerAction):
-            return self._format_seer_action(event)
-        elif isinstance(event, GuardAction):
-            return self._format_guard_action(event)
-        elif isinstance(event, Vote):
-            return self._format_vote(event)
-        elif isinstance(event, DeathEvent):
-            return self._format_death_event(event)
-        elif isinstance(event, Speech):
-            return self._format_speech(event)
-        elif isinstance(event, SheriffNomination):
-            return self._format_sheriff_nomination(event)
-        elif isinstance(event, SheriffOptOut):
-            return self._format_sheriff_opt_out(event)
-        elif isinstance(event, SheriffOutcome):
-            return self._format_sheriff_outcome(event)
-        elif isinstance(event, Banishment):
-            return self._format_banishment(event)
-        elif isinstance(event, NightOutcome):
-            return self._format_night_outcome(event)
-        elif isinstance(event, DeathAnnouncement):
-            return self._format_death_announcement(event)
-        elif isinstance(event, GameStart):
-            return self._format_game_start(event)
-        elif isinstance(event, GameOver):
-            return self._format_game_over(event)
-        elif isinstance(event, VictoryOutcome):
-            return self._format_victory_outcome(event)
-        else:
+        handler = _DISPATCH_TABLE.get(type(event))
+        if handler is None:
             # Fallback for unknown events
             return str(event)
+        return handler(self, event)
 
     def _role_seat(self, seat: Optional[int]) -> str:
         """Format seat as ROLE(seat).
@@ -102,8 +84,10 @@ class EventFormatter:
         """
         if seat is None:
             return "(unknown)"
-        role = self.roles_secret.get(seat, "Unknown")
-        return f"{role}({seat})"
+        label = self._role_seat_cache.get(seat)
+        if label is None:
+            return f"Unknown({seat})"
+        return label
 
     def _format_werewolf_kill(self, event: WerewolfKill) -> str:
         actor = self._role_seat(event.actor)
@@ -154,7 +138,7 @@ class EventFormatter:
         parts = [f"{victim} died ({cause})"]
 
         if event.last_words:
-            words = event.last_words[:50] + "..." if len(event.last_words) > 50 else event.last_words
+            words = preview(event.last_words, 50)
             parts.append(f'last words: "{words}"')
 
         if event.hunter_shoot_target is not None:
@@ -172,18 +156,15 @@ class EventFormatter:
 
     def _format_death_cause(self, cause: str) -> str:
         """Format death cause for readability."""
-        cause_map = {
-            "WEREWOLF_KILL": "killed by werewolves",
-            "POISON": "poisoned by witch",
-            "BANISHMENT": "banished by vote",
-        }
-        return cause_map.get(cause, cause.lower().replace("_", " "))
+        text = _DEATH_CAUSE_TEXT.get(cause)
+        if text is None:
+            return cause.lower().replace("_", " ")
+        return text
 
     def _format_speech(self, event: Speech) -> str:
         actor = self._role_seat(event.actor)
         phase_type = event.micro_phase.value.lower()
-        preview = event.content[:40] + "..." if len(event.content) > 40 else event.content
-        return f"{actor} ({phase_type}): \"{preview}\""
+        return f"{actor} ({phase_type}): \"{preview(event.content, 40)}\""
 
     def _format_sheriff_nomination(self, event: SheriffNomination) -> str:
         actor = self._role_seat(event.actor)
@@ -247,4 +228,26 @@ class EventFormatter:
         return "Game ongoing"
 
 
+# Event classes are all leaves, so type(event) finds the handler. Built
+# once at import; handlers take the formatter as their first argument.
+_DISPATCH_TABLE: dict[type[GameEvent], Callable[[EventFormatter, Any], str]] = {
+    WerewolfKill: EventFormatter._format_werewolf_kill,
+    WitchAction: EventFormatter._format_witch_action,
+    SeerAction: EventFormatter._format_seer_action,
+    GuardAction: EventFormatter._format_guard_action,
+    Vote: EventFormatter._format_vote,
+    DeathEvent: EventFormatter._format_death_event,
+    Speech: EventFormatter._format_speech,
+    SheriffNomination: EventFormatter._format_sheriff_nomination,
+    SheriffOptOut: EventFormatter._format_sheriff_opt_out,
+    SheriffOutcome: EventFormatter._format_sheriff_outcome,
+    Banishment: EventFormatter._format_banishment,
+    NightOutcome: EventFormatter._format_night_outcome,
+    DeathAnnouncement: EventFormatter._format_death_announcement,
+    GameStart: EventFormatter._format_game_start,
+    GameOver: EventFormatter._format_game_over,
+    VictoryOutcome: EventFormatter._format_victory_outcome,
+}
+
+
 __all__ = ["EventFormatter"]
@@ -1,8 +1,10 @@
 """Chronological event log organized by game phase sequence."""
 
+import functools
 from datetime import datetime
+from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field
 
 from .game_events import (
     Phase,
@@ -38,20 +40,23 @@ class SubPhaseLog(BaseModel):
             roles_secret: Optional dict mapping seat to role for formatted output.
                          If None, uses default event __str__.
         """
-        if not self.events:
-            return self.micro_phase.name
-
-        if roles_secret:
-            formatter = EventFormatter(roles_secret)
-            lines = [f"{self.micro_phase.name}"]
-            for event in self.events:
-                lines.append(f"    {formatter.format(event)}")
-            return "\n".join(lines)
-        else:
-            lines = [f"{self.micro_phase.name}"]
-            for event in self.events:
-                lines.append(f"    {event}")
-            return "\n".join(lines)
+        formatter = EventFormatter(roles_secret) if roles_secret else None
+        return "\n".join(SubPhaseLog._lines(self, formatter))
+
+    def _lines(self, formatter: Optional[EventFormatter], indent: str = "") -> list[str]:
+        """Header line plus one line per event (events may contain newlines).
+
+        indent prefixes every line, including continuation lines of
+        multi-line events.
+        """
+        fmt = str if formatter is None else formatter.format
+        if not indent:
+            return [self.micro_phase.name, *(f"    {fmt(event)}" for event in self.events)]
+        nl_indent = "\n" + indent
+        return [
+            indent + self.micro_phase.name,
+            *(f"{indent}    {fmt(event)}".replace("\n", nl_indent) for event in self.events),
+        ]
 
     def __str__(self) -> str:
         """Default string representation without role context."""
@@ -74,16 +79,10 @@ class PhaseLog(BaseModel):
     - There is no Night 0 or Day 0
     """
 
-    number: int
+    number: int = Field(ge=1)  # checked in pydantic-core, no Python callback
     kind: Phase  # NIGHT or DAY
     subphases: list[SubPhaseLog] = Field(default_factory=list)
 
-    @model_validator(mode='after')
-    def validate_number(self) -> "PhaseLog":
-        if self.number < 1:
-            raise ValueError(f"number must be >= 1, got {self.number}")
-        return self
-
     def describe(self, roles_secret: Optional[dict[int, str]] = None) -> str:
         """Format phase log as string with optional role context.
 
@@ -91,20 +90,27 @@ class PhaseLog(BaseModel):
             roles_secret: Optional dict mapping seat to role for formatted output.
                          If None, uses default event __str__.
         """
-        header = f"=== {self.kind.name} {self.number} ==="
+        lines: list[str] = []
+        formatter = EventFormatter(roles_secret) if roles_secret else None
+        PhaseLog._write_lines(self, lines, formatter)
+        return "\n".join(lines)
 
+    def _write_lines(self, lines: list[str], formatter: Optional[EventFormatter]) -> None:
+        """Append this phase's lines to lines, sharing one formatter.
+
+        Subphase lines are indented by two spaces, including the
+        continuation lines of multi-line events.
+        """
+        lines.append(f"=== {self.kind.name} {self.number} ===")
         if not self.subphases:
-            return f"{header}\n  (no events)"
+            lines.append("  (no events)")
+            return
 
-        lines = [header]
         for i, sp in enumerate(self.subphases):
             if i > 0:
                 lines.append("")  # Blank line between subphases
-            # Use type().describe() to avoid Pydantic __getattr__ issues
-            sp_lines = SubPhaseLog.describe(sp, roles_secret).split("\n")
-            for line in sp_lines:
-                lines.append(f"  {line}")
-        return "\n".join(lines)
+            # Use type()._lines() to avoid Pydantic __getattr__ issues
+            lines.extend(SubPhaseLog._lines(sp, formatter, "  "))
 
     def __str__(self) -> str:
         """Default string representation without role context."""
@@ -115,11 +121,50 @@ class PhaseLog(BaseModel):
 # Full Game Event Log
 # ============================================================================
 
-try:
-    import yaml
-    _YAML_AVAILABLE = True
-except ImportError:
-    _YAML_AVAILABLE = False
+@functools.cache
+def _yaml():
+    """Return the yaml module, importing PyYAML on first use.
+
+    Only saving and loading logs needs it, so importing this module does
+    not pay for PyYAML.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required") from None
+    return yaml
+
+
+@functools.cache
+def _log_dumper():
+    """Return the YAML dumper class for event logs, built on first use.
+
+    Enums are written as their values while the dump runs, so the dumped
+    dict needs no separate conversion pass. The dumper is a safe one, so
+    everything it writes can be read back by _log_loader(); the libyaml
+    variant writes the same text as the pure-Python one, and is used when
+    available.
+    """
+    yaml = _yaml()
+
+    class LogDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        pass
+
+    LogDumper.add_multi_representer(
+        Enum, lambda dumper, member: dumper.represent_data(member.value)
+    )
+    return LogDumper
+
+
+@functools.cache
+def _log_loader():
+    """Return the safe YAML loader for event logs, resolved on first use.
+
+    Parsing dominates load time, so libyaml's CSafeLoader is used when
+    PyYAML was built with it.
+    """
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class GameEventLog(BaseModel):
@@ -153,12 +198,12 @@ class GameEventLog(BaseModel):
         if self.game_start:
             lines.append(f"  Started: {self.game_start.player_count} players")
 
+        # One formatter for every phase (plain event __str__ without roles)
+        phase_formatter = formatter if self.roles_secret else None
         for i, phase in enumerate(self.phases):
             if i > 0:
                 lines.append("")  # Blank line between phases
-            # Pass roles_secret to phase for formatted output
-            phase_lines = PhaseLog.describe(phase, self.roles_secret).split("\n")
-            lines.extend(phase_lines)
+            PhaseLog._write_lines(phase, lines, phase_formatter)
 
         if self.game_over:
             lines.append("")
@@ -169,25 +214,30 @@ class GameEventLog(BaseModel):
 
     def to_yaml(self, include_roles: bool = False) -> str:
         """Serialize the event log to YAML string."""
-        if not _YAML_AVAILABLE:
-            raise ImportError("PyYAML is required")
+        yaml = _yaml()
 
         data = self.model_dump(mode='python')
 
         if not include_roles:
             data["roles_secret"] = {}
 
-        def convert_enums(obj):
-            if isinstance(obj, dict):
-                return {k: convert_enums(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_enums(item) for item in obj]
-            elif hasattr(obj, 'value'):
-                return obj.value
-            return obj
+        return yaml.dump(
+            data,
+            Dumper=_log_dumper(),
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
 
-        data = convert_enums(data)
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    def to_json(self, include_roles: bool = False) -> str:
+        """Serialize the event log to a JSON string.
+
+        Encoded by pydantic-core in one pass, much faster than to_yaml.
+        The derived summary block of model_dump() is not included;
+        model_validate_json() reads the result back.
+        """
+        log = self if include_roles else self.model_copy(update={"roles_secret": {}})
+        return log.model_dump_json()
 
     def save_to_file(self, filepath: str, include_roles: bool = False) -> None:
         """Serialize the event log to a YAML file."""
@@ -198,22 +248,13 @@ class GameEventLog(BaseModel):
     @classmethod
     def load_from_file(cls, filepath: str) -> "GameEventLog":
         """Load an event log from a YAML file."""
-        if not _YAML_AVAILABLE:
-            raise ImportError("PyYAML is required")
+        yaml = _yaml()
 
         with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        # Handle phase deserialization
-        if "phases" in data and isinstance(data["phases"], list):
-            phases = []
-            for phase_data in data["phases"]:
-                if isinstance(phase_data, dict):
-                    phases.append(PhaseLog.model_validate(phase_data))
-                else:
-                    phases.append(phase_data)
-            data["phases"] = phases
+            data = yaml.load(f, Loader=_log_loader())
 
+        # phases is typed list[PhaseLog], so one model_validate call builds
+        # the whole tree in pydantic-core without a per-phase Python loop
         return cls.model_validate(data)
 
     # =========================================================================
@@ -328,14 +369,22 @@ class GameEventLog(BaseModel):
     def model_dump(self, **kwargs) -> dict:
         """Serialize with summary."""
         data = super().model_dump(**kwargs)
-        nights = sum(1 for p in self.phases if p.kind == Phase.NIGHT)
-        days = sum(1 for p in self.phases if p.kind == Phase.DAY)
+        # One pass over the phases for all four counts
+        nights = days = speeches = deaths = 0
+        for phase in self.phases:
+            if phase.kind == Phase.NIGHT:
+                nights += 1
+                deaths += len(self._get_deaths_from_phase(phase))
+            elif phase.kind == Phase.DAY:
+                days += 1
+                for sp in phase.subphases:
+                    for event in sp.events:
+                        if isinstance(event, Speech):
+                            speeches += 1
         data["summary"] = {
             "total_nights": nights,
             "total_days": days,
-            "total_speeches": sum(
-                len(self._get_speeches_from_phase(p)) for p in self.phases
-            ),
-            "total_deaths": len(self.get_all_deaths()),
+            "total_speeches": speeches,
+            "total_deaths": deaths,
         }
         return data
@@ -20,6 +20,7 @@ from werewolf.events.game_events import (
     SheriffOutcome,
     SheriffNomination,
     SheriffOptOut,
+    preview,
 )
 
 if TYPE_CHECKING:
@@ -241,8 +242,7 @@ def format_public_events(
     if public_events.previous_speeches:
         parts.append("\nPREVIOUS SPEECHES:")
         for speech in public_events.previous_speeches:
-            preview = speech.content[:150] + "..." if len(speech.content) > 150 else speech.content
-            parts.append(f"  Seat {speech.actor}: {preview}")
+            parts.append(f"  Seat {speech.actor}: {preview(speech.content, 150)}")
 
     # Sheriff nominations
     if public_events.sheriff_nominations:
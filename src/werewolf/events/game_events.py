@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import BaseModel, Field
 
 
@@ -70,9 +70,40 @@ class VictoryCondition(str, Enum):
     TIE = "TIE"
 
 
+class EventKind(str, Enum):
+    """Class-level tag identifying the concrete event type."""
+
+    GAME_EVENT = "GAME_EVENT"
+    CHARACTER_ACTION = "CHARACTER_ACTION"
+    TARGET_ACTION = "TARGET_ACTION"
+    WITCH_ACTION = "WITCH_ACTION"
+    SEER_ACTION = "SEER_ACTION"
+    SPEECH = "SPEECH"
+    SHERIFF_OPT_OUT = "SHERIFF_OPT_OUT"
+    SHERIFF_NOMINATION = "SHERIFF_NOMINATION"
+    VOTE = "VOTE"
+    DEATH = "DEATH"
+    WEREWOLF_KILL = "WEREWOLF_KILL"
+    GUARD_ACTION = "GUARD_ACTION"
+    GAME_START = "GAME_START"
+    DEATH_ANNOUNCEMENT = "DEATH_ANNOUNCEMENT"
+    SHERIFF_OUTCOME = "SHERIFF_OUTCOME"
+    BANISHMENT = "BANISHMENT"
+    NIGHT_OUTCOME = "NIGHT_OUTCOME"
+    VICTORY_OUTCOME = "VICTORY_OUTCOME"
+    GAME_OVER = "GAME_OVER"
+
+
+def preview(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with "..."."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
 class GameEvent(BaseModel):
     """Base class for all game events."""
 
+    KIND: ClassVar[EventKind] = EventKind.GAME_EVENT
+
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
     day: int = 0
     phase: Phase
@@ -92,6 +123,8 @@ class GameEvent(BaseModel):
 class CharacterAction(GameEvent):
     """Base class for events with a character actor."""
 
+    KIND: ClassVar[EventKind] = EventKind.CHARACTER_ACTION
+
     actor: int  # seat number of the acting player
 
     def __str__(self) -> str:
@@ -101,6 +134,8 @@ class CharacterAction(GameEvent):
 class TargetAction(CharacterAction):
     """Action that selects a target player."""
 
+    KIND: ClassVar[EventKind] = EventKind.TARGET_ACTION
+
     target: Optional[int] = None  # None = no action/pass
 
     def __str__(self) -> str:
@@ -111,6 +146,8 @@ class TargetAction(CharacterAction):
 class WitchAction(CharacterAction):
     """Witch performs an action."""
 
+    KIND: ClassVar[EventKind] = EventKind.WITCH_ACTION
+
     phase: Phase = Phase.NIGHT
     micro_phase: SubPhase = SubPhase.WITCH_ACTION
     action_type: WitchActionType  # ANTIDOTE, POISON, or PASS
@@ -124,6 +161,8 @@ class WitchAction(CharacterAction):
 class SeerAction(CharacterAction):
     """Seer checks a player's identity."""
 
+    KIND: ClassVar[EventKind] = EventKind.SEER_ACTION
+
     phase: Phase = Phase.NIGHT
     micro_phase: SubPhase = SubPhase.SEER_ACTION
     target: int
@@ -136,18 +175,21 @@ class SeerAction(CharacterAction):
 class Speech(CharacterAction):
     """Player speech."""
 
+    KIND: ClassVar[EventKind] = EventKind.SPEECH
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase  # CAMPAIGN or DISCUSSION
     content: str
 
     def __str__(self) -> str:
-        preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
-        return f"Speech(actor={self.actor}, {self.micro_phase.value}: \"{preview}\")"
+        return f"Speech(actor={self.actor}, {self.micro_phase.value}: \"{preview(self.content, 50)}\")"
 
 
 class SheriffOptOut(CharacterAction):
     """A candidate drops out of the Sheriff race."""
 
+    KIND: ClassVar[EventKind] = EventKind.SHERIFF_OPT_OUT
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.OPT_OUT
 
@@ -158,6 +200,8 @@ class SheriffOptOut(CharacterAction):
 class SheriffNomination(CharacterAction):
     """Player decides to run for Sheriff or not during nomination phase."""
 
+    KIND: ClassVar[EventKind] = EventKind.SHERIFF_NOMINATION
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.NOMINATION
     running: bool  # True = running, False = not running
@@ -170,6 +214,8 @@ class SheriffNomination(CharacterAction):
 class Vote(TargetAction):
     """A player casts their vote."""
 
+    KIND: ClassVar[EventKind] = EventKind.VOTE
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.VOTING
     # target: Optional[int] = None  # Inherited from TargetAction, None = abstain
@@ -190,6 +236,8 @@ class DeathEvent(CharacterAction):
     - Badge transfer (if sheriff dies)
     """
 
+    KIND: ClassVar[EventKind] = EventKind.DEATH
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.DEATH_RESOLUTION
     cause: DeathCause
@@ -207,6 +255,8 @@ class DeathEvent(CharacterAction):
 class WerewolfKill(TargetAction):
     """Werewolves choose a target to kill."""
 
+    KIND: ClassVar[EventKind] = EventKind.WEREWOLF_KILL
+
     phase: Phase = Phase.NIGHT
     micro_phase: SubPhase = SubPhase.WEREWOLF_ACTION
     # actor can be any werewolf seat
@@ -220,6 +270,8 @@ class WerewolfKill(TargetAction):
 class GuardAction(TargetAction):
     """Guard protects a player."""
 
+    KIND: ClassVar[EventKind] = EventKind.GUARD_ACTION
+
     phase: Phase = Phase.NIGHT
     micro_phase: SubPhase = SubPhase.GUARD_ACTION
     # target: Optional[int] = None  # Inherited from TargetAction, may skip
@@ -238,6 +290,8 @@ class GuardAction(TargetAction):
 class GameStart(GameEvent):
     """Game has started with player assignments."""
 
+    KIND: ClassVar[EventKind] = EventKind.GAME_START
+
     day: int = 0
     phase: Phase = Phase.NIGHT
     player_count: int
@@ -250,6 +304,8 @@ class GameStart(GameEvent):
 class DeathAnnouncement(GameEvent):
     """Announcement of who died during the night."""
 
+    KIND: ClassVar[EventKind] = EventKind.DEATH_ANNOUNCEMENT
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.DEATH_ANNOUNCEMENT
     dead_players: list[int] = Field(default_factory=list)  # Ordered by seat
@@ -262,6 +318,8 @@ class DeathAnnouncement(GameEvent):
 class SheriffOutcome(GameEvent):
     """Sheriff election voting results."""
 
+    KIND: ClassVar[EventKind] = EventKind.SHERIFF_OUTCOME
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.SHERIFF_ELECTION
     candidates: list[int] = Field(default_factory=list)  # seats
@@ -275,6 +333,8 @@ class SheriffOutcome(GameEvent):
 class Banishment(GameEvent):
     """Voting has resulted in a banishment."""
 
+    KIND: ClassVar[EventKind] = EventKind.BANISHMENT
+
     phase: Phase = Phase.DAY
     micro_phase: SubPhase = SubPhase.VOTING
     votes: dict[int, float] = Field(default_factory=dict)  # target -> vote count
@@ -288,6 +348,8 @@ class Banishment(GameEvent):
 class NightOutcome(GameEvent):
     """Night phase has resolved with all deaths calculated."""
 
+    KIND: ClassVar[EventKind] = EventKind.NIGHT_OUTCOME
+
     phase: Phase = Phase.NIGHT
     micro_phase: SubPhase = SubPhase.NIGHT_RESOLUTION
     deaths: dict[int, DeathCause] = Field(default_factory=dict)  # seat -> cause
@@ -307,6 +369,8 @@ class NightOutcome(GameEvent):
 class VictoryOutcome(GameEvent):
     """Victory condition check."""
 
+    KIND: ClassVar[EventKind] = EventKind.VICTORY_OUTCOME
+
     is_game_over: bool = False
     winner: Optional[str] = None  # "WEREWOLF", "VILLAGER", or "TIE"
     condition: Optional[VictoryCondition] = None
@@ -320,6 +384,8 @@ class VictoryOutcome(GameEvent):
 class GameOver(GameEvent):
     """Game has ended."""
 
+    KIND: ClassVar[EventKind] = EventKind.GAME_OVER
+
     phase: Phase = Phase.GAME_OVER
     winner: Optional[str] = None  # "WEREWOLF", "VILLAGER", or "TIE"
     condition: VictoryCondition
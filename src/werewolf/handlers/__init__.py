@@ -15,6 +15,7 @@ from .parsing import extract_answer
 from .werewolf_handler import (
     PhaseContext,
     WerewolfHandler,
+    WerewolfHandlerResult,
 )
 from .campaign_handler import (
     CampaignHandler,
@@ -31,9 +32,15 @@ from .discussion_handler import (
     DiscussionHandler,
     PhaseContext as DiscussionPhaseContext,
 )
-from .guard_handler import GuardHandler, PhaseContext as GuardPhaseContext
+from .guard_handler import GuardHandler, GuardHandlerResult, PhaseContext as GuardPhaseContext
 from .seer_handler import SeerHandler, PhaseContext as SeerPhaseContext
-from .witch_handler import WitchHandler, PhaseContext as WitchPhaseContext, NightActions, ValidationResult
+from .witch_handler import (
+    WitchHandler,
+    WitchHandlerResult,
+    PhaseContext as WitchPhaseContext,
+    NightActions,
+    ValidationResult,
+)
 from .voting_handler import VotingHandler
 from .nomination_handler import NominationHandler, PhaseContext as NominationPhaseContext
 from .opt_out_handler import OptOutHandler, PhaseContext as OptOutPhaseContext
@@ -52,6 +59,7 @@ __all__ = [
     # Werewolf handler
     "PhaseContext",
     "WerewolfHandler",
+    "WerewolfHandlerResult",
     # Campaign handler
     "CampaignHandler",
     "CampaignPhaseContext",
@@ -66,12 +74,14 @@ __all__ = [
     "DiscussionPhaseContext",
     # Guard handler
     "GuardHandler",
+    "GuardHandlerResult",
     "GuardPhaseContext",
     # Seer handler
     "SeerHandler",
     "SeerPhaseContext",
     # Witch handler
     "WitchHandler",
+    "WitchHandlerResult",
     "WitchPhaseContext",
     "NightActions",
     "ValidationResult",
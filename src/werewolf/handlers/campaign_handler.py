@@ -12,6 +12,7 @@ from werewolf.events.game_events import (
     Phase,
     SubPhase,
     GameEvent,
+    preview,
 )
 from werewolf.events.event_visibility import get_public_events, format_public_events
 from werewolf.models.player import Player, Role
@@ -463,15 +464,15 @@ CAMPAIGN SPEECH:
                         choices=None,  # Free-form text
                     )
 
-                    if speech.strip():
-                        preview = speech.strip()[:100] + "..." if len(speech.strip()) > 100 else speech.strip()
+                    content = speech.strip()
+                    if content:
                         return Speech(
                             actor=for_seat,
-                            content=speech.strip(),
+                            content=content,
                             phase=Phase.DAY,
                             micro_phase=SubPhase.CAMPAIGN,
                             day=context.day,
-                            debug_info=f"speech_preview={preview}",
+                            debug_info=f"speech_preview={preview(content, 100)}",
                         )
 
                     if speech_attempt == self.max_retries - 1:
@@ -18,6 +18,7 @@ from werewolf.events.game_events import (
     GuardAction,
     WitchAction,
     WitchActionType,
+    preview,
 )
 from werewolf.events.event_visibility import get_public_events, format_public_events
 from werewolf.models.player import Player, Role
@@ -428,14 +429,13 @@ class DiscussionHandler:
 
             if content:
                 # Create speech with preview for debug
-                preview = content[:100] + "..." if len(content) > 100 else content
                 return Speech(
                     actor=for_seat,
                     content=content,
                     phase=Phase.DAY,
                     micro_phase=SubPhase.DISCUSSION,
                     day=context.day,
-                    debug_info=f"speech_preview={preview}",
+                    debug_info=f"speech_preview={preview(content, 100)}",
                 )
 
         # Fallback - should not reach here
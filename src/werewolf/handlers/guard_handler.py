@@ -31,6 +31,17 @@ def _get_choice_spec_helpers():
     return make_seat_choice
 
 
+# ============================================================================
+# Handler Result
+# ============================================================================
+
+
+class GuardHandlerResult(HandlerResult):
+    """HandlerResult that also carries the decoded guard target."""
+
+    guard_target: Optional[int] = None
+
+
 # ============================================================================
 # Guard Handler
 # ============================================================================
@@ -73,7 +84,7 @@ class GuardHandler:
         participants: Sequence[tuple[int, Participant]],
         guard_prev_target: Optional[int] = None,
         events_so_far: Optional[list[GameEvent]] = None,
-    ) -> HandlerResult:
+    ) -> GuardHandlerResult:
         """Execute the GuardAction subphase.
 
         Args:
@@ -84,7 +95,7 @@ class GuardHandler:
             events_so_far: Previous game events for public visibility filtering
 
         Returns:
-            HandlerResult with SubPhaseLog containing GuardAction event
+            GuardHandlerResult with SubPhaseLog containing GuardAction event
         """
         events = []
         events_so_far = events_so_far or []
@@ -99,7 +110,7 @@ class GuardHandler:
 
         # Edge case: no living guard
         if guard_seat is None:
-            return HandlerResult(
+            return GuardHandlerResult(
                 subphase_log=SubPhaseLog(micro_phase=SubPhase.GUARD_ACTION),
                 debug_info="No living guard, skipping GuardAction",
             )
@@ -121,7 +132,7 @@ class GuardHandler:
                 day=context.day,
                 debug_info="No participant, defaulting to skip",
             ))
-            return HandlerResult(
+            return GuardHandlerResult(
                 subphase_log=SubPhaseLog(
                     micro_phase=SubPhase.GUARD_ACTION,
                     events=events,
@@ -139,11 +150,12 @@ class GuardHandler:
 
         events.append(action)
 
-        return HandlerResult(
+        return GuardHandlerResult(
             subphase_log=SubPhaseLog(
                 micro_phase=SubPhase.GUARD_ACTION,
                 events=events,
             ),
+            guard_target=action.target,
         )
 
     def _build_prompts(
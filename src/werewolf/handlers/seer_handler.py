@@ -5,7 +5,7 @@ check a player's identity to see if they are a werewolf.
 """
 
 import re
-from typing import Sequence, Optional, Any, Set
+from typing import Iterable, Sequence, Optional, Any
 from pydantic import BaseModel, Field
 
 from werewolf.events.game_events import (
@@ -22,6 +22,7 @@ from werewolf.prompt_levels import (
     make_seer_context,
     build_seer_decision,
 )
+from werewolf.prompt_levels.level2_state import seer_checks_mask
 from werewolf.handlers.base import SubPhaseLog, HandlerResult, Participant, MaxRetriesExceededError
 from werewolf.handlers.parsing import extract_answer
 
@@ -75,7 +76,7 @@ class SeerHandler:
         self,
         context: "PhaseContext",
         participants: Sequence[tuple[int, Participant]],
-        seer_checks: Optional[Set[int]] = None,
+        seer_checks: int | Iterable[int] | None = 0,
         events_so_far: Optional[list[GameEvent]] = None,
     ) -> HandlerResult:
         """Execute the SeerAction subphase.
@@ -84,12 +85,14 @@ class SeerHandler:
             context: Game state with players, living/dead, sheriff
             participants: Sequence of (seat, Participant) tuples
                          Should contain at most one entry (the seer)
-            seer_checks: Set of seats already checked by the seer (to exclude)
+            seer_checks: Seat bitmask of players already checked by the seer
+                         (to exclude); a set of seats is also accepted
             events_so_far: Previous game events for public visibility filtering
 
         Returns:
             HandlerResult with SubPhaseLog containing SeerAction event
         """
+        seer_checks = seer_checks_mask(seer_checks)
         events = []
         events_so_far = events_so_far or []
 
@@ -180,7 +183,7 @@ class SeerHandler:
         self,
         context: "PhaseContext",
         for_seat: int,
-        seer_checks: Optional[Set[int]] = None,
+        seer_checks: int = 0,
         events_so_far: Optional[list[GameEvent]] = None,
     ) -> tuple[str, str, str]:
         """Build filtered prompts for the seer.
@@ -188,7 +191,7 @@ class SeerHandler:
         Args:
             context: Game state
             for_seat: The seer seat to build prompts for
-            seer_checks: Set of seats already checked by the seer
+            seer_checks: Seat bitmask of players already checked by the seer
             events_so_far: Previous game events for public visibility filtering
 
         Returns:
@@ -228,19 +231,21 @@ class SeerHandler:
         self,
         context: "PhaseContext",
         seer_seat: int,
-        seer_checks: Optional[Set[int]] = None,
+        seer_checks: int | Iterable[int] | None = 0,
     ) -> Optional[Any]:
         """Build ChoiceSpec for interactive TUI.
 
         Returns ChoiceSpec with valid targets (excluding self and already checked).
+        seer_checks is a seat bitmask; a set of seats is also accepted.
         """
         make_seat_choice = _get_choice_spec_helpers()
+        seer_checks = seer_checks_mask(seer_checks)
 
         # Build list of valid targets (all living except self)
         valid_targets = [p for p in sorted(context.living_players) if p != seer_seat]
         # Filter out already checked players - no point rechecking them
         if seer_checks:
-            valid_targets = [p for p in valid_targets if p not in seer_checks]
+            valid_targets = [p for p in valid_targets if not (seer_checks >> p) & 1]
 
         return make_seat_choice(
             prompt="Choose a player to check:",
@@ -253,7 +258,7 @@ class SeerHandler:
         context: "PhaseContext",
         participant: Participant,
         seer_seat: int,
-        seer_checks: Optional[Set[int]] = None,
+        seer_checks: int = 0,
         events_so_far: Optional[list[GameEvent]] = None,
     ) -> SeerAction:
         """Get valid target from seer participant with retry.
@@ -262,7 +267,7 @@ class SeerHandler:
             context: Game state
             participant: The participant to query
             seer_seat: The seer's seat
-            seer_checks: Set of seats already checked by the seer
+            seer_checks: Seat bitmask of players already checked by the seer
             events_so_far: Previous game events for public visibility filtering
 
         Returns:
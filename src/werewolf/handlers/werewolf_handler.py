@@ -5,6 +5,7 @@ choose a target to kill.
 """
 
 from collections import Counter
+from dataclasses import dataclass
 from typing import Sequence, Optional, Any
 
 from pydantic import BaseModel, Field
@@ -37,6 +38,17 @@ def _get_choice_spec_helpers():
 ChoiceSpec = Any  # Will be resolved at runtime
 
 
+# ============================================================================
+# Handler Result
+# ============================================================================
+
+
+class WerewolfHandlerResult(HandlerResult):
+    """HandlerResult that also carries the decoded kill target."""
+
+    kill_target: Optional[int] = None
+
+
 # ============================================================================
 # Werewolf Handler
 # ============================================================================
@@ -74,7 +86,7 @@ class WerewolfHandler:
         context: "PhaseContext",
         participants: Sequence[tuple[int, Participant]],
         events_so_far: list[GameEvent] | None = None,
-    ) -> HandlerResult:
+    ) -> WerewolfHandlerResult:
         """Execute the WerewolfAction subphase.
 
         Args:
@@ -84,10 +96,11 @@ class WerewolfHandler:
             events_so_far: Previous events in the current night (for context)
 
         Returns:
-            HandlerResult with SubPhaseLog containing WerewolfKill event
+            WerewolfHandlerResult with SubPhaseLog containing WerewolfKill event
         """
         events = []
         events_so_far = events_so_far or []
+        kill_target = None
 
         # Get living werewolf seats
         werewolf_seats = [
@@ -97,7 +110,7 @@ class WerewolfHandler:
 
         # Edge case: no werewolves alive
         if not werewolf_seats:
-            return HandlerResult(
+            return WerewolfHandlerResult(
                 subphase_log=SubPhaseLog(micro_phase=SubPhase.WEREWOLF_ACTION),
                 debug_info="No werewolves alive, skipping WerewolfAction",
             )
@@ -125,6 +138,7 @@ class WerewolfHandler:
         participant = participant_dict.get(representative)
         if participant:
             target = await self._get_valid_target(context, participant, representative, events_so_far)
+            kill_target = target
 
             # Create debug info with collective decision info
             import json
@@ -143,11 +157,12 @@ class WerewolfHandler:
                 debug_info=debug_info,
             ))
 
-        return HandlerResult(
+        return WerewolfHandlerResult(
             subphase_log=SubPhaseLog(
                 micro_phase=SubPhase.WEREWOLF_ACTION,
                 events=events,
             ),
+            kill_target=kill_target,
         )
 
     def _build_prompts(
@@ -407,6 +422,7 @@ class WerewolfHandler:
 # ============================================================================
 
 
+@dataclass(slots=True, frozen=True)
 class PhaseContext:
     """Minimal context for testing WerewolfAction handler.
 
@@ -414,19 +430,11 @@ class PhaseContext:
     would provide. Handlers can use is_werewolf() and other helper methods.
     """
 
-    def __init__(
-        self,
-        players: dict[int, Player],
-        living_players: set[int],
-        dead_players: set[int],
-        sheriff: Optional[int] = None,
-        day: int = 1,
-    ):
-        self.players = players
-        self.living_players = living_players
-        self.dead_players = dead_players
-        self.sheriff = sheriff
-        self.day = day
+    players: dict[int, Player]
+    living_players: set[int]
+    dead_players: set[int]
+    sheriff: Optional[int] = None
+    day: int = 1
 
     def get_player(self, seat: int) -> Optional[Player]:
         """Get player by seat."""
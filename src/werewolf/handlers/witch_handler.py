@@ -30,6 +30,25 @@ def _get_choice_spec():
     return ChoiceSpec, ChoiceOption, make_action_choice, make_seat_choice
 
 
+# ============================================================================
+# Handler Result
+# ============================================================================
+
+
+class WitchHandlerResult(HandlerResult):
+    """HandlerResult that also carries the decoded antidote/poison targets."""
+
+    antidote_target: Optional[int] = None
+    poison_target: Optional[int] = None
+
+
+# WitchHandlerResult field decoded from each action type (PASS sets none)
+_WITCH_TARGET_FIELDS: dict[WitchActionType, str] = {
+    WitchActionType.ANTIDOTE: "antidote_target",
+    WitchActionType.POISON: "poison_target",
+}
+
+
 # ============================================================================
 # Night Actions Context
 # ============================================================================
@@ -81,7 +100,7 @@ class WitchHandler:
         participants: Sequence[tuple[int, Participant]],
         night_actions: NightActions,
         events_so_far: Optional[list[GameEvent]] = None,
-    ) -> HandlerResult:
+    ) -> WitchHandlerResult:
         """Execute the WitchAction subphase.
 
         Args:
@@ -92,7 +111,7 @@ class WitchHandler:
             events_so_far: Previous game events for public visibility filtering
 
         Returns:
-            HandlerResult with SubPhaseLog containing WitchAction event
+            WitchHandlerResult with SubPhaseLog containing WitchAction event
         """
         events = []
         events_so_far = events_so_far or []
@@ -107,7 +126,7 @@ class WitchHandler:
 
         # Edge case: no living witch
         if witch_seat is None:
-            return HandlerResult(
+            return WitchHandlerResult(
                 subphase_log=SubPhaseLog(micro_phase=SubPhase.WITCH_ACTION),
                 debug_info="No living witch, skipping WitchAction",
             )
@@ -130,7 +149,7 @@ class WitchHandler:
                 day=context.day,
                 debug_info="No participant, defaulting to PASS",
             ))
-            return HandlerResult(
+            return WitchHandlerResult(
                 subphase_log=SubPhaseLog(
                     micro_phase=SubPhase.WITCH_ACTION,
                     events=events,
@@ -148,11 +167,15 @@ class WitchHandler:
 
         events.append(action)
 
-        return HandlerResult(
+        target_field = _WITCH_TARGET_FIELDS.get(action.action_type)
+        decoded = {target_field: action.target} if target_field else {}
+
+        return WitchHandlerResult(
             subphase_log=SubPhaseLog(
                 micro_phase=SubPhase.WITCH_ACTION,
                 events=events,
             ),
+            **decoded,
         )
 
     def _build_prompts(
@@ -26,6 +26,11 @@ from collections import Counter
 from rich.console import Console
 from rich.panel import Panel
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from werewolf.models import Player, create_players_from_config
 from werewolf.engine import WerewolfGame, CollectingValidator
 from werewolf.engine.validator import GameValidator
@@ -50,6 +55,29 @@ def create_players(seed: int) -> dict[int, Player]:
     return players
 
 
+def _install_eager_task_factory() -> None:
+    """Start new tasks eagerly on the running loop (Python 3.12+).
+
+    Tasks whose coroutine finishes without suspending, such as the
+    gathered Guard/Seer night actions of stub AI players, then complete
+    without a round trip through the event loop. No-op on Python 3.11.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop is optional; without it the stdlib event loop is used.
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 # Event callback for real-time display
 _event_queue: asyncio.Queue = asyncio.Queue()
 _display_task: Optional[asyncio.Task] = None
@@ -139,6 +167,7 @@ async def run_ai_simulation(
     Returns:
         Tuple of (winner string, captured prompts list or None)
     """
+    _install_eager_task_factory()
     console = Console()
 
     players = create_players(seed)
@@ -304,10 +333,11 @@ def run_stress_test(
             }
 
     async def run_all():
+        _install_eager_task_factory()
         tasks = [run_one(i) for i in range(num_games)]
         return await asyncio.gather(*tasks, return_exceptions=True)
 
-    results = asyncio.run(run_all())
+    results = _run(run_all())
 
     # Process results
     for result in results:
@@ -445,7 +475,7 @@ def main():
         # AI vs AI mode (explicit --ai or --watch flag)
         # --watch enables real-time display, --ai runs silently
         watch_mode = args.watch
-        asyncio.run(run_ai_simulation(
+        _run(run_ai_simulation(
             args.seed,
             validator=validator,
             log_file=args.log_file,
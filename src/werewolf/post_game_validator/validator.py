@@ -4,7 +4,7 @@ This module provides independent validation of game events from a YAML event log
 replaying the game and validating all rules without using the in-game validator.
 """
 
-from typing import Optional
+from typing import Any, Callable, Optional
 from werewolf.events.event_log import GameEventLog, PhaseLog
 from werewolf.engine.game_state import GameState
 from werewolf.models.player import Role, Player
@@ -47,6 +47,7 @@ class PostGameValidator:
         self._potion_used: dict = {"antidote": False, "poison": False}
         self._guard_prev_target: Optional[int] = None
         self._votes_this_phase: list = []
+        self._deaths_this_day: dict[int, str] = {}
         self._current_day: int = 0
 
     def validate(self) -> ValidationResult:
@@ -128,7 +129,6 @@ class PostGameValidator:
         self.state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
             sheriff=None,
             day=1,
         )
@@ -190,59 +190,43 @@ class PostGameValidator:
 
         for subphase in phase_log.subphases:
             for event in subphase.events:
-                # Werewolf action
-                if isinstance(event, WerewolfKill):
-                    self._validate_werewolf_action(event)
+                handler = _NIGHT_EVENT_HANDLERS.get(type(event))
+                if handler is not None:
+                    handler(self, event)
 
-                # Witch action
-                elif isinstance(event, WitchAction):
-                    self._validate_witch_action(event)
-
-                # Guard action
-                elif isinstance(event, GuardAction):
-                    self._validate_guard_action(event)
-
-                # Seer action
-                elif isinstance(event, SeerAction):
-                    self._validate_seer_action(event)
-
-                # Night outcome - this is where deaths are AUTHORITATIVELY applied
-                elif isinstance(event, NightOutcome):
-                    if event.deaths:
-                        deaths = {seat: cause for seat, cause in event.deaths.items()}
-                        self._apply_deaths(deaths)
+    def _apply_night_outcome(self, event: NightOutcome) -> None:
+        """Apply deaths from a NightOutcome."""
+        if event.deaths:
+            deaths = {seat: cause for seat, cause in event.deaths.items()}
+            self._apply_deaths(deaths)
 
     def _validate_day_phase(self, phase_log: PhaseLog) -> None:
         """Validate day phase actions and apply state changes."""
-        deaths_this_day: dict[int, str] = {}
+        self._deaths_this_day = {}
 
         for subphase in phase_log.subphases:
             for event in subphase.events:
-                # Sheriff outcome
-                if isinstance(event, SheriffOutcome):
-                    self._validate_sheriff_outcome(event)
-
-                # Death event
-                elif isinstance(event, DeathEvent):
-                    self._validate_death_event(event)
-                    deaths_this_day[event.actor] = event.cause.value if hasattr(event.cause, 'value') else event.cause
-                    # Also apply hunter shoot target death (if any)
-                    if event.hunter_shoot_target is not None:
-                        deaths_this_day[event.hunter_shoot_target] = "HUNTER_SHOOT"
-
-                # Vote
-                elif isinstance(event, Vote):
-                    self._validate_vote(event)
-
-                # Banishment
-                elif isinstance(event, Banishment):
-                    self._validate_banishment(event)
-                    if event.banished is not None:
-                        deaths_this_day[event.banished] = "BANISHMENT"
+                handler = _DAY_EVENT_HANDLERS.get(type(event))
+                if handler is not None:
+                    handler(self, event)
 
         # Apply deaths after validating actions
-        if deaths_this_day:
-            self._apply_deaths(deaths_this_day)
+        if self._deaths_this_day:
+            self._apply_deaths(self._deaths_this_day)
+
+    def _record_death_event(self, event: DeathEvent) -> None:
+        """Validate a DeathEvent and record its deaths for this day."""
+        self._validate_death_event(event)
+        self._deaths_this_day[event.actor] = event.cause.value if hasattr(event.cause, 'value') else event.cause
+        # Also apply hunter shoot target death (if any)
+        if event.hunter_shoot_target is not None:
+            self._deaths_this_day[event.hunter_shoot_target] = "HUNTER_SHOOT"
+
+    def _record_banishment(self, event: Banishment) -> None:
+        """Validate a Banishment and record the banished player for this day."""
+        self._validate_banishment(event)
+        if event.banished is not None:
+            self._deaths_this_day[event.banished] = "BANISHMENT"
 
     # =========================================================================
     # Action Validation
@@ -273,7 +257,7 @@ class PostGameValidator:
                 )
 
         # D.3: Cannot target dead players
-        if event.target is not None and event.target in self.state.dead_players:
+        if event.target is not None and self.state.is_dead(event.target):
             self._add_violation(
                 "D.3", "Night Actions - Werewolf",
                 f"Werewolf cannot target dead player {event.target}",
@@ -364,7 +348,7 @@ class PostGameValidator:
             )
 
         # F.5: Cannot guard dead players
-        if event.target is not None and event.target in self.state.dead_players:
+        if event.target is not None and self.state.is_dead(event.target):
             self._add_violation(
                 "F.5", "Night Actions - Guard",
                 f"Guard cannot guard dead player {event.target}",
@@ -417,7 +401,7 @@ class PostGameValidator:
                     f"Sheriff election for unknown player {event.winner}",
                     "SheriffOutcome"
                 )
-            elif event.winner in self.state.dead_players:
+            elif self.state.is_dead(event.winner):
                 self._add_violation(
                     "H.2", "Day Actions - Sheriff",
                     f"Dead player {event.winner} was elected sheriff",
@@ -448,7 +432,7 @@ class PostGameValidator:
     def _validate_vote(self, event: Vote) -> None:
         """Validate vote event (J.1-J.5)."""
         # J.5: Cannot vote for dead players
-        if event.target is not None and event.target in self.state.dead_players:
+        if event.target is not None and self.state.is_dead(event.target):
             self._add_violation(
                 "J.5", "Day Actions - Voting",
                 f"Cannot vote for dead player {event.target}",
@@ -461,7 +445,7 @@ class PostGameValidator:
         """Validate banishment event (J.1-J.5)."""
         # Verify banishment was valid (proper vote count)
         if event.banished is not None:
-            if event.banished in self.state.dead_players:
+            if self.state.is_dead(event.banished):
                 self._add_violation(
                     "J.5", "Day Actions - Voting",
                     f"Cannot banish already dead player {event.banished}",
@@ -474,14 +458,9 @@ class PostGameValidator:
 
     def _apply_deaths(self, deaths: dict[int, str]) -> None:
         """Apply deaths to state."""
-        for seat in deaths.keys():
-            if seat in self.state.players:
-                self.state.players[seat].is_alive = False
-            if seat in self.state.living_players:
-                self.state.living_players.remove(seat)
-                self.state.dead_players.add(seat)
-            if seat == self.state.sheriff:
-                self.state.sheriff = None
+        self.state.apply_events_from_deaths(deaths)
+        if self.state.sheriff in deaths:
+            self.state.sheriff = None
 
     # =========================================================================
     # Victory Validation
@@ -568,3 +547,22 @@ class PostGameValidator:
                     "A.5", "Victory Conditions",
                     "Game should end in tie when both victory conditions are met"
                 )
+
+
+# Event type -> handler, dispatched on type(event) (event classes are all
+# leaves). Events of other types are skipped, as before.
+_NIGHT_EVENT_HANDLERS: dict[type, Callable[[PostGameValidator, Any], None]] = {
+    WerewolfKill: PostGameValidator._validate_werewolf_action,
+    WitchAction: PostGameValidator._validate_witch_action,
+    GuardAction: PostGameValidator._validate_guard_action,
+    SeerAction: PostGameValidator._validate_seer_action,
+    # Night outcome - this is where deaths are AUTHORITATIVELY applied
+    NightOutcome: PostGameValidator._apply_night_outcome,
+}
+
+_DAY_EVENT_HANDLERS: dict[type, Callable[[PostGameValidator, Any], None]] = {
+    SheriffOutcome: PostGameValidator._validate_sheriff_outcome,
+    DeathEvent: PostGameValidator._record_death_event,
+    Vote: PostGameValidator._validate_vote,
+    Banishment: PostGameValidator._record_banishment,
+}
@@ -1,7 +1,8 @@
 """State consistency validators (M.1-M.7).
 
 Rules:
-- M.1: living_players and dead_players must be disjoint
+- M.1: living_players and dead_players must be disjoint (structural:
+  GameState derives dead_players from living_players, so it is not checked)
 - M.2: dead_players must match players with is_alive=False
 - M.3: living_players + dead_players = all players
 - M.4: Sheriff must be alive
@@ -36,29 +37,21 @@ def validate_state_consistency(
         return violations
 
     all_seats = set(state.players.keys())
-
-    # M.1: living_players and dead_players must be disjoint
-    overlap = state.living_players & state.dead_players
-    if overlap:
-        violations.append({
-            "rule_id": "M.1",
-            "category": "State Consistency",
-            "message": f"Players in both living and dead sets: {sorted(overlap)}",
-            "severity": "error",
-        })
+    # Derived from living_mask on each access, so read it once
+    dead_players = state.dead_players
 
     # M.2: dead_players must match players with is_alive=False
     expected_dead = {seat for seat, p in state.players.items() if not p.is_alive}
-    if state.dead_players != expected_dead:
+    if dead_players != expected_dead:
         violations.append({
             "rule_id": "M.2",
             "category": "State Consistency",
-            "message": f"dead_players set {state.dead_players} doesn't match expected {expected_dead}",
+            "message": f"dead_players set {dead_players} doesn't match expected {expected_dead}",
             "severity": "error",
         })
 
     # M.3: living_players + dead_players = all players
-    expected_living = all_seats - state.dead_players
+    expected_living = all_seats - dead_players
     if state.living_players != expected_living:
         violations.append({
             "rule_id": "M.3",
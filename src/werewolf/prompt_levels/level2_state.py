@@ -12,7 +12,7 @@ Formatting functions:
 - get_teammate_seats(context, your_seat): Get werewolf teammate seats
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from werewolf.models.player import Role
 
@@ -219,17 +219,34 @@ def make_guard_context(
     }
 
 
+def seer_checks_mask(seer_checks: int | Iterable[int] | None) -> int:
+    """Normalize seer_checks to a seat bitmask.
+
+    seer_checks used to be a set of seats (or None), and callers passing
+    that form are still accepted.
+    """
+    if seer_checks is None:
+        return 0
+    if isinstance(seer_checks, int):
+        return seer_checks
+    mask = 0
+    for seat in seer_checks:
+        mask |= 1 << seat
+    return mask
+
+
 def make_seer_context(
     context: "PhaseContext",
     your_seat: int,
-    seer_checks: set[int] | None = None,
+    seer_checks: int | Iterable[int] | None = 0,
 ) -> dict:
     """Create Level 2 context for seer decision.
 
     Args:
         context: The phase context from handlers
         your_seat: The seer's seat
-        seer_checks: Set of seats already checked by the seer (to exclude)
+        seer_checks: Seat bitmask of players already checked by the seer (to
+                     exclude); a set of seats is also accepted
 
     Returns:
         Dict with game state formatted for seer prompts
@@ -238,8 +255,9 @@ def make_seer_context(
     # Seer cannot check themselves
     valid_targets = [s for s in living_sorted if s != your_seat]
     # Filter out already checked players - no point rechecking them
+    seer_checks = seer_checks_mask(seer_checks)
     if seer_checks:
-        valid_targets = [s for s in valid_targets if s not in seer_checks]
+        valid_targets = [s for s in valid_targets if not (seer_checks >> s) & 1]
 
     return {
         "phase": "NIGHT",
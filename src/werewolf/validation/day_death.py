@@ -46,7 +46,7 @@ def validate_death_resolution(
     if is_night_death and state.day == 1:
         # On Day 1, Sheriff phases must complete before death resolution
         # Sheriff must exist (elected) for Day 1 night deaths
-        if state.sheriff is None and len(state.dead_players) > 0:
+        if state.sheriff is None and state.dead_mask:
             # Allow if this is the first death resolution before Sheriff
             # (Sheriff phases come before death resolution on Day 1)
             pass  # Phase ordering validated elsewhere
@@ -152,7 +152,7 @@ def validate_discussion_participation(
 
     # I.8: Dead players cannot participate in Discussion
     if event.micro_phase.value == "DISCUSSION":
-        if event.actor in state.dead_players:
+        if state.is_dead(event.actor):
             violations.append(ValidationViolation(
                 rule_id="I.8",
                 category="Death Resolution",
@@ -180,7 +180,7 @@ def validate_vote_eligibility(
     violations: list[ValidationViolation] = []
 
     # I.9: Dead players cannot vote in Day voting
-    if event.actor in state.dead_players:
+    if state.is_dead(event.actor):
         violations.append(ValidationViolation(
             rule_id="I.9",
             category="Death Resolution",
@@ -80,8 +80,8 @@ def validate_event_logging(
             ))
 
     # N.6: All player actions must be logged as events
-    actions = [e for e in collector.get_events() if isinstance(e, CharacterAction)]
-    if not actions and day > 0:
+    has_actions = any(isinstance(e, CharacterAction) for e in collector.iter_events())
+    if not has_actions and day > 0:
         violations.append(ValidationViolation(
             rule_id="N.6",
             category="Event Logging",
@@ -209,11 +209,9 @@ def validate_action_logging(
         List of validation violations
     """
     violations: list[ValidationViolation] = []
-    all_events = collector.get_events()
-
     # Get events for current phase/day
     phase_events = [
-        e for e in all_events
+        e for e in collector.iter_events()
         if e.phase == phase and e.day == day
     ]
 
@@ -8,7 +8,7 @@ class ValidationError(Exception):
     """Raised when one or more validation violations are detected.
 
     This exception is used for fail-fast behavior during development/testing.
-    Production uses NoOpValidator which never raises.
+    Production runs without a validator, so it never raises.
     """
 
     def __init__(self, violations: List[ValidationViolation]):
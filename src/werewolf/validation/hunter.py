@@ -46,7 +46,7 @@ def validate_hunter_action(
             ))
 
     # K.2: Hunter cannot target dead players
-    if shoot_target is not None and shoot_target in state.dead_players:
+    if shoot_target is not None and state.is_dead(shoot_target):
         violations.append(ValidationViolation(
             rule_id="K.2",
             category="Hunter",
@@ -85,7 +85,7 @@ def validate_hunter_death_chain(
 
     # K.4: Hunter shot target must die immediately
     if shoot_target is not None and cause != DeathCause.POISON:
-        if shoot_target not in state.dead_players:
+        if not state.is_dead(shoot_target):
             violations.append(ValidationViolation(
                 rule_id="K.4",
                 category="Hunter",
@@ -12,7 +12,7 @@ from werewolf.models.player import Role
 from .types import ValidationViolation, ValidationSeverity
 
 
-GOD_ROLES = {Role.SEER, Role.WITCH, Role.HUNTER, Role.GUARD}
+GOD_ROLES: frozenset[Role] = frozenset({Role.SEER, Role.WITCH, Role.HUNTER, Role.GUARD})
 
 
 def validate_game_start(state: GameState) -> list[ValidationViolation]:
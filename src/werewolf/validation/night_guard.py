@@ -42,7 +42,7 @@ def validate_guard_action(
         ))
 
     # Target must be alive (guard protects living players)
-    if event.target is not None and event.target in state.dead_players:
+    if event.target is not None and state.is_dead(event.target):
         violations.append(ValidationViolation(
             rule_id="F.1",
             category="Night Actions - Guard",
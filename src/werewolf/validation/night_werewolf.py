@@ -29,7 +29,7 @@ def validate_werewolf_action(
     violations: list[ValidationViolation] = []
 
     # D.1: Cannot target dead players
-    if event.target is not None and event.target in state.dead_players:
+    if event.target is not None and state.is_dead(event.target):
         violations.append(ValidationViolation(
             rule_id="D.1",
             category="Night Actions - Werewolf",
@@ -39,7 +39,7 @@ def validate_werewolf_action(
         ))
 
     # D.2: Dead werewolves cannot act
-    if event.actor in state.dead_players:
+    if state.is_dead(event.actor):
         violations.append(ValidationViolation(
             rule_id="D.2",
             category="Night Actions - Werewolf",
@@ -71,7 +71,7 @@ def validate_witch_action(
             ))
 
         # Poison target must be alive (poison kills, not eliminates)
-        if event.target is not None and event.target in state.dead_players:
+        if event.target is not None and state.is_dead(event.target):
             violations.append(ValidationViolation(
                 rule_id="E.5",
                 category="Night Actions - Witch",
@@ -1,8 +1,10 @@
 """State Consistency Validators (M.1-M.7).
 
 Rules:
-- M.1: living_players union dead_players must equal all_players
-- M.2: living_players and dead_players must be disjoint
+- M.1: living_players must only contain player seats
+- M.2: living_players and dead_players must be disjoint (structural: GameState
+  derives dead_players as the player seats outside living_players, so this
+  always holds and M.1 is what keeps living union dead equal to all_players)
 - M.3: Player.is_alive must match seat in living_players
 - M.4: Player.is_sheriff must match sheriff state
 - M.5: Dead players cannot appear in living-only operations (enforced by handlers)
@@ -31,30 +33,17 @@ def validate_state_consistency(
     violations: list[ValidationViolation] = []
 
     living = state.living_players
-    dead = state.dead_players
     all_ids = {seat for seat in state.players.keys()}
 
-    # M.1: living ∪ dead == all
-    if living | dead != all_ids:
-        missing = all_ids - (living | dead)
-        extra = (living | dead) - all_ids
+    # M.1: living ⊆ all (dead is all - living, so living ∪ dead == all)
+    if not living <= all_ids:
+        extra = living - all_ids
         violations.append(ValidationViolation(
             rule_id="M.1",
             category="State Consistency",
-            message="living_players union dead_players must equal all_players",
+            message="living_players must only contain player seats",
             severity=ValidationSeverity.ERROR,
-            context={"missing": list(missing), "extra": list(extra)}
-        ))
-
-    # M.2: living ∩ dead == ∅
-    if living & dead:
-        overlaps = living & dead
-        violations.append(ValidationViolation(
-            rule_id="M.2",
-            category="State Consistency",
-            message="living_players and dead_players must be disjoint",
-            severity=ValidationSeverity.ERROR,
-            context={"overlapping_seats": list(overlaps)}
+            context={"extra": list(extra)}
         ))
 
     # M.3: Player.is_alive matches living_players
@@ -11,7 +11,13 @@ import asyncio
 import random
 import pytest
 
-from werewolf.engine import GameState, EventCollector, DayScheduler
+from werewolf.engine import (
+    GameState,
+    EventCollector,
+    DayScheduler,
+    NoOpValidator,
+    CollectingValidator,
+)
 from werewolf.models import Player, Role, STANDARD_12_PLAYER_CONFIG, create_players_from_config
 from werewolf.ai.stub_ai import StubPlayer, create_stub_player
 # Use src. prefix to match handler imports for proper isinstance checks
@@ -23,7 +29,10 @@ from werewolf.events.game_events import (
     Banishment,
     SheriffOutcome,
     SheriffOptOut,
+    SheriffNomination,
+    DeathCause,
 )
+from werewolf.handlers.base import HandlerResult, SubPhaseLog as HandlerSubPhaseLog
 
 
 # ============================================================================
@@ -65,7 +74,6 @@ def initial_state(players: dict[int, Player]) -> GameState:
     return GameState(
         players=players,
         living_players=set(players.keys()),
-        dead_players=set(),
         sheriff=None,
         day=1,
     )
@@ -83,7 +91,6 @@ def day2_state(players: dict[int, Player]) -> GameState:
     return GameState(
         players=players,
         living_players=set(players.keys()),
-        dead_players=set(),
         sheriff=None,
         day=2,
     )
@@ -101,6 +108,14 @@ class TestDaySchedulerBasics:
         scheduler = DayScheduler()
         assert scheduler is not None
 
+    def test_noop_validator_uses_none_fast_path(self):
+        """Test that no validator and a plain NoOpValidator both skip hooks."""
+        assert DayScheduler()._validator is None
+        assert DayScheduler(validator=NoOpValidator())._validator is None
+
+        collecting = CollectingValidator()
+        assert DayScheduler(validator=collecting)._validator is collecting
+
     def test_initial_state(self, initial_state: GameState):
         """Test initial game state for Day 1."""
         assert initial_state.day == 1
@@ -112,6 +127,66 @@ class TestDaySchedulerBasics:
         """Test event collector initialization."""
         assert collector.day == 0
 
+    def test_context_reused_until_state_changes(self, initial_state: GameState):
+        """Test that the day context is cached per state, epoch, day and sheriff."""
+        scheduler = DayScheduler()
+        context = scheduler._build_context(initial_state)
+        assert scheduler._build_context(initial_state) is context
+
+        initial_state.apply_events_from_deaths({0: DeathCause.POISON})
+        rebuilt = scheduler._build_context(initial_state)
+        assert rebuilt is not context
+        assert 0 not in rebuilt.living_players
+
+        initial_state.sheriff = 3
+        assert scheduler._build_context(initial_state).sheriff == 3
+
+    def test_context_rebuilt_after_reassignment(self, initial_state: GameState):
+        """Test that reassigning living_players or players invalidates the context."""
+        scheduler = DayScheduler()
+        context = scheduler._build_context(initial_state)
+
+        initial_state.living_players = set(initial_state.players) - {0, 4}
+        rebuilt = scheduler._build_context(initial_state)
+        assert rebuilt is not context
+        assert rebuilt.living_players == initial_state.living_players
+        assert rebuilt.dead_players == {0, 4}
+
+        wolf = next(
+            seat for seat, player in initial_state.players.items()
+            if player.role == Role.WEREWOLF
+        )
+        players = dict(initial_state.players)
+        players[wolf] = players[wolf].model_copy(update={"role": Role.ORDINARY_VILLAGER})
+        initial_state.players = players
+        context = scheduler._build_context(initial_state)
+        assert context is not rebuilt
+        assert not context.is_werewolf(wolf)
+
+    def test_context_is_werewolf_matches_roles(self, initial_state: GameState):
+        """Test that the mask-backed is_werewolf agrees with player roles."""
+        context = DayScheduler()._build_context(initial_state)
+        for seat, player in initial_state.players.items():
+            assert context.is_werewolf(seat) == (player.role == Role.WEREWOLF)
+        assert not context.is_werewolf(-1)
+        assert not context.is_werewolf(99)
+
+    def test_context_without_werewolf_mask_derives_it(self, initial_state: GameState):
+        """Test that DayPhaseContext built the old way derives werewolf_mask."""
+        from werewolf.engine.day_scheduler import DayPhaseContext
+
+        context = DayPhaseContext(
+            initial_state.players,
+            initial_state.living_players,
+            initial_state.dead_players,
+            None,
+            1,
+        )
+
+        assert context.werewolf_mask == initial_state.get_role_mask(Role.WEREWOLF)
+        for seat, player in initial_state.players.items():
+            assert context.is_werewolf(seat) == (player.role == Role.WEREWOLF)
+
 
 class TestDay1WithSheriffElection:
     """Tests for Day 1 with sheriff election flow."""
@@ -246,6 +321,48 @@ class TestDay1WithSheriffElection:
         assert outcome.winner is None or outcome.winner in initial_state.living_players
 
 
+class TestDay1WithoutNominations:
+    """Tests for the Day 1 fast path when nobody runs for sheriff."""
+
+    @pytest.mark.asyncio
+    async def test_no_nominations_skips_remaining_sheriff_subphases(
+        self,
+        initial_state: GameState,
+        collector: EventCollector,
+        players: dict[int, Player],
+    ):
+        """Test that Campaign, OptOut and SheriffElection never start."""
+        scheduler = DayScheduler()
+        participants = create_participants_from_players(players, seed=42)
+
+        async def nobody_runs(context, participants):
+            return HandlerResult(subphase_log=HandlerSubPhaseLog(
+                micro_phase=SubPhase.NOMINATION,
+                events=[
+                    SheriffNomination(actor=seat, day=1, running=False)
+                    for seat, _ in participants
+                ],
+            ))
+
+        async def must_not_run(*args, **kwargs):
+            raise AssertionError("sheriff subphase ran without candidates")
+
+        scheduler._nomination_handler = nobody_runs
+        scheduler._campaign_handler = must_not_run
+        scheduler._opt_out_handler = must_not_run
+        scheduler._sheriff_election_handler = must_not_run
+
+        await scheduler.run_day(initial_state, collector, participants)
+
+        day_phase = collector.get_event_log().get_day(1)
+        subphase_types = [sp.micro_phase for sp in day_phase.subphases]
+        assert subphase_types[0] == SubPhase.NOMINATION
+        assert SubPhase.CAMPAIGN not in subphase_types
+        assert SubPhase.OPT_OUT not in subphase_types
+        assert SubPhase.SHERIFF_ELECTION not in subphase_types
+        assert SubPhase.VOTING in subphase_types
+
+
 class TestDayWithoutSheriffElection:
     """Tests for days without sheriff election (Day 2+)."""
 
@@ -429,9 +546,8 @@ class TestVictoryDetection:
         for seat in non_werewolf_seats:
             initial_state.players[seat].is_alive = False
 
-        # Update living/dead sets - only werewolves alive
+        # Update living set - only werewolves alive
         initial_state.living_players = werewolf_seats.copy()
-        initial_state.dead_players = non_werewolf_seats.copy()
 
         participants = create_participants_from_players(initial_state.players, seed=666)
 
@@ -460,9 +576,8 @@ class TestVictoryDetection:
         for seat in werewolf_seats:
             initial_state.players[seat].is_alive = False
 
-        # Update living/dead sets - only non-werewolves alive
+        # Update living set - only non-werewolves alive
         initial_state.living_players = {seat for seat in players.keys() if seat not in werewolf_seats}
-        initial_state.dead_players = werewolf_seats.copy()
 
         participants = create_participants_from_players(initial_state.players, seed=777)
 
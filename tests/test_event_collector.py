@@ -218,6 +218,41 @@ class TestEventCollectorAddSubphaseLog:
         events = collector.get_events()
         assert events[0].day == 3
 
+    def test_on_events_fires_once_per_subphase_log(self):
+        """Test that the batch callback receives a whole subphase log at once."""
+        batches = []
+        singles = []
+        collector = EventCollector(day=1, on_event=singles.append, on_events=batches.append)
+        collector.create_phase_log(Phase.DAY)
+
+        votes = [Vote(actor=seat, day=1, target=0) for seat in range(1, 4)]
+        collector.add_subphase_log(SubPhaseLog(micro_phase=SubPhase.VOTING, events=votes))
+        collector.add_event(Vote(actor=4, day=1, target=0))
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert len(singles) == 4
+
+    def test_last_subphase_log(self):
+        """Test that last_subphase_log tracks the latest phase's last subphase."""
+        collector = EventCollector(day=1)
+        assert collector.last_subphase_log is None
+
+        collector.create_phase_log(Phase.NIGHT)
+        assert collector.last_subphase_log is None
+
+        kill_log = SubPhaseLog(
+            micro_phase=SubPhase.WEREWOLF_ACTION,
+            events=[WerewolfKill(actor=0, day=1, target=5)],
+        )
+        collector.add_subphase_log(kill_log)
+        assert collector.last_subphase_log is kill_log
+
+        collector.add_event(SeerAction(actor=3, day=1, target=4, result=SeerResult.GOOD))
+        assert collector.last_subphase_log.micro_phase == SubPhase.SEER_ACTION
+
+        collector.create_phase_log(Phase.DAY)
+        assert collector.last_subphase_log is None
+
 
 class TestEventCollectorGetEventLog:
     """Tests for get_event_log method."""
@@ -232,6 +267,18 @@ class TestEventCollectorGetEventLog:
         assert len(event_log.phases) == 1
         assert event_log.phases[0].kind == Phase.NIGHT
 
+    def test_get_event_log_does_not_duplicate_subphases(self):
+        """Test that finalizing on get_event_log keeps each subphase once."""
+        collector = EventCollector(day=1)
+        collector.create_phase_log(Phase.NIGHT)
+        collector.add_event(WerewolfKill(actor=0, day=1, target=5))
+        collector.add_event(WerewolfKill(actor=0, day=1, target=5))
+
+        collector.get_event_log()
+        event_log = collector.get_event_log()
+        assert len(event_log.phases[0].subphases) == 1
+        assert len(event_log.phases[0].subphases[0].events) == 2
+
     def test_get_event_log_with_night_events(self):
         """Test get_event_log with complete night scenario."""
         collector = EventCollector(day=1)
@@ -319,6 +366,17 @@ class TestEventCollectorGetEvents:
         assert events[1].actor == 1
         assert events[2].actor == 2
 
+    def test_iter_events_matches_get_events(self):
+        """Test that iter_events yields the same events across phases."""
+        collector = EventCollector(day=1)
+        collector.create_phase_log(Phase.NIGHT)
+        collector.add_event(WerewolfKill(actor=0, day=1, target=5))
+        collector.create_phase_log(Phase.DAY)
+        collector.add_event(Vote(actor=1, day=1, target=2))
+
+        assert list(collector.iter_events()) == collector.get_events()
+        assert [type(e) for e in collector.iter_events()] == [WerewolfKill, Vote]
+
 
 class TestEventCollectorSetMethods:
     """Tests for set_player_count, set_game_start, set_game_over."""
@@ -339,6 +397,7 @@ class TestEventCollectorSetMethods:
 
         event_log = collector.get_event_log()
         assert event_log.game_start == game_start
+        assert event_log.player_count == 12
 
     def test_set_game_over(self):
         """Test setting game over event."""
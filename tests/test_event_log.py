@@ -3,7 +3,9 @@
 import pytest
 import tempfile
 import os
+from pydantic import ValidationError
 
+from werewolf.events.event_formatter import _DISPATCH_TABLE, EventFormatter
 from werewolf.events.event_log import (
     GameEventLog,
     PhaseLog,
@@ -29,6 +31,8 @@ from werewolf.events.game_events import (
     WitchActionType,
     Phase,
     DeathCause,
+    GameEvent,
+    preview,
 )
 
 
@@ -91,6 +95,27 @@ class TestPhase:
         night = PhaseLog(number=1, kind=Phase.NIGHT, subphases=[werewolf_sp, guard_sp])
         assert len(night.subphases) == 2
 
+    def test_phase_number_must_be_positive(self):
+        """Test that there is no Night 0 or Day 0."""
+        with pytest.raises(ValidationError):
+            PhaseLog(number=0, kind=Phase.NIGHT)
+
+    def test_phase_describe_indents_multiline_events(self):
+        """Test that every line of a multi-line event is indented under the phase."""
+        speech = Speech(actor=2, day=1, micro_phase=SubPhase.DISCUSSION, content="one\ntwo")
+        day = PhaseLog(
+            number=1,
+            kind=Phase.DAY,
+            subphases=[SubPhaseLog(micro_phase=SubPhase.DISCUSSION, events=[speech])],
+        )
+
+        assert day.describe({2: "SEER"}).split("\n") == [
+            "=== DAY 1 ===",
+            "  DISCUSSION",
+            '      SEER(2) (discussion): "one',
+            '  two"',
+        ]
+
     def test_phase_str_empty_night(self):
         """Test Phase string representation for empty night."""
         night = PhaseLog(number=1, kind=Phase.NIGHT)
@@ -113,6 +138,26 @@ class TestPhase:
         assert "WEREWOLF_ACTION" in output
 
 
+class TestLazyExports:
+    """Tests for the lazy log re-exports of werewolf.events."""
+
+    def test_log_classes_resolve_from_package(self):
+        """Test that package-level log names are the event_log classes."""
+        import werewolf.events as events
+
+        assert events.GameEventLog is GameEventLog
+        assert events.PhaseLog is PhaseLog
+        assert events.SubPhaseLog is SubPhaseLog
+        assert "GameEventLog" in dir(events)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names still raise AttributeError."""
+        import werewolf.events as events
+
+        with pytest.raises(AttributeError):
+            events.NotAnEvent
+
+
 class TestGameEventLog:
     """Tests for GameEventLog."""
 
@@ -348,6 +393,17 @@ class TestGameEventLogQueries:
 class TestGameEventLogSerialization:
     """Tests for GameEventLog YAML serialization."""
 
+    def test_to_json_round_trip(self):
+        """Test that to_json output validates back into an equal log."""
+        log = GameEventLog(game_id="json", player_count=12, roles_secret={0: "WEREWOLF"})
+        log.add_phase(PhaseLog(number=1, kind=Phase.NIGHT))
+
+        restored = GameEventLog.model_validate_json(log.to_json(include_roles=True))
+
+        assert restored == log
+        assert GameEventLog.model_validate_json(log.to_json()).roles_secret == {}
+        assert log.roles_secret == {0: "WEREWOLF"}
+
     def test_to_yaml_basic(self):
         """Test basic to_yaml serialization."""
         log = GameEventLog(player_count=12)
@@ -652,3 +708,57 @@ class TestIntegration:
         assert "GameOver" in yaml_str or "GAME_OVER" in yaml_str
         assert "WEREWOLF" in yaml_str
         assert "deaths" in yaml_str.lower()
+
+
+class TestEventFormatter:
+    """Tests for EventFormatter dispatch."""
+
+    def test_dispatch_table_covers_every_concrete_event(self):
+        """Test that every leaf event class has a formatter."""
+        def leaves(cls):
+            subclasses = cls.__subclasses__()
+            if not subclasses:
+                return {cls}
+            return set().union(*(leaves(sub) for sub in subclasses))
+
+        assert set(_DISPATCH_TABLE) == leaves(GameEvent)
+
+    def test_format_uses_role_seat_notation(self):
+        """Test that dispatched events are formatted with ROLE(seat)."""
+        formatter = EventFormatter({0: "WEREWOLF", 7: "SEER"})
+
+        kill = WerewolfKill(day=1, actor=0, target=7)
+        vote = Vote(day=1, actor=7, target=None)
+
+        assert formatter.format(kill) == "WEREWOLF(0) killed SEER(7)"
+        assert formatter.format(vote) == "SEER(7) abstained"
+
+    def test_role_seat_labels(self):
+        """Test ROLE(seat) labels for known, unknown and missing seats."""
+        formatter = EventFormatter({3: "WITCH"})
+
+        assert formatter._role_seat(3) == "WITCH(3)"
+        assert formatter._role_seat(3) is formatter._role_seat(3)
+        assert formatter._role_seat(9) == "Unknown(9)"
+        assert formatter._role_seat(None) == "(unknown)"
+
+    def test_speech_preview_is_truncated(self):
+        """Test that long speeches are cut to 40 characters plus "..."."""
+        formatter = EventFormatter({2: "VILLAGER"})
+        short = Speech(day=1, actor=2, micro_phase=SubPhase.DISCUSSION, content="x" * 40)
+        long = Speech(day=1, actor=2, micro_phase=SubPhase.DISCUSSION, content="y" * 41)
+
+        assert formatter.format(short) == 'VILLAGER(2) (discussion): "' + "x" * 40 + '"'
+        assert formatter.format(long) == 'VILLAGER(2) (discussion): "' + "y" * 40 + '..."'
+
+    def test_preview_truncates_long_text_only(self):
+        """Test the shared preview helper at and past the limit."""
+        assert preview("abc", 3) == "abc"
+        assert preview("abcd", 3) == "abc..."
+        assert preview("", 3) == ""
+
+    def test_unknown_event_falls_back_to_str(self):
+        """Test that an event class without a formatter is rendered by str()."""
+        event = GameEvent(phase=Phase.DAY)
+
+        assert EventFormatter({}).format(event) == str(event)
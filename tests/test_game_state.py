@@ -22,6 +22,11 @@ def create_test_player(seat: int, role: Role, is_alive: bool = True) -> Player:
     )
 
 
+def _mask(seats: set[int]) -> int:
+    """Bitmask with one bit per seat."""
+    return sum(1 << seat for seat in seats)
+
+
 def create_test_players() -> dict[int, Player]:
     """Create standard 12-player setup for testing."""
     return {
@@ -49,7 +54,6 @@ class TestGameStateCreation:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
         assert state.day == 1
         assert state.sheriff is None
@@ -60,13 +64,22 @@ class TestGameStateCreation:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
             sheriff=5,
             day=3,
         )
         assert state.day == 3
         assert state.sheriff == 5
 
+    def test_dead_players_is_not_a_field(self):
+        """Test that the derived dead_players cannot be passed in."""
+        players = create_test_players()
+        with pytest.raises(ValidationError):
+            GameState(
+                players=players,
+                living_players=set(players.keys()),
+                dead_players={0},
+            )
+
 
 class TestApplyEvents:
     """Tests for apply_events method."""
@@ -77,7 +90,6 @@ class TestApplyEvents:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         death_event = DeathEvent(
@@ -100,7 +112,6 @@ class TestApplyEvents:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         deaths = [
@@ -133,7 +144,6 @@ class TestApplyEvents:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
             sheriff=4,  # Seer is sheriff
         )
 
@@ -158,7 +168,6 @@ class TestApplyEvents:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         death_event = DeathEvent(
@@ -177,13 +186,85 @@ class TestApplyEvents:
         assert 7 in state.dead_players
         assert 0 in state.dead_players
 
+    def test_apply_batch_with_hunter_shooting_batch_victim(self):
+        """Test a hunter shot at a player who dies in the same batch."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()),
+        )
+
+        state.apply_events([
+            DeathEvent(
+                actor=7,  # Hunter
+                cause=DeathCause.WEREWOLF_KILL,
+                day=2,
+                phase=Phase.DAY,
+                micro_phase=SubPhase.DEATH_RESOLUTION,
+                hunter_shoot_target=8,
+            ),
+            DeathEvent(
+                actor=8,
+                cause=DeathCause.POISON,
+                day=2,
+                phase=Phase.DAY,
+                micro_phase=SubPhase.DEATH_RESOLUTION,
+            ),
+        ])
+
+        assert state.dead_players == {7, 8}
+        assert state.living_mask == _mask(set(players.keys()) - {7, 8})
+        assert not players[7].is_alive
+        assert not players[8].is_alive
+
+    def test_apply_batch_with_chained_hunter_shots(self):
+        """Test hunter shots from several deaths in one batch are all applied."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()) - {2},
+        )
+
+        state.apply_events([
+            DeathEvent(
+                actor=7,
+                cause=DeathCause.WEREWOLF_KILL,
+                day=2,
+                phase=Phase.DAY,
+                micro_phase=SubPhase.DEATH_RESOLUTION,
+                hunter_shoot_target=9,
+            ),
+            DeathEvent(
+                actor=9,
+                cause=DeathCause.POISON,
+                day=2,
+                phase=Phase.DAY,
+                micro_phase=SubPhase.DEATH_RESOLUTION,
+                hunter_shoot_target=0,
+            ),
+        ])
+
+        assert state.dead_players == {0, 2, 7, 9}
+        assert not players[0].is_alive
+        # A shot at an already-dead seat changes nothing
+        state.apply_events([
+            DeathEvent(
+                actor=1,
+                cause=DeathCause.BANISHMENT,
+                day=3,
+                phase=Phase.DAY,
+                micro_phase=SubPhase.DEATH_RESOLUTION,
+                hunter_shoot_target=2,
+            ),
+        ])
+        assert state.dead_players == {0, 1, 2, 7, 9}
+
     def test_apply_non_death_events_ignored(self):
         """Test that non-death events are ignored."""
         players = create_test_players()
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         # Create a non-death event
@@ -200,6 +281,55 @@ class TestApplyEvents:
         assert len(state.dead_players) == 0
 
 
+class TestCopyForDay:
+    """Tests for copy_for_day method."""
+
+    def test_copy_is_independent(self):
+        """Test that mutating the copy leaves the original untouched."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()),
+            sheriff=4,
+            day=2,
+        )
+
+        copy = state.copy_for_day()
+        copy.apply_events([DeathEvent(
+            actor=4,
+            cause=DeathCause.BANISHMENT,
+            day=2,
+            phase=Phase.DAY,
+            micro_phase=SubPhase.BANISHMENT_RESOLUTION,
+            badge_transfer_to=8,
+        )])
+
+        assert copy.day == 2
+        assert 4 not in copy.living_players
+        assert copy.sheriff == 8
+        assert copy.players[8].is_sheriff
+
+        assert 4 in state.living_players
+        assert len(state.dead_players) == 0
+        assert state.sheriff == 4
+        assert players[4].is_alive
+        assert not players[8].is_sheriff
+
+    def test_copy_looks_up_its_own_players(self):
+        """Test that seat lookups on the copy return the copied players."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()),
+        )
+
+        copy = state.copy_for_day()
+
+        assert copy.get_player(3) is copy.players[3]
+        assert copy.get_player(3) is not state.get_player(3)
+        assert copy.get_player(-1) is None
+
+
 class TestIsGameOver:
     """Tests for is_game_over method."""
 
@@ -209,7 +339,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         is_over, winner = state.is_game_over()
@@ -224,7 +353,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={0, 1, 2, 3},
         )
 
         is_over, winner = state.is_game_over()
@@ -239,7 +367,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={4, 5, 6, 7},
         )
 
         is_over, winner = state.is_game_over()
@@ -254,13 +381,25 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={8, 9, 10, 11},
         )
 
         is_over, winner = state.is_game_over()
         assert is_over
         assert winner == "WEREWOLF"
 
+    def test_result_refreshes_after_deaths(self):
+        """Test that a cached result is not reused once players die."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players={0, 4, 8},
+        )
+        assert state.is_game_over() == (False, None)
+        assert state.is_game_over() == (False, None)
+
+        state.apply_events_from_deaths({0: DeathCause.BANISHMENT})
+        assert state.is_game_over() == (True, "VILLAGER")
+
     def test_game_continues_with_mixed_survivors(self):
         """Test game continues with mixed survivors."""
         players = create_test_players()
@@ -269,7 +408,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={1, 2, 3, 5, 6, 7, 10, 11},
         )
 
         is_over, winner = state.is_game_over()
@@ -287,7 +425,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={0, 1, 2, 3, 8, 9, 10, 11},
         )
 
         is_over, winner = state.is_game_over()
@@ -306,7 +443,6 @@ class TestIsGameOver:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={0, 1, 2, 3, 4, 5, 6, 7},
         )
 
         is_over, winner = state.is_game_over()
@@ -323,7 +459,6 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         player = state.get_player(4)
@@ -337,7 +472,6 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         player = state.get_player(99)
@@ -350,7 +484,6 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         assert state.is_alive(4)
@@ -358,13 +491,90 @@ class TestHelperMethods:
         assert not state.is_alive(0)
         assert not state.is_alive(99)  # Non-existent player
 
+    def test_is_dead(self):
+        """Test that is_dead only holds for seats with a dead player."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players={4, 5, 6},
+        )
+
+        assert state.is_dead(0)
+        assert not state.is_dead(4)
+        assert not state.is_dead(99)  # Non-existent player
+        assert not state.is_dead(-1)
+
+    def test_living_mask_tracks_deaths(self):
+        """Test that living_mask stays in sync with living_players."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players={0, 4, 7},
+        )
+        assert state.living_mask == 0b10010001
+
+        state.apply_events([DeathEvent(
+            actor=7,
+            cause=DeathCause.WEREWOLF_KILL,
+            day=1,
+            phase=Phase.NIGHT,
+            micro_phase=SubPhase.NIGHT_RESOLUTION,
+            hunter_shoot_target=0,
+        )])
+        assert state.living_mask == 0b10000
+        assert not state.is_alive(0)
+
+        state.living_players = {1, 2}
+        assert state.living_mask == 0b110
+        assert state.is_alive(2)
+
+    def test_living_players_is_a_read_only_view(self):
+        """Test that living_players cannot be mutated out of sync with the mask."""
+        players = create_test_players()
+        state = GameState(players=players, living_players=set(players.keys()))
+
+        with pytest.raises(AttributeError):
+            state.living_players.discard(0)
+
+        assert state.living_players == frozenset(players.keys())
+        assert state.get_werewolf_count() == 4
+        assert not state.is_game_over()[0]
+
+    def test_dead_players_derived_from_living_mask(self):
+        """Test that dead_players is every player seat outside living_players."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()) - {3, 9},
+        )
+        assert state.dead_players == {3, 9}
+        assert state.dead_mask == (1 << 3) | (1 << 9)
+
+        state.apply_events_from_deaths({5: DeathCause.WEREWOLF_KILL})
+        assert state.dead_players == {3, 5, 9}
+
+    def test_deaths_of_dead_seats_keep_epoch(self):
+        """Test that a deaths dict naming only dead seats changes nothing."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()) - {3},
+        )
+        epoch = state.epoch
+
+        state.apply_events_from_deaths({3: DeathCause.POISON})
+        assert state.epoch == epoch
+
+        state.apply_events_from_deaths({3: DeathCause.POISON, 4: DeathCause.WEREWOLF_KILL})
+        assert state.epoch == epoch + 1
+        assert state.dead_players == {3, 4}
+
     def test_is_werewolf(self):
         """Test checking if player is werewolf."""
         players = create_test_players()
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
         )
 
         assert state.is_werewolf(0)
@@ -374,6 +584,34 @@ class TestHelperMethods:
         assert not state.is_werewolf(8)  # Ordinary Villager
         assert not state.is_werewolf(99)  # Non-existent
 
+    def test_get_role_mask(self):
+        """Test seat masks per role include dead players."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players={4, 5},
+        )
+
+        assert state.get_role_mask(Role.WEREWOLF) == _mask({0, 1, 2, 3})
+        assert state.get_role_mask(Role.SEER) == _mask({4})
+        assert state.living_mask & state.get_role_mask(Role.WEREWOLF) == 0
+
+    def test_get_living_role_seats(self):
+        """Test living seats per role are ordered and follow deaths."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()) - {1},
+        )
+
+        assert state.get_living_role_seats(Role.WEREWOLF) == (0, 2, 3)
+        assert state.get_living_role_seats(Role.SEER) == (4,)
+        assert state.get_living_role_seats(Role.VILLAGER) == ()
+
+        state.apply_events_from_deaths({2: DeathCause.POISON, 4: DeathCause.WEREWOLF_KILL})
+        assert state.get_living_role_seats(Role.WEREWOLF) == (0, 3)
+        assert state.get_living_role_seats(Role.SEER) == ()
+
     def test_get_werewolf_count(self):
         """Test counting werewolves."""
         players = create_test_players()
@@ -381,7 +619,6 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         assert state.get_werewolf_count() == 1
@@ -393,7 +630,6 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         assert state.get_god_count() == 4
@@ -405,18 +641,51 @@ class TestHelperMethods:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         assert state.get_ordinary_villager_count() == 2
 
+    def test_role_counts_follow_deaths(self):
+        """Test that victory-group counts drop as deaths are applied."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players={0, 1, 4, 8, 9},
+        )
+
+        state.apply_events_from_deaths({
+            0: DeathCause.BANISHMENT,
+            4: DeathCause.POISON,
+            8: DeathCause.WEREWOLF_KILL,
+        })
+
+        assert state.get_werewolf_count() == 1
+        assert state.get_god_count() == 0
+        assert state.get_ordinary_villager_count() == 1
+
+    def test_role_counts_follow_players_reassignment(self):
+        """Test that replacing players rebuilds the per-role counts."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()),
+        )
+        assert state.get_werewolf_count() == 4
+
+        state.players = {
+            0: create_test_player(0, Role.SEER),
+            1: create_test_player(1, Role.WEREWOLF),
+        }
+        assert state.get_werewolf_count() == 1
+        assert state.get_god_count() == 1
+        assert state.get_ordinary_villager_count() == 0
+
     def test_is_sheriff(self):
         """Test checking if player is sheriff."""
         players = create_test_players()
         state = GameState(
             players=players,
             living_players=set(players.keys()),
-            dead_players=set(),
             sheriff=5,
         )
 
@@ -434,7 +703,6 @@ class TestEdgeCases:
         state = GameState(
             players=players,
             living_players=set(),
-            dead_players=set(players.keys()),
         )
 
         is_over, winner = state.is_game_over()
@@ -448,7 +716,6 @@ class TestEdgeCases:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         is_over, winner = state.is_game_over()
@@ -462,7 +729,6 @@ class TestEdgeCases:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(players.keys()) - living,
         )
 
         is_over, winner = state.is_game_over()
@@ -474,7 +740,6 @@ class TestEdgeCases:
         state = GameState(
             players={},
             living_players=set(),
-            dead_players=set(),
         )
 
         death_event = DeathEvent(
@@ -487,3 +752,29 @@ class TestEdgeCases:
 
         # Should not raise
         state.apply_events([death_event])
+
+    def test_negative_seats_are_ignored(self):
+        """Test that deaths for a negative seat are skipped, not shifted."""
+        players = create_test_players()
+        state = GameState(
+            players=players,
+            living_players=set(players.keys()),
+        )
+
+        state.apply_events_from_deaths({-1: DeathCause.POISON})
+        assert state.living_players == set(players.keys())
+        assert state.epoch == 0
+
+        death_event = DeathEvent(
+            actor=-1,
+            cause=DeathCause.BANISHMENT,
+            day=1,
+            phase=Phase.DAY,
+            micro_phase=SubPhase.DEATH_RESOLUTION,
+            badge_transfer_to=8,
+            hunter_shoot_target=-2,
+        )
+        state.apply_events([death_event])
+
+        assert state.living_players == set(players.keys())
+        assert state.sheriff == 8
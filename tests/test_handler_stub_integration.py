@@ -198,6 +198,8 @@ class TestWerewolfHandlerIntegration:
         assert event.actor in werewolf_seats
         # Target should be valid (living or -1 for skip)
         assert event.target in night1_context.living_players or event.target == -1
+        # Decoded target matches the logged event
+        assert result.kill_target == event.target
 
     @pytest.mark.asyncio
     async def test_werewolf_consensus_with_multiple_stubs(self, night1_context: PhaseContext):
@@ -270,6 +272,11 @@ class TestWitchHandlerIntegration:
         event = result.subphase_log.events[0]
         assert type(event).__name__ == "WitchAction"
         assert event.actor == witch_seat
+        # Decoded targets match the logged event
+        is_antidote = event.action_type == WitchActionType.ANTIDOTE
+        is_poison = event.action_type == WitchActionType.POISON
+        assert result.antidote_target == (event.target if is_antidote else None)
+        assert result.poison_target == (event.target if is_poison else None)
 
     @pytest.mark.asyncio
     async def test_witch_pass_with_stub(self, night1_context: PhaseContext):
@@ -324,6 +331,7 @@ class TestGuardHandlerIntegration:
         event = result.subphase_log.events[0]
         assert type(event).__name__ == "GuardAction"
         assert event.actor == guard_seat
+        assert result.guard_target == event.target
 
 
 # ============================================================================
@@ -16,6 +16,8 @@ from werewolf.events import (
     Speech,
     DeathEvent,
     DeathCause,
+    EventKind,
+    Banishment,
 )
 from werewolf.models import (
     Player,
@@ -177,6 +179,15 @@ def test_str_methods():
     assert "..." in str(long_speech)
 
 
+def test_event_kind_tags():
+    """Test that event classes carry their kind tag without serializing it."""
+    ban = Banishment(day=1, banished=3)
+    assert ban.KIND is EventKind.BANISHMENT
+    assert Vote(day=1, actor=0, target=3).KIND is EventKind.VOTE
+    assert DeathEvent(day=1, actor=0, cause=DeathCause.POISON).KIND is EventKind.DEATH
+    assert "KIND" not in ban.model_dump()
+
+
 def test_role_config():
     """Test role configuration."""
     assert len(STANDARD_12_PLAYER_CONFIG) == 6
@@ -28,7 +28,6 @@ def make_test_state(
     return GameState(
         players=players,
         living_players=living_set,
-        dead_players=dead_set,
     )
 
 
@@ -1,6 +1,8 @@
 """Tests for NightActionStore component."""
 
 import pytest
+from pydantic import ValidationError
+
 from werewolf.engine.night_action_store import NightActionStore, NightActionSnapshot
 
 
@@ -47,6 +49,29 @@ class TestNightActionStore:
         assert not hasattr(snapshot, "poison_target")
         assert not hasattr(snapshot, "guard_target")
 
+    def test_default_snapshot_is_shared_and_frozen(self) -> None:
+        """Test that stores without persistent state share one snapshot."""
+        snapshot = NightActionStore(kill_target=3).snapshot()
+
+        assert snapshot is NightActionStore().snapshot()
+        with pytest.raises(ValidationError):
+            snapshot.antidote_used = True
+
+        # Updating a restored store leaves the shared snapshot untouched
+        store = NightActionStore.from_snapshot(snapshot)
+        store.seer_checks |= 1 << 4
+        assert snapshot.seer_checks == 0
+
+    def test_seer_checks_mask_survives_snapshot(self) -> None:
+        """Test that the seer_checks seat bitmask round-trips via snapshot."""
+        store = NightActionStore(seer_checks=(1 << 2) | (1 << 7))
+
+        restored = NightActionStore.from_snapshot(store.snapshot())
+
+        assert restored.seer_checks == (1 << 2) | (1 << 7)
+        assert (restored.seer_checks >> 7) & 1
+        assert not (restored.seer_checks >> 3) & 1
+
     def test_from_snapshot_creates_store(self) -> None:
         """Test that from_snapshot() creates a store with snapshot values."""
         snapshot = NightActionSnapshot(
@@ -68,6 +93,26 @@ class TestNightActionStore:
         assert store.poison_target is None
         assert store.guard_target is None
 
+    def test_next_night_matches_snapshot_restore(self) -> None:
+        """Test that next_night() equals from_snapshot(snapshot())."""
+        store = NightActionStore(
+            antidote_used=True,
+            guard_prev_target=4,
+            seer_checks=1 << 7,
+            kill_target=2,
+            poison_target=1,
+            guard_target=6,
+        )
+
+        new_store = store.next_night()
+
+        assert new_store == NightActionStore.from_snapshot(store.snapshot())
+        assert new_store is not store
+        new_store.kill_target = 5
+        new_store.seer_checks |= 1 << 3
+        assert store.kill_target == 2
+        assert store.seer_checks == 1 << 7
+
     def test_snapshot_restore_cycle(self) -> None:
         """Test complete snapshot/restore cycle."""
         # Create initial store with some state
@@ -142,6 +187,15 @@ class TestNightActionStore:
         assert store.poison_used is True
         assert store.guard_prev_target == 5
 
+    def test_target_masks(self) -> None:
+        """Test that target masks are one-hot, or zero when unset."""
+        store = NightActionStore(kill_target=3, guard_target=0)
+
+        assert store.kill_mask == 1 << 3
+        assert store.guard_mask == 1
+        assert store.antidote_mask == 0
+        assert store.poison_mask == 0
+
     def test_model_serialization(self) -> None:
         """Test that models can be serialized and deserialized."""
         store = NightActionStore(
@@ -1,5 +1,7 @@
 """Tests for NightScheduler - night phase orchestration."""
 
+import asyncio
+import inspect
 import random
 import pytest
 from typing import Optional
@@ -9,6 +11,9 @@ from werewolf.engine import (
     NightActionStore,
     EventCollector,
     NightScheduler,
+    NoOpValidator,
+    CollectingValidator,
+    create_validator,
 )
 from werewolf.models import (
     Player,
@@ -58,7 +63,6 @@ def state(players: dict[int, Player]) -> GameState:
     return GameState(
         players=players,
         living_players=set(players.keys()),
-        dead_players=set(),
         sheriff=None,
         day=1,
     )
@@ -109,6 +113,68 @@ class TestNightSchedulerBasic:
         assert hasattr(scheduler, "_resolver")
         assert hasattr(scheduler, "_death_handler")
 
+    def test_noop_validator_uses_none_fast_path(self):
+        """Test that production validators collapse to None."""
+        assert create_validator() is None
+        assert NightScheduler(validator=NoOpValidator())._validator is None
+
+        collecting = CollectingValidator()
+        assert NightScheduler(validator=collecting)._validator is collecting
+
+    def test_only_used_validator_hooks_are_bound(self):
+        """Test that hooks missing from hooks_used are skipped."""
+        collecting = CollectingValidator()
+        scheduler = NightScheduler(validator=collecting)
+
+        assert scheduler._on_subphase_start is None
+        assert scheduler._on_subphase_end == collecting.on_subphase_end
+        assert scheduler._on_phase_start == collecting.on_phase_start
+
+        class SubphaseOnlyValidator(NoOpValidator):
+            hooks_used = frozenset({"on_subphase_end"})
+
+        scheduler = NightScheduler(validator=SubphaseOnlyValidator())
+        assert scheduler._on_subphase_end is not None
+        assert scheduler._on_phase_start is None
+        assert scheduler._on_death_chain_complete is None
+
+    @pytest.mark.asyncio
+    async def test_async_validator_hooks_are_awaited(
+        self,
+        state: GameState,
+        actions: NightActionStore,
+        collector: EventCollector,
+        participants: dict[int, StubPlayer],
+    ):
+        """Test that a scheduler given an async validator awaits its hooks."""
+        subphases: list[SubPhase] = []
+
+        class AsyncSubphaseValidator:
+            hooks_used = frozenset({"on_subphase_start"})
+
+            async def on_subphase_start(self, subphase, day, state):
+                await asyncio.sleep(0)
+                subphases.append(subphase)
+
+        scheduler = NightScheduler(validator=AsyncSubphaseValidator())
+        assert scheduler._validator_is_async
+
+        await scheduler.run_night(state, actions, collector, participants)
+
+        assert subphases[0] == SubPhase.WEREWOLF_ACTION
+        assert subphases[-1] == SubPhase.NIGHT_RESOLUTION
+
+    def test_validator_hooks_are_synchronous(self):
+        """Test that validator hooks are called directly, not awaited."""
+        hooks = [name for name in dir(NoOpValidator) if name.startswith("on_")]
+
+        assert hooks
+        for name in hooks:
+            assert not inspect.iscoroutinefunction(getattr(NoOpValidator, name)), name
+            assert not inspect.iscoroutinefunction(
+                getattr(CollectingValidator, name)
+            ), name
+
 
 class TestNightSchedulerRunNight:
     """Tests for run_night method."""
@@ -201,6 +267,32 @@ class TestNightSchedulerRunNight:
         # Actions should be preserved (persistent state)
         assert new_actions is not None
 
+    @pytest.mark.asyncio
+    async def test_run_night_carries_guard_target_forward(
+        self,
+        scheduler: NightScheduler,
+        state: GameState,
+        collector: EventCollector,
+        participants: dict[int, StubPlayer],
+    ):
+        """Test tonight's guard target becomes guard_prev_target, input untouched."""
+        actions = NightActionStore(guard_prev_target=None)
+
+        _, new_actions, new_collector, _ = await scheduler.run_night(
+            state, actions, collector, participants
+        )
+
+        guard_events = [
+            e for e in new_collector.get_events()
+            if e.__class__.__name__ == "GuardAction"
+        ]
+        expected = guard_events[0].target if guard_events else None
+        assert new_actions is not actions
+        assert new_actions.guard_prev_target == expected
+        assert new_actions.guard_target is None
+        assert new_actions.kill_target is None
+        assert actions == NightActionStore()
+
 
 class TestNightSchedulerEdgeCases:
     """Edge case tests for NightScheduler."""
@@ -222,7 +314,6 @@ class TestNightSchedulerEdgeCases:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players=set(werewolf_seats),
             sheriff=None,
             day=1,
         )
@@ -268,7 +359,6 @@ class TestNightSchedulerEdgeCases:
         state = GameState(
             players=players,
             living_players=living,
-            dead_players={witch_seat},
             sheriff=None,
             day=1,
         )
@@ -359,6 +449,50 @@ class TestNightSchedulerEdgeCases:
         )
 
 
+class TestNightSchedulerGuardSeerParallel:
+    """Tests that GuardAction and SeerAction are queried concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_guard_and_seer_decide_concurrently(
+        self,
+        scheduler: NightScheduler,
+        state: GameState,
+        actions: NightActionStore,
+        collector: EventCollector,
+        participants: dict[int, StubPlayer],
+    ):
+        """Test guard and seer are both awaiting a decision at the same time."""
+        entered = asyncio.Event()
+        waiting: list["GatedPlayer"] = []
+        overlapped: list[bool] = []
+
+        class GatedPlayer(StubPlayer):
+            async def decide(self, *args, **kwargs):
+                waiting.append(self)
+                if len(waiting) == 2:
+                    entered.set()
+                try:
+                    await asyncio.wait_for(entered.wait(), timeout=1.0)
+                    overlapped.append(True)
+                except asyncio.TimeoutError:
+                    overlapped.append(False)
+                return await super().decide(*args, **kwargs)
+
+        for seat, player in state.players.items():
+            if player.role in (Role.GUARD, Role.SEER):
+                participants[seat] = GatedPlayer(seed=seat)
+
+        _, _, new_collector, _ = await scheduler.run_night(
+            state, actions, collector, participants
+        )
+
+        assert overlapped[:2] == [True, True]
+        # Logs still follow the documented Guard -> Seer order
+        night_phase = new_collector.get_event_log().phases[-1]
+        order = [sp.micro_phase for sp in night_phase.subphases]
+        assert order.index(SubPhase.GUARD_ACTION) < order.index(SubPhase.SEER_ACTION)
+
+
 class TestNightSchedulerDayProgression:
     """Tests for day progression in NightScheduler."""
 
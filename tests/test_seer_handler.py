@@ -665,7 +665,6 @@ class TestRealSeerHandler:
         state = GameState(
             players=players,
             living_players={0, 1, 4},
-            dead_players=set(),
             sheriff=None,
             day=1,
         )
@@ -705,6 +704,58 @@ class TestRealSeerHandler:
             "This indicates the handler is hardcoding GOOD instead of computing from target's role."
         )
 
+    @pytest.mark.asyncio
+    async def test_real_handler_skips_when_all_seats_checked(self):
+        """Test that the real SeerHandler skips once seer_checks covers every other living seat."""
+        from werewolf.handlers.seer_handler import SeerHandler as RealSeerHandler
+        from werewolf.handlers.seer_handler import PhaseContext
+
+        players = {
+            4: Player(seat=4, name="Seer", role=Role.SEER, is_alive=True),
+            0: Player(seat=0, name="Werewolf1", role=Role.WEREWOLF, is_alive=True),
+            1: Player(seat=1, name="Villager1", role=Role.ORDINARY_VILLAGER, is_alive=True),
+        }
+        context = PhaseContext(
+            players=players,
+            living_players={0, 1, 4},
+            dead_players=set(),
+            sheriff=None,
+            day=2,
+        )
+
+        handler = RealSeerHandler()
+        result = await handler(
+            context, [(4, MockParticipant("0"))], seer_checks=(1 << 0) | (1 << 1)
+        )
+
+        assert result.subphase_log.events == []
+
+    @pytest.mark.asyncio
+    async def test_real_handler_accepts_seer_checks_as_a_set(self):
+        """Test that seer_checks given as a set of seats (the old form) still works."""
+        from werewolf.handlers.seer_handler import SeerHandler as RealSeerHandler
+        from werewolf.handlers.seer_handler import PhaseContext
+
+        players = {
+            4: Player(seat=4, name="Seer", role=Role.SEER, is_alive=True),
+            0: Player(seat=0, name="Werewolf1", role=Role.WEREWOLF, is_alive=True),
+            1: Player(seat=1, name="Villager1", role=Role.ORDINARY_VILLAGER, is_alive=True),
+        }
+        context = PhaseContext(
+            players=players,
+            living_players={0, 1, 4},
+            dead_players=set(),
+            sheriff=None,
+            day=2,
+        )
+
+        handler = RealSeerHandler()
+        choices = handler.build_choice_spec(context, 4, {0})
+        assert [option.value for option in choices.options] == ["1"]
+
+        result = await handler(context, [(4, MockParticipant("0"))], seer_checks={0, 1})
+        assert result.subphase_log.events == []
+
 
 # ============================================================================
 # Tests for SeerAction Valid Scenarios
@@ -27,7 +27,8 @@ import pytest
 from werewolf.models import Player, Role, STANDARD_12_PLAYER_CONFIG, create_players_from_config
 from werewolf.engine import WerewolfGame, CollectingValidator
 from werewolf.ai.stub_ai import create_stub_player
-from werewolf.events import GameOver, VictoryCondition, Phase
+from werewolf.events import GameOver, VictoryCondition, Phase, DeathCause
+from werewolf.events.game_events import DeathEvent
 from werewolf.post_game_validator import PostGameValidator
 
 
@@ -832,6 +833,27 @@ class TestStressTestSmall:
         print(f"\n[OK] Quick stress test passed: {num_games}/10 games valid")
         print(f"  Winners: {dict(Counter(winners))}")
 
+    @pytest.mark.asyncio
+    async def test_post_game_validator_reports_unknown_death_seat(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that a death for a non-existent seat is reported, not raised."""
+        players_copy = deep_copy_players(standard_players)
+        game = WerewolfGame(
+            players=players_copy,
+            participants=create_participants(players_copy, seed=7),
+            seed=7,
+        )
+        event_log, _ = await game.run()
+
+        day_1 = event_log.get_day(1)
+        day_1.subphases[-1].events.append(
+            DeathEvent(day=1, actor=-1, cause=DeathCause.BANISHMENT)
+        )
+        result = PostGameValidator(event_log).validate()
+
+        assert "I.1" in [v.rule_id for v in result.violations]
+
     async def _run_single_game(
         self,
         game: WerewolfGame,
@@ -269,13 +269,31 @@ class TestWerewolfGameGameFlow:
         assert event_log.game_over is not None
         assert event_log.game_over.final_turn_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_final_state_is_stored_on_game(self, standard_players: dict[int, Player]):
+        """Test that run() leaves the final state and collector on the game."""
+        participants = create_participants(standard_players, seed=161719)
+
+        game = WerewolfGame(
+            players=standard_players,
+            participants=participants,
+        )
+
+        event_log, winner = await game.run()
+
+        assert game._collector.get_event_log() is event_log
+        is_over, final_winner = game._state.is_game_over()
+        if is_over:
+            assert final_winner == winner
+        else:
+            assert winner == "TIE"
+
     @pytest.mark.asyncio
     async def test_all_players_start_alive(self, standard_players: dict[int, Player]):
         """Test that all players are initially alive."""
         state = GameState(
             players=standard_players,
             living_players=set(standard_players.keys()),
-            dead_players=set(),
         )
 
         assert len(state.living_players) == 12
@@ -392,6 +410,22 @@ class TestWerewolfGameEventLogStructure:
         assert event_log.game_id is not None
         assert len(event_log.game_id) > 0
 
+    @pytest.mark.asyncio
+    async def test_game_start_records_every_role(self, standard_players: dict[int, Player]):
+        """Test that GameStart and the event log carry each seat's role."""
+        participants = create_participants(standard_players, seed=252526)
+
+        game = WerewolfGame(
+            players=standard_players,
+            participants=participants,
+        )
+
+        event_log, _ = await game.run()
+
+        expected = {seat: p.role.value for seat, p in standard_players.items()}
+        assert event_log.game_start.roles_secret == expected
+        assert event_log.roles_secret == expected
+
     @pytest.mark.asyncio
     async def test_event_log_has_creation_timestamp(self, standard_players: dict[int, Player]):
         """Test that event log has a creation timestamp."""
@@ -505,21 +539,202 @@ class TestWerewolfGameValidator:
         validator = CollectingValidator()
 
         # Create an intentionally inconsistent state
+        players = {seat: p.model_copy() for seat, p in standard_players.items()}
+        players[0].is_alive = False  # Player 0 is marked dead but still in living_players
         state = GameState(
-            players=standard_players,
-            living_players=set(standard_players.keys()),
-            dead_players={0},  # Player 0 is marked dead but also in living_players
+            players=players,
+            living_players=set(players.keys()),
         )
 
         # Validate - should detect the inconsistency
         violations = validate_state_consistency(state, None)
 
-        # Should find at least one violation for M.2 (living & dead not disjoint)
+        # Should find at least one violation for M.3 (is_alive vs living_players)
         rule_ids = [v.rule_id for v in violations]
-        assert "M.2" in rule_ids, (
-            f"Expected M.2 violation for overlapping living/dead sets, got: {rule_ids}"
+        assert "M.3" in rule_ids, (
+            f"Expected M.3 violation for is_alive/living_players mismatch, got: {rule_ids}"
+        )
+
+    def test_validator_detects_living_seat_without_player(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that M.1 flags a living seat that holds no player."""
+        from werewolf.validation.state_consistency import validate_state_consistency
+
+        state = GameState(
+            players=standard_players,
+            living_players=set(standard_players.keys()) | {99},
+        )
+
+        violations = validate_state_consistency(state, None)
+
+        assert "M.1" in [v.rule_id for v in violations]
+        assert "M.3" not in [v.rule_id for v in violations]
+
+    def test_subphase_history_is_tracked_per_night(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that out-of-order night subphases are caught within one night only."""
+        from werewolf.engine import CollectingValidator, EventCollector
+        from werewolf.events import SubPhase
+
+        validator = CollectingValidator()
+        collector = EventCollector(day=1)
+        state = GameState(
+            players=standard_players,
+            living_players=set(standard_players.keys()),
         )
 
+        validator.on_subphase_end(SubPhase.WITCH_ACTION, 1, Phase.NIGHT, state, collector)
+        validator.on_subphase_end(SubPhase.WEREWOLF_ACTION, 1, Phase.NIGHT, state, collector)
+        assert "C.4" in [v.rule_id for v in validator.get_violations()]
+
+        validator.clear()
+        validator.on_subphase_end(SubPhase.WITCH_ACTION, 1, Phase.NIGHT, state, collector)
+        validator.on_subphase_end(SubPhase.WEREWOLF_ACTION, 2, Phase.NIGHT, state, collector)
+        assert validator.get_violations() == []
+
+    def test_batched_events_match_per_event_hook(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that on_events_applied reports what on_event_applied would."""
+        from werewolf.engine import CollectingValidator
+        from werewolf.events.game_events import GuardAction, WerewolfKill
+
+        players = {seat: p.model_copy() for seat, p in standard_players.items()}
+        players[0].is_alive = False
+        state = GameState(players=players, living_players=set(players.keys()))
+        events = [
+            WerewolfKill(day=1, actor=1, target=3),
+            GuardAction(day=1, actor=2, target=3),
+        ]
+
+        per_event = CollectingValidator()
+        for event in events:
+            per_event.on_event_applied(event, state)
+        batched = CollectingValidator()
+        batched.on_events_applied(events, state)
+
+        assert batched.get_violations() == per_event.get_violations()
+        assert "M.3" in [v.rule_id for v in batched.get_violations()]
+
+    @pytest.mark.asyncio
+    async def test_partial_validator_runs_full_game(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that hooks missing from hooks_used are never called."""
+        calls: list[tuple[str, Phase]] = []
+
+        class PhaseStartValidator:
+            hooks_used = frozenset({"on_phase_start"})
+
+            def on_phase_start(self, phase, day, state):
+                calls.append(("on_phase_start", phase))
+
+        game = WerewolfGame(
+            players=standard_players,
+            participants=create_participants(standard_players, seed=42),
+            validator=PhaseStartValidator(),
+        )
+
+        event_log, winner = await game.run()
+
+        assert event_log.game_over is not None
+        assert ("on_phase_start", Phase.NIGHT) in calls
+        assert ("on_phase_start", Phase.DAY) in calls
+
+    @pytest.mark.asyncio
+    async def test_async_validator_hooks_see_state_at_hook_site(self):
+        """Test that async hooks are awaited inline and see the same state as sync ones."""
+
+        class SyncRecorder:
+            hooks_used = frozenset({"on_phase_start", "on_subphase_end", "on_game_over"})
+
+            def __init__(self):
+                self.seen: list[tuple] = []
+
+            def on_phase_start(self, phase, day, state):
+                self.seen.append((phase.name, day, len(state.living_players)))
+
+            def on_subphase_end(self, subphase, day, phase, state, collector):
+                self.seen.append((subphase.name, day, len(state.living_players)))
+
+            def on_game_over(self, winner, state, collector):
+                self.seen.append(("GAME_OVER", winner, len(state.living_players)))
+                return []
+
+        class AsyncRecorder(SyncRecorder):
+            async def on_phase_start(self, phase, day, state):
+                await asyncio.sleep(0)
+                SyncRecorder.on_phase_start(self, phase, day, state)
+
+            async def on_subphase_end(self, subphase, day, phase, state, collector):
+                await asyncio.sleep(0)
+                SyncRecorder.on_subphase_end(self, subphase, day, phase, state, collector)
+
+            async def on_game_over(self, winner, state, collector):
+                return SyncRecorder.on_game_over(self, winner, state, collector)
+
+        # Fixed roles and seeds (fresh players per game): deaths on night 1
+        sync_players = create_players_shuffled(seed=0)
+        sync_recorder = SyncRecorder()
+        await WerewolfGame(
+            players=sync_players,
+            participants=create_participants(sync_players, seed=42),
+            seed=42,
+            validator=sync_recorder,
+        ).run()
+
+        async_players = create_players_shuffled(seed=0)
+        async_recorder = AsyncRecorder()
+        game = WerewolfGame(
+            players=async_players,
+            participants=create_participants(async_players, seed=42),
+            seed=42,
+            validator=async_recorder,
+        )
+        assert game._validator_is_async
+        await game.run()
+
+        assert ("DAY", 1, len(async_players)) not in sync_recorder.seen
+        assert async_recorder.seen == sync_recorder.seen
+        assert async_recorder.seen[-1][0] == "GAME_OVER"
+
+    @pytest.mark.asyncio
+    async def test_async_validator_error_stops_game_at_hook(
+        self, standard_players: dict[int, Player]
+    ):
+        """Test that an error raised by an async hook surfaces where it fires."""
+        phases: list[Phase] = []
+
+        class FailingAsyncValidator:
+            hooks_used = frozenset({"on_phase_start"})
+
+            async def on_phase_start(self, phase, day, state):
+                phases.append(phase)
+                if phase == Phase.DAY:
+                    raise RuntimeError("day rejected")
+
+        game = WerewolfGame(
+            players=standard_players,
+            participants=create_participants(standard_players, seed=42),
+            validator=FailingAsyncValidator(),
+        )
+
+        with pytest.raises(RuntimeError, match="day rejected"):
+            await game.run()
+        assert phases == [Phase.NIGHT, Phase.DAY]
+
+    def test_event_dispatch_keys_are_leaf_classes(self):
+        """Test that dispatch on type(event) cannot miss a subclass."""
+        from werewolf.engine import CollectingValidator
+
+        dispatch = CollectingValidator()._event_dispatch
+
+        assert len(dispatch) == 8
+        for event_cls in dispatch:
+            assert event_cls.__subclasses__() == [], event_cls.__name__
+
 
 # ============================================================================
 # Human Player Integration Tests